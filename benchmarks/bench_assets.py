@@ -0,0 +1,89 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+GAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files")
+sys.path.insert(0, GAME_DIR)
+
+from assets import AssetCache
+
+# What the asset cache saves at startup. Fonts: the first font in a fresh
+# interpreter with SysFont (which scans the system fonts) against
+# AssetCache.font with the font index already on disk. Images: prob.py's
+# dice loaded and scaled from the file every time against a cache hit, and
+# blitting them as loaded against converted to the display's format.
+RUNS = 5
+FONTS = [("arial", 36, False), ("arial", 48, True), ("Verdana", 20, True)]
+DICE = [f"dice{i}.png" for i in range(1, 7)]
+BLITS = 2000
+
+FONT_SCRIPT = """
+import sys, time
+sys.path.insert(0, {game_dir!r})
+import pygame
+from assets import AssetCache
+pygame.font.init()
+cache = AssetCache()
+t0 = time.perf_counter()
+for name, size, bold in {fonts!r}:
+    if {use_cache}:
+        cache.font(name, size, bold)
+    else:
+        pygame.font.SysFont(name, size, bold=bold)
+print(time.perf_counter() - t0)
+"""
+
+
+def first_fonts(use_cache, cache_dir):
+    script = FONT_SCRIPT.format(game_dir=GAME_DIR, fonts=FONTS, use_cache=use_cache)
+    env = dict(os.environ, XDG_CACHE_HOME=cache_dir, PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONWARNINGS="ignore")
+    times = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+        times.append(float(output.stdout.split()[-1]))
+    return statistics.median(times) * 1000
+
+
+def timed(function, repeat=RUNS):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first_fonts(True, cache_dir)  # writes the index
+        print(f"first {len(FONTS)} fonts in a new interpreter, median of {RUNS} (ms)")
+        print(f"  SysFont               {first_fonts(False, cache_dir):8.2f}")
+        print(f"  AssetCache.font       {first_fonts(True, cache_dir):8.2f}")
+
+    pygame.init()
+    screen = pygame.display.set_mode((600, 400))
+    cache = AssetCache()
+
+    def load_dice():
+        return [pygame.transform.scale(pygame.image.load(os.path.join(GAME_DIR, "..", "images", name)), (64, 64))
+                for name in DICE]
+
+    raw = load_dice()
+    converted = [cache.image(name, (64, 64)) for name in DICE]
+    print(f"{len(DICE)} dice images (ms)")
+    print(f"  load and scale        {timed(load_dice):8.2f}")
+    print(f"  cache hit             {timed(lambda: [cache.image(name, (64, 64)) for name in DICE]):8.3f}")
+    print(f"{BLITS} blits of a 64x64 die (ms)")
+    print(f"  as loaded             {timed(lambda: [screen.blit(raw[i % 6], (i % 500, 100)) for i in range(BLITS)]):8.2f}")
+    print(f"  converted             {timed(lambda: [screen.blit(converted[i % 6], (i % 500, 100)) for i in range(BLITS)]):8.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+import backgrounds
+
+# Time spent per frame on the gradient background: one pygame.draw.line per
+# row (what calculus.py and prob.py did every frame) against one blit of the
+# cached surface from backgrounds.py. Also checks that the cache only keeps
+# surfaces for the latest size, so resizing doesn't pile them up.
+FRAMES = 200
+SCREENS = [
+    ("calculus.py", (900, 650), (135, 206, 235), (255, 255, 255)),
+    ("prob.py", (600, 400), (135, 206, 250), (255, 182, 193)),
+]
+
+
+def draw_rows(surface, top_color, bottom_color):
+    height = surface.get_height()
+    for y in range(height):
+        ratio = y / height
+        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
+        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
+        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
+        pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
+
+
+def per_frame(draw, screen, top, bottom):
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        draw(screen, top, bottom)
+    return (time.perf_counter() - t0) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    print(f"Background cost per frame, mean of {FRAMES} frames (ms)")
+    for name, size, top, bottom in SCREENS:
+        screen = pygame.display.set_mode(size)
+        backgrounds.clear()
+        t0 = time.perf_counter()
+        backgrounds.gradient_surface(size, top, bottom)
+        build = (time.perf_counter() - t0) * 1000
+        rows = per_frame(draw_rows, screen, top, bottom)
+        cached = per_frame(backgrounds.draw_gradient, screen, top, bottom)
+        print(f"  {name:12s} {size[0]}x{size[1]}: per-row lines {rows:6.3f}   cached blit {cached:6.3f}   "
+              f"({rows / cached:4.0f}x, one-off build {build:.2f} ms)")
+
+    (_, first, top, bottom), (_, second, _, _) = SCREENS
+    backgrounds.clear()
+    backgrounds.gradient_surface(first, top, bottom)
+    backgrounds.gradient_surface(second, top, bottom)
+    sizes = {key[0] for key in backgrounds._gradients}
+    assert sizes == {second}, f"cache still holds {sorted(sizes)} after switching to {second}"
+    print(f"Cache after drawing at {first[0]}x{first[1]} then {second[0]}x{second[1]}: "
+          f"{len(backgrounds._gradients)} surface for {second[0]}x{second[1]} only")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from batch_paths import PathQueryPool, find_paths
+from pathfinding import Grid
+
+# Measures how find_paths scales with the number of worker processes.
+SIZE = 300
+DENSITY = 0.2
+QUERIES = 400
+SEED = 5
+
+
+def main():
+    rng = random.Random(SEED)
+    grid = Grid(SIZE)
+    grid.barrier = bytearray(1 if rng.random() < DENSITY else 0 for _ in range(SIZE * SIZE))
+    free = [grid.get_pos(i) for i in range(SIZE * SIZE) if not grid.barrier[i]]
+    pairs = [(rng.choice(free), rng.choice(free)) for _ in range(QUERIES)]
+
+    t0 = time.perf_counter()
+    expected = find_paths(grid, pairs, processes=1)
+    serial = time.perf_counter() - t0
+    print(f"{QUERIES} queries on a {SIZE}x{SIZE} grid ({DENSITY:.0%} barriers)")
+    print(f"  serial:        {serial * 1000:8.1f} ms")
+
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for processes in counts:
+        with PathQueryPool(grid, processes) as pool:
+            t0 = time.perf_counter()
+            paths = pool.find_paths(pairs)
+            elapsed = time.perf_counter() - t0
+        assert [p and len(p) for p in paths] == [p and len(p) for p in expected]
+        print(f"  {processes:2d} processes:  {elapsed * 1000:8.1f} ms   speedup {serial / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
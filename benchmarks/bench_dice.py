@@ -0,0 +1,51 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from dice import TOTALS, roll_counts, simulate
+
+# Rolls per second for 7 Up 7 Down's odds: one random.randint pair per roll
+# as prob.py does, NumPy batches in one process, and the chunked process pool.
+PYTHON_ROLLS = 1_000_000
+NUMPY_ROLLS = 200_000_000
+SEED = 7
+
+
+def python_counts(rolls, rng):
+    counts = [0] * len(TOTALS)
+    for _ in range(rolls):
+        counts[rng.randint(1, 6) + rng.randint(1, 6) - 2] += 1
+    return counts
+
+
+def main():
+    print("two-dice rolls per second")
+    t0 = time.perf_counter()
+    python_counts(PYTHON_ROLLS, random.Random(SEED))
+    elapsed = time.perf_counter() - t0
+    print(f"  random.randint loop:  {PYTHON_ROLLS / elapsed / 1e6:8.1f} M/s")
+
+    t0 = time.perf_counter()
+    roll_counts(NUMPY_ROLLS, np.random.default_rng(SEED))
+    elapsed = time.perf_counter() - t0
+    print(f"  NumPy batches:        {NUMPY_ROLLS / elapsed / 1e6:8.1f} M/s")
+
+    expected = None
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        t0 = time.perf_counter()
+        counts = simulate(NUMPY_ROLLS, SEED, processes)
+        elapsed = time.perf_counter() - t0
+        # Chunk seeds don't depend on the process count
+        if expected is None:
+            expected = counts
+        assert (counts == expected).all()
+        print(f"  {processes:2d} processes:         {NUMPY_ROLLS / elapsed / 1e6:8.1f} M/s")
+
+
+if __name__ == "__main__":
+    main()
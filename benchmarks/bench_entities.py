@@ -0,0 +1,144 @@
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from entities import EntityPool, closest
+from spatial import SpatialHash
+
+# Cost of one frame of vector.py's bullet update (move, cull, collide,
+# closest distance), without drawing, as the number of entities grows:
+#   lists     the original loop over [Vector2, Vector2] bullets and every target
+#   hash      the same loop with targets in a SpatialHash (spatial.py, next to this file)
+#   numpy     EntityPool arrays and one closest() pass per frame
+WIDTH, HEIGHT = 800, 600
+BULLET_SPEED = 10
+HIT_DISTANCE = 5 + 20  # bullet_radius + target_radius
+TARGET_CELL = 40  # 2 * target_radius, as in vector.py
+REPEATS = 5
+COUNTS = [(20, 30), (200, 200), (500, 1000), (1000, 2000), (2000, 5000)]  # (bullets, targets)
+MAX_LIST_PAIRS = 2_000_000  # the list version takes seconds past this
+
+
+def make_scene(bullet_count, target_count, seed=0):
+    rng = random.Random(seed)
+    bullets = []
+    for _ in range(bullet_count):
+        angle = rng.uniform(0, 2 * math.pi)
+        bullets.append(((rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)),
+                        (math.cos(angle) * BULLET_SPEED, math.sin(angle) * BULLET_SPEED)))
+    targets = [(rng.randint(20, WIDTH - 20), rng.randint(20, HEIGHT - 20)) for _ in range(target_count)]
+    return bullets, targets
+
+
+def list_frame(bullets, targets):
+    latest_distance = None
+    for bullet in bullets[:]:
+        bullet[0] += bullet[1]
+        if bullet[0].x < 0 or bullet[0].x > WIDTH or bullet[0].y < 0 or bullet[0].y > HEIGHT:
+            bullets.remove(bullet)
+            continue
+        for target in targets[:]:
+            distance = bullet[0].distance_to(target)
+            if distance < HIT_DISTANCE:
+                targets.remove(target)
+                bullets.remove(bullet)
+                break
+            elif distance < 300:
+                if latest_distance is None or distance < latest_distance:
+                    latest_distance = distance
+    return latest_distance
+
+
+def hash_frame(bullets, targets, target_hash):
+    latest_distance = None
+    alive = []
+    hit_targets = set()
+    for bullet in bullets:
+        bullet[0] += bullet[1]
+        if bullet[0].x < 0 or bullet[0].x > WIDTH or bullet[0].y < 0 or bullet[0].y > HEIGHT:
+            continue
+        hit = next(target_hash.query(bullet[0], HIT_DISTANCE), None)
+        if hit is not None:
+            target_hash.remove(hit[0], hit[0])
+            hit_targets.add(id(hit[0]))
+            continue
+        _, distance = target_hash.nearest(bullet[0], latest_distance or 300)
+        if distance is not None and (latest_distance is None or distance < latest_distance):
+            latest_distance = distance
+        alive.append(bullet)
+    targets[:] = [target for target in targets if id(target) not in hit_targets]
+    bullets[:] = alive
+    return latest_distance
+
+
+def numpy_frame(bullets, targets):
+    bullets.integrate()
+    bullets.cull(0, 0, WIDTH, HEIGHT)
+    live_bullets = bullets.active()
+    live_targets = targets.active()
+    bullet_pos = bullets.pos[live_bullets]
+    target_pos = targets.pos[live_targets]
+    nearest, distances = closest(bullet_pos, target_pos, TARGET_CELL)
+    hits = distances < HIT_DISTANCE
+    hit_targets, first_hits = np.unique(nearest[hits], return_index=True)
+    bullets.kill(live_bullets[hits][first_hits])
+    targets.kill(live_targets[hit_targets])
+    misses = distances[~hits]
+    if len(misses) and misses.min() > TARGET_CELL:
+        _, misses = closest(bullet_pos[~hits], target_pos)
+    return float(misses.min()) if len(misses) and misses.min() < 300 else None
+
+
+def time_frame(setup, frame):
+    best = float("inf")
+    for _ in range(REPEATS):
+        state = setup()
+        t0 = time.perf_counter()
+        frame(*state)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    print(f"One frame of bullet updates, best of {REPEATS} (ms)")
+    print(f"  {'bullets':>7} {'targets':>7} {'lists':>9} {'hash':>9} {'numpy':>9}")
+    for bullet_count, target_count in COUNTS:
+        bullets, targets = make_scene(bullet_count, target_count)
+
+        def list_setup():
+            return ([[pygame.Vector2(p), pygame.Vector2(v)] for p, v in bullets],
+                    [pygame.Vector2(t) for t in targets])
+
+        def hash_setup():
+            bullet_list, target_list = list_setup()
+            target_hash = SpatialHash(TARGET_CELL)
+            for target in target_list:
+                target_hash.insert(target, target)
+            return bullet_list, target_list, target_hash
+
+        def numpy_setup():
+            bullet_pool, target_pool = EntityPool(), EntityPool()
+            for p, v in bullets:
+                bullet_pool.spawn(p, v)
+            for t in targets:
+                target_pool.spawn(t)
+            return bullet_pool, target_pool
+
+        if bullet_count * target_count <= MAX_LIST_PAIRS:
+            lists = f"{time_frame(list_setup, list_frame):9.2f}"
+        else:
+            lists = f"{'-':>9}"
+        hashed = time_frame(hash_setup, hash_frame)
+        vectorized = time_frame(numpy_setup, numpy_frame)
+        print(f"  {bullet_count:7d} {target_count:7d} {lists} {hashed:9.2f} {vectorized:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
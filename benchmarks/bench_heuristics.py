@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from landmarks import distance_field_heuristic, landmark_heuristic, load_landmarks
+from pathfinding import AStarSearch, Grid
+
+# Expansion counts of Manhattan vs landmark (ALT) vs goal distance-field
+# heuristics on a maze, where Manhattan distance is a poor estimate.
+SIZE = 201  # odd so the maze has walls on every border
+EXTRA_OPENINGS = 0.05  # fraction of walls knocked out to create loops
+QUERIES = 50
+SEED = 6
+
+
+def make_maze(size, rng):
+    grid = Grid(size)
+    grid.barrier = bytearray([1]) * (size * size)
+    stack = [(1, 1)]
+    grid.set_barrier(1, 1, False)
+    while stack:
+        row, col = stack[-1]
+        options = [(row + dr, col + dc, row + dr // 2, col + dc // 2)
+                   for dr, dc in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < row + dr < size and 0 < col + dc < size and grid.is_barrier(row + dr, col + dc)]
+        if not options:
+            stack.pop()
+            continue
+        n_row, n_col, w_row, w_col = rng.choice(options)
+        grid.set_barrier(w_row, w_col, False)
+        grid.set_barrier(n_row, n_col, False)
+        stack.append((n_row, n_col))
+    for _ in range(int(size * size * EXTRA_OPENINGS)):
+        grid.set_barrier(rng.randrange(1, size - 1), rng.randrange(1, size - 1), False)
+    return grid
+
+
+def run(grid, pairs, make_heuristic):
+    expanded = 0
+    t0 = time.perf_counter()
+    for start, goal in pairs:
+        search = AStarSearch(grid, start, goal, make_heuristic(goal))
+        search.run()
+        expanded += search.expanded
+    return expanded / len(pairs), (time.perf_counter() - t0) / len(pairs)
+
+
+def main():
+    rng = random.Random(SEED)
+    grid = make_maze(SIZE, rng)
+    free = [grid.get_pos(i) for i in range(SIZE * SIZE) if not grid.barrier[i]]
+    pairs = [(rng.choice(free), rng.choice(free)) for _ in range(QUERIES)]
+
+    t0 = time.perf_counter()
+    load_landmarks(grid)
+    preprocessing = time.perf_counter() - t0
+
+    print(f"{QUERIES} queries on a {SIZE}x{SIZE} maze")
+    print(f"  landmark preprocessing: {preprocessing * 1000:.1f} ms (cached per layout)")
+    for name, make_heuristic in (
+        ("manhattan", lambda goal: None),
+        ("landmarks (ALT)", lambda goal: landmark_heuristic(grid, goal)),
+        ("distance field", lambda goal: distance_field_heuristic(grid, goal)),
+    ):
+        expanded, elapsed = run(grid, pairs, make_heuristic)
+        print(f"  {name:16s} {expanded:10.0f} expansions/query  {elapsed * 1000:8.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
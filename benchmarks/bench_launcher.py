@@ -0,0 +1,78 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+GAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files")
+sys.path.insert(0, GAME_DIR)
+
+from launcher import GAMES, GameLauncher
+
+# Launch latency and time to first frame for every game, started cold in a
+# new interpreter and forked from the pre-warmed template. One game runs at a
+# time so they don't compete for the CPU. Then every game is forked once more
+# with --startup, in a child interpreter whose output is read back, to check
+# that each one prints its startup report.
+RUNS = 5
+STARTUP_REPORT = ": first frame after "
+
+
+def measure(launcher, script):
+    launches, first_frames = [], []
+    for _ in range(RUNS):
+        game = launcher.launch(os.path.join(GAME_DIR, script))
+        first_frames.append(launcher.wait_for_first_frame(game))
+        launches.append(game.launch_latency)
+        launcher.stop(game)
+        while game.running:
+            launcher.poll()
+            time.sleep(0.01)
+    return statistics.median(launches) * 1000, statistics.median(first_frames) * 1000
+
+
+def launch_with_startup():
+    # Run in the child interpreter: the games' reports go to its stdout
+    launcher = GameLauncher()
+    for script in GAMES:
+        game = launcher.launch(os.path.join(GAME_DIR, script), ["--startup"])
+        launcher.wait_for_first_frame(game)
+        launcher.stop(game)
+        while game.running:
+            launcher.poll()
+            time.sleep(0.01)
+    launcher.close()
+
+
+def check_startup():
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--launch-with-startup"],
+                            capture_output=True, text=True).stdout
+    reports = [line for line in output.splitlines() if STARTUP_REPORT in line]
+    print(f"forked games that printed a startup report: {len(reports)} of {len(GAMES)}")
+    for line in reports:
+        print(f"  {line}")
+    return len(reports) == len(GAMES)
+
+
+def main():
+    launchers = {"cold": GameLauncher(prewarm=False), "template": GameLauncher()}
+    print(f"median of {RUNS} launches (ms)")
+    print(f"  {'game':16} {'cold launch':>12} {'first frame':>12} {'fork launch':>12} {'first frame':>12}")
+    for script in GAMES:
+        row = []
+        for launcher in launchers.values():
+            row.extend(measure(launcher, script))
+        print(f"  {script:16} " + " ".join(f"{value:12.1f}" for value in row))
+    for launcher in launchers.values():
+        launcher.close()
+    if not check_startup():
+        sys.exit("--startup was ignored by a forked game")
+
+
+if __name__ == "__main__":
+    if "--launch-with-startup" in sys.argv:
+        launch_with_startup()
+    else:
+        main()
@@ -0,0 +1,76 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from particles import ParticleSystem
+
+# One frame of calculus.py's trail (update + draw) with many live particles:
+# the original list of dicts with a new SRCALPHA surface per particle per
+# frame, against ParticleSystem's arrays, cached sprites and one blits call.
+WIDTH, HEIGHT = 900, 650
+ORANGE = (255, 165, 0)
+DT = 0.02
+FRAMES = 20
+COUNTS = [100, 1000, 10000, 50000]
+MAX_DICT_PARTICLES = 10000  # the original takes far too long past this
+
+
+def dict_frame(screen, particles):
+    for particle in particles:
+        particle["life"] -= DT
+    while particles and particles[0]["life"] <= 0:
+        particles.pop(0)
+    for particle in particles:
+        pos = particle["pos"]
+        alpha = max(0, min(255, int(particle["life"] * 255)))
+        s = pygame.Surface((8, 8), pygame.SRCALPHA)
+        s.fill((ORANGE[0], ORANGE[1], ORANGE[2], alpha))
+        screen.blit(s, (int(pos[0] - 4), int(pos[1] - 4)))
+
+
+def time_frames(frame, *args):
+    t0 = time.perf_counter()
+    for _ in range(FRAMES):
+        frame(*args)
+    return (time.perf_counter() - t0) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    rng = np.random.default_rng(0)
+    print(f"Trail update + draw per frame, mean of {FRAMES} frames (ms)")
+    print(f"  {'particles':>9} {'dicts':>9} {'pooled':>9}")
+    for count in COUNTS:
+        positions = rng.uniform((0, 0), (WIDTH, HEIGHT), (count, 2))
+        # Lives spread over (0.5, 1] so nobody expires during the run
+        lives = np.linspace(0.5 + FRAMES * DT, 1, count)
+
+        if count <= MAX_DICT_PARTICLES:
+            particles = [{"pos": tuple(p), "life": life} for p, life in zip(positions.tolist(), lives.tolist())]
+            dicts = f"{time_frames(dict_frame, screen, particles):9.2f}"
+        else:
+            dicts = f"{'-':>9}"
+
+        trail = ParticleSystem(count, 8, ORANGE)
+        for p, life in zip(positions, lives):
+            trail.emit(p, life)
+
+        def pooled_frame():
+            trail.update(DT)
+            trail.draw(screen)
+
+        pooled = time_frames(pooled_frame)
+        print(f"  {count:9d} {dicts} {pooled:9.2f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
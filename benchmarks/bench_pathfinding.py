@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from pathfinding import AStarSearch, Grid, JumpPointSearch, a_star, path_cost
+
+# Times the headless A* engine on large maps with random barriers, then
+# compares movement modes on a mostly open map with a few long walls.
+SIZE = 2000
+DENSITIES = [0.0, 0.1, 0.25]
+WALLS = 20
+SEED = 1
+
+
+def random_grid(size, density, rng):
+    grid = Grid(size)
+    if density:
+        grid.barrier = bytearray(1 if rng.random() < density else 0 for _ in range(size * size))
+    return grid
+
+
+def main():
+    rng = random.Random(SEED)
+    start = (0, 0)
+    goal = (SIZE - 1, SIZE - 1)
+    print(f"A* on a {SIZE}x{SIZE} grid")
+    for density in DENSITIES:
+        grid = random_grid(SIZE, density, rng)
+        grid.set_barrier(*start, False)
+        grid.set_barrier(*goal, False)
+        t0 = time.perf_counter()
+        path = a_star(grid, start, goal)
+        elapsed = time.perf_counter() - t0
+        length = len(path) - 1 if path else "-"
+        print(f"  barriers {density:4.0%}: {elapsed * 1000:8.1f} ms   path length {length}")
+
+    grid = Grid(SIZE)
+    for _ in range(WALLS):
+        row, col = rng.randrange(SIZE), rng.randrange(SIZE)
+        length = rng.randrange(SIZE // 10, SIZE // 3)
+        d_row, d_col = rng.choice([(1, 0), (0, 1)])
+        for i in range(length):
+            if grid.in_bounds(row + i * d_row, col + i * d_col):
+                grid.set_barrier(row + i * d_row, col + i * d_col)
+    grid.set_barrier(*start, False)
+    grid.set_barrier(*goal, False)
+    print(f"Movement modes on a {SIZE}x{SIZE} grid with {WALLS} walls")
+    for name, search in (
+        ("4-connected A*", AStarSearch(grid, start, goal)),
+        ("8-connected A*", AStarSearch(grid, start, goal, diagonal=True)),
+        ("Jump Point Search", JumpPointSearch(grid, start, goal)),
+    ):
+        t0 = time.perf_counter()
+        path = search.run()
+        elapsed = time.perf_counter() - t0
+        cost = f"{path_cost(path):.1f}" if path else "-"
+        print(f"  {name:18s} {elapsed * 1000:8.1f} ms  {search.expanded:8d} expansions   path cost {cost}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from profiler import FrameProfiler
+
+# What the frame profiler costs per frame: a loop of empty frames with the
+# scopes SceneManager and vector_sim.py use (events, update, collision,
+# render, flip), without any profiler, with it switched off, timing and
+# timing with a trace.
+FRAMES = 200_000
+SCOPES = ["events", "update", "collision", "render", "flip"]
+
+
+def bare_frames(frames):
+    for _ in range(frames):
+        for name in SCOPES:
+            pass
+
+
+def profiled_frames(profiler, frames):
+    for _ in range(frames):
+        profiler.begin_frame()
+        for name in SCOPES:
+            with profiler.scope(name):
+                pass
+        profiler.end_frame()
+
+
+def main():
+    bare_start = time.perf_counter()
+    bare_frames(FRAMES)
+    bare = (time.perf_counter() - bare_start) / FRAMES
+
+    print(f"overhead per frame of {len(SCOPES)} scopes, over {FRAMES} frames")
+    print(f"  {'profiler':12} {'us/frame':>10}")
+    for label, start, trace in [("off", False, False), ("timing", True, False), ("tracing", True, True)]:
+        profiler = FrameProfiler()
+        if start:
+            profiler.start(trace=trace)
+        t0 = time.perf_counter()
+        profiled_frames(profiler, FRAMES)
+        per_frame = (time.perf_counter() - t0) / FRAMES
+        print(f"  {label:12} {(per_frame - bare) * 1e6:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
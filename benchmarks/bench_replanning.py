@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from dstar_lite import DStarLite
+from pathfinding import AStarSearch, Grid
+
+# Compares D* Lite repairs against full A* reruns over a sequence of random
+# barrier edits. Half of the edits land on the current path so that most of
+# them actually force a repair.
+SIZE = 200
+DENSITY = 0.2
+EDITS = 200
+SEED = 4
+
+
+def main():
+    rng = random.Random(SEED)
+    grid = Grid(SIZE)
+    grid.barrier = bytearray(1 if rng.random() < DENSITY else 0 for _ in range(SIZE * SIZE))
+    start = (0, 0)
+    goal = (SIZE - 1, SIZE - 1)
+    # Keep a small clearing around start and goal so the map starts solvable
+    for row, col in (start, goal):
+        for n_row in range(max(row - 2, 0), min(row + 3, SIZE)):
+            for n_col in range(max(col - 2, 0), min(col + 3, SIZE)):
+                grid.set_barrier(n_row, n_col, False)
+
+    planner = DStarLite(grid, start, goal)
+    path = planner.compute_path()
+    initial_expanded = planner.expanded
+
+    repair_time = rerun_time = 0.0
+    repair_expanded = rerun_expanded = 0
+    for _ in range(EDITS):
+        if path and rng.random() < 0.5:
+            row, col = rng.choice(path[3:-3])
+        else:
+            row, col = rng.randrange(3, SIZE - 3), rng.randrange(3, SIZE - 3)
+        grid.set_barrier(row, col, not grid.is_barrier(row, col))
+
+        before = planner.expanded
+        t0 = time.perf_counter()
+        planner.update_cell(row, col)
+        path = planner.compute_path()
+        repair_time += time.perf_counter() - t0
+        repair_expanded += planner.expanded - before
+
+        t0 = time.perf_counter()
+        search = AStarSearch(grid, start, goal)
+        rerun = search.run()
+        rerun_time += time.perf_counter() - t0
+        rerun_expanded += search.expanded
+
+        assert (path is None) == (rerun is None)
+        assert path is None or len(path) == len(rerun)
+
+    print(f"{EDITS} edits on a {SIZE}x{SIZE} grid ({DENSITY:.0%} barriers)")
+    print(f"  D* Lite initial plan: {initial_expanded} expansions")
+    print(f"  D* Lite repairs:  {repair_time * 1000:8.1f} ms  {repair_expanded:9d} expansions")
+    print(f"  A* reruns:        {rerun_time * 1000:8.1f} ms  {rerun_expanded:9d} expansions")
+
+
+if __name__ == "__main__":
+    main()
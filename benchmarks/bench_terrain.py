@@ -0,0 +1,65 @@
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from terrain import midpoint_displacement
+
+# Chunk generation time of the original recursive midpoint displacement
+# (copied below, since fractals.py runs the game on import) next to the
+# level-by-level NumPy generator.
+GROUND_HEIGHT = 300
+CHUNK_WIDTH = 800
+REPEATS = 5
+SETTINGS = [(0.5, 200), (0.55, 200), (0.6, 200)]  # (roughness, max_displacement)
+
+
+def recursive_segment(start_x, end_x, start_y, end_y, roughness, max_displacement):
+    terrain = [(start_x, start_y), (end_x, end_y)]
+
+    def midpoint_displacement(left, right, displacement):
+        mid_x = (left[0] + right[0]) / 2
+        mid_y = (left[1] + right[1]) / 2
+        mid_y += random.uniform(-displacement, displacement)
+        mid_y = max(GROUND_HEIGHT - max_displacement,
+                    min(GROUND_HEIGHT + max_displacement, mid_y))
+        terrain.append((mid_x, mid_y))
+        terrain.sort(key=lambda p: p[0])
+        new_displacement = displacement * roughness
+        if new_displacement > 1:
+            midpoint_displacement(left, (mid_x, mid_y), new_displacement)
+            midpoint_displacement((mid_x, mid_y), right, new_displacement)
+
+    midpoint_displacement(terrain[0], terrain[-1], max_displacement)
+    return terrain
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"Chunk generation, best of {REPEATS}")
+    for roughness, max_displacement in SETTINGS:
+        recursive, points = best_of(lambda: recursive_segment(
+            0, CHUNK_WIDTH, GROUND_HEIGHT, GROUND_HEIGHT, roughness, max_displacement))
+        vectorized, heights = best_of(lambda: midpoint_displacement(
+            GROUND_HEIGHT, GROUND_HEIGHT, GROUND_HEIGHT, roughness, max_displacement, rng))
+        assert len(points) == len(heights)
+        print(f"  roughness {roughness:.2f}, {len(heights):5d} points: "
+              f"recursive {recursive * 1000:9.2f} ms   numpy {vectorized * 1000:7.3f} ms   "
+              f"{recursive / vectorized:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from trajectory import solve_launches, sweep_launches
+
+# Deciding hit/miss for random launches in calculus.py: the original loop
+# that steps time by dt and checks for a collision every step, next to
+# trajectory.solve_launches scoring all of them in one batch.
+# Also counts how often stepping with dt = 0.02 gets the outcome wrong, and
+# times the angle x power sweep behind calculus.py's aim heatmap, exact and
+# with the max_gap cut-off the heatmap uses, against the 16 ms frame budget.
+WIDTH, HEIGHT = 900, 650
+G = 300
+DT = 0.02
+START = (80, HEIGHT - 80)
+TARGET = (650, 300)
+RADIUS = 10 + 25  # proj_radius + target_radius
+LAUNCHES = 5000
+SWEEP_GRIDS = [(300, 250), (600, 500), (1000, 1000)]  # (angles, powers)
+HEATMAP_GRID = (600, 500)  # calculus.py's
+MAX_GAP = 300  # calculus.HEATMAP_FAR
+TARGETS = 20  # random target positions for the heatmap grid
+REPEATS = 5
+FRAME_MS = 1000 / 60
+
+
+def stepped_hit(vx, vy, dt=DT):
+    t = 0
+    while True:
+        t += dt
+        x = START[0] + vx * t
+        y = START[1] + vy * t + 0.5 * G * t**2
+        hit = math.hypot(x - TARGET[0], y - TARGET[1]) <= RADIUS
+        if hit or y >= START[1] or x > WIDTH or x < 0:
+            return hit
+
+
+def main():
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(0, math.pi / 2, LAUNCHES)
+    powers = rng.uniform(200, 1000, LAUNCHES)
+    vx, vy = powers * np.cos(angles), -powers * np.sin(angles)
+    pairs = list(zip(vx.tolist(), vy.tolist()))
+
+    t0 = time.perf_counter()
+    stepped = [stepped_hit(x, y) for x, y in pairs]
+    stepped_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = solve_launches(vx, vy, START, TARGET, RADIUS, G, WIDTH)
+    batch_time = time.perf_counter() - t0
+
+    wrong = sum(s != b for s, b in zip(stepped, batch.hit.tolist()))
+    print(f"{LAUNCHES} launches, {int(batch.hit.sum())} hits")
+    print(f"  stepped, dt = {DT}:     {stepped_time * 1000:8.1f} ms   ({wrong} outcomes differ from the exact ones)")
+    print(f"  solve_launches, batch:  {batch_time * 1000:8.1f} ms")
+
+    print(f"Heatmap sweeps, best of {REPEATS}           exact   max_gap={MAX_GAP}")
+    for angle_count, power_count in SWEEP_GRIDS:
+        angles = np.linspace(-90, 0, angle_count)
+        powers = np.linspace(10, 1500, power_count)
+        exact = time_sweep(angles, powers, TARGET)
+        cut = time_sweep(angles, powers, TARGET, MAX_GAP)
+        print(f"  {angle_count:4d} x {power_count:4d} = {angle_count * power_count:7d} launches: "
+              f"{exact * 1000:7.1f} ms {cut * 1000:7.1f} ms")
+
+    # Where calculus.py's create_target() can put the target
+    angles = np.linspace(-90, 0, HEATMAP_GRID[0])
+    powers = np.linspace(10, 1500, HEATMAP_GRID[1])
+    targets = zip(rng.integers(WIDTH // 2, WIDTH - 44, TARGETS).tolist(), rng.integers(45, HEIGHT - 199, TARGETS).tolist())
+    times = sorted(time_sweep(angles, powers, target, MAX_GAP) * 1000 for target in targets)
+    print(f"  {HEATMAP_GRID[0]} x {HEATMAP_GRID[1]}, max_gap={MAX_GAP}, {TARGETS} random targets: "
+          f"median {times[TARGETS // 2]:.1f} ms, worst {times[-1]:.1f} ms (frame budget {FRAME_MS:.1f} ms)")
+
+
+def time_sweep(angles, powers, target, max_gap=None):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        sweep_launches(angles, powers, START, target, RADIUS, G, WIDTH, max_gap=max_gap)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "game_files"))
+
+from vector_sim import HEIGHT, WIDTH, Inputs, replay
+
+# Headless replay speed of vector_sim.VectorSim on a scripted input stream:
+# the player walks back and forth and clicks every few steps. Each setup is run
+# twice and the final states compared, so this also catches lost
+# determinism.
+STEPS = 3600  # one minute of play at 60 steps per second
+SETUPS = [
+    ("normal", {"seed": 1}),
+    ("500 targets, 5 shots/step", {"seed": 1, "max_targets": 500, "fill_targets": True, "auto_fire": 5}),
+    ("2000 targets, 20 shots/step", {"seed": 1, "max_targets": 2000, "fill_targets": True, "auto_fire": 20}),
+]
+
+
+def scripted_inputs(steps, seed=0):
+    rng = random.Random(seed)
+    inputs = []
+    move = (0, 0)
+    for step in range(steps):
+        # Out for 30 steps and back again, so the player stays on screen
+        if step % 60 == 0:
+            move = (rng.randint(-1, 1), rng.randint(-1, 1))
+        elif step % 60 == 30:
+            move = (-move[0], -move[1])
+        shots = ((rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT)),) if step % 6 == 0 else ()
+        inputs.append(Inputs(move, shots))
+    return inputs
+
+
+def main():
+    inputs = scripted_inputs(STEPS)
+    print(f"Replaying {STEPS} steps")
+    for name, settings in SETUPS:
+        t0 = time.perf_counter()
+        sim, step_times = replay(settings, inputs)
+        elapsed = time.perf_counter() - t0
+        again, _ = replay(settings, inputs)
+        assert sim.digest() == again.digest(), f"{name}: replay is not deterministic"
+        step_times.sort()
+        print(f"  {name:28s} {STEPS / elapsed:8.0f} steps/s   "
+              f"p50 {step_times[len(step_times) // 2] * 1000:6.3f} ms   "
+              f"p99 {step_times[int(len(step_times) * 0.99)] * 1000:6.3f} ms   score {sim.score}")
+
+
+if __name__ == "__main__":
+    main()
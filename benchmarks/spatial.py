@@ -0,0 +1,87 @@
+import math
+from collections import defaultdict
+
+# Uniform-grid spatial hash, the per-entity broad phase vector.py used before
+# entities.py. It is kept as a baseline for bench_entities.py. Items are
+# bucketed by the cell their position falls in, so a radius query only looks
+# at the few cells the radius overlaps instead of every item.
+
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)  # (cx, cy) -> [(item, x, y), ...]
+        self.count = 0
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item, pos):
+        x, y = pos
+        self.cells[self._cell(x, y)].append((item, x, y))
+        self.count += 1
+
+    def remove(self, item, pos):
+        """Remove item (matched by identity) with a swap-remove inside its cell."""
+        key = self._cell(*pos)
+        bucket = self.cells[key]
+        for i, entry in enumerate(bucket):
+            if entry[0] is item:
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                self.count -= 1
+                break
+        if not bucket:
+            del self.cells[key]
+
+    def query(self, pos, radius):
+        """Yield (item, distance) for every item within radius of pos."""
+        x, y = pos
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for item, ix, iy in bucket:
+                        distance = math.hypot(ix - x, iy - y)
+                        if distance < radius:
+                            yield item, distance
+
+    def nearest(self, pos, max_distance):
+        """Return (item, distance) of the nearest item within max_distance, or (None, None).
+
+        Cells are searched in square rings around pos, stopping as soon as no
+        unvisited ring can hold anything closer than the best match so far.
+        """
+        x, y = pos
+        size = self.cell_size
+        cx, cy = self._cell(x, y)
+        cells = self.cells
+        best, best_distance = None, max_distance
+        rings = int(max_distance // size) + 1
+        for ring in range(rings + 1):
+            if best_distance <= (ring - 1) * size:
+                break
+            for dx in range(-ring, ring + 1):
+                step = 1 if abs(dx) == ring else 2 * ring
+                for dy in range(-ring, ring + 1, step or 1):
+                    bucket = cells.get((cx + dx, cy + dy))
+                    if not bucket:
+                        continue
+                    # Skip the whole cell if even its closest edge is too far
+                    left = (cx + dx) * size
+                    top = (cy + dy) * size
+                    gap_x = max(left - x, 0, x - left - size)
+                    gap_y = max(top - y, 0, y - top - size)
+                    if gap_x * gap_x + gap_y * gap_y >= best_distance * best_distance:
+                        continue
+                    for item, ix, iy in bucket:
+                        distance = math.hypot(ix - x, iy - y)
+                        if distance < best_distance:
+                            best, best_distance = item, distance
+        return (best, best_distance) if best is not None else (None, None)
+
+    def __len__(self):
+        return self.count
@@ -0,0 +1,57 @@
+import pygame
+from scenes import Scene, SceneManager
+from calculus import CalculusScene
+from fractals import FractalsScene
+from optimization import OptimizationScene
+from prob import ProbScene
+from vector import VectorScene
+
+# All five games in one window. F1-F5 switch straight to a game and Esc
+# goes back to the menu; the window, clock and loaded fonts are shared, and
+# a game's own assets are dropped when you leave it.
+
+GAMES = [
+    ("fractals", "Fractals", FractalsScene),
+    ("optimization", "Optimization and Pathfinding", OptimizationScene),
+    ("vector", "Vectors", VectorScene),
+    ("prob", "Probability", ProbScene),
+    ("calculus", "Calculus", CalculusScene),
+]
+SWITCH_KEYS = [pygame.K_F1, pygame.K_F2, pygame.K_F3, pygame.K_F4, pygame.K_F5]
+
+BACKGROUND = (30, 30, 40)
+TEXT_COLOR = (230, 230, 230)
+HINT_COLOR = (150, 150, 170)
+
+
+class MenuScene(Scene):
+    size = (600, 400)
+    caption = "From Numbers to Pixels"
+    wait_for_events = True
+
+    def enter(self, manager):
+        super().enter(manager)
+        title_font = manager.assets.font("arial", 36, bold=True)
+        font = manager.assets.font("arial", 24)
+        self.lines = [(title_font.render("From Numbers to Pixels", True, TEXT_COLOR), 40)]
+        for i, (_, title, _) in enumerate(GAMES):
+            self.lines.append((font.render(f"F{i + 1}  {title}", True, TEXT_COLOR), 120 + i * 40))
+        self.lines.append((font.render("Esc comes back here", True, HINT_COLOR), 340))
+
+    def draw(self, surface):
+        surface.fill(BACKGROUND)
+        for text, y in self.lines:
+            surface.blit(text, (60, y))
+
+
+def main():
+    scenes = {"menu": MenuScene}
+    switch_keys = {pygame.K_ESCAPE: "menu"}
+    for key, (name, _, scene) in zip(SWITCH_KEYS, GAMES):
+        scenes[name] = scene
+        switch_keys[key] = name
+    SceneManager(scenes, switch_keys).run("menu")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import json
+import os
+import time
+
+import pygame
+
+# Fonts and images shared by the scenes in scenes.py. An asset is loaded the
+# first time any scene asks for it and handed out again after that. Every
+# entry remembers which scenes used it, so when a scene exits its assets
+# can be dropped unless another scene still holds them.
+#
+# pygame.font.SysFont scans every font installed on the system before it can
+# find one (fc-list on Linux, the registry on Windows, system_profiler on
+# macOS), which is most of a game's startup on some machines. The font file a
+# name resolves to is kept in an index on disk instead, so the scan happens
+# once per machine rather than once per launch. Delete FONT_INDEX to make it
+# look again, e.g. after installing fonts.
+#
+# Images are loaded from the images/ folder next to game_files/, whatever
+# the working directory, and kept already scaled and converted to the
+# display's pixel format so blitting them doesn't convert them every time.
+
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "images")
+CACHE_DIR = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+FONT_INDEX = os.path.join(CACHE_DIR, "from-numbers-to-pixels", "fonts.json")
+
+_font_index = {"mtime": None, "fonts": {}}  # FONT_INDEX as last read, "name|bold" -> [path, fake bold]
+
+
+def _read_font_index():
+    # Read FONT_INDEX again if it changed since, e.g. another game added fonts to it
+    try:
+        mtime = os.path.getmtime(FONT_INDEX)
+    except OSError:
+        return _font_index["fonts"]
+    if mtime != _font_index["mtime"]:
+        try:
+            with open(FONT_INDEX) as f:
+                _font_index["fonts"] = json.load(f)
+        except (OSError, ValueError):
+            _font_index["fonts"] = {}
+        _font_index["mtime"] = mtime
+    return _font_index["fonts"]
+
+
+def _write_font_index(fonts):
+    try:
+        os.makedirs(os.path.dirname(FONT_INDEX), exist_ok=True)
+        temp = f"{FONT_INDEX}.{os.getpid()}"
+        with open(temp, "w") as f:
+            json.dump(fonts, f, indent=1, sort_keys=True)
+        os.replace(temp, FONT_INDEX)
+        _font_index["mtime"] = os.path.getmtime(FONT_INDEX)
+    except OSError:
+        pass  # a read-only home only costs the scan next time
+
+
+def font_path(name, bold=False):
+    """(font file or None for pygame's default font, whether to fake bold) for a system font.
+
+    Gives the same font SysFont(name, size, bold=bold) would, looked up in
+    FONT_INDEX and only resolved with a scan of the system fonts when it
+    isn't in there.
+    """
+    key = f"{name.lower()}|{int(bold)}"
+    fonts = _read_font_index()
+    entry = fonts.get(key)
+    if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+        return tuple(entry)
+    # SysFont's constructor hook hands over what it found instead of a font
+    path, fake_bold = pygame.font.SysFont(name, 0, bold, constructor=lambda path, size, bold, italic: (path, bold))
+    fonts = dict(_read_font_index(), **{key: [path, fake_bold]})
+    _font_index["fonts"] = fonts
+    _write_font_index(fonts)
+    return path, fake_bold
+
+
+def load_image(name, size=None):
+    """An image from IMAGE_DIR (or any path), scaled to size and converted for the display if there is one."""
+    image = pygame.image.load(os.path.join(IMAGE_DIR, name))
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+    return image
+
+
+class AssetCache:
+    def __init__(self):
+        self.entries = {}  # key -> font or surface
+        self.users = {}  # key -> names of the scenes using it
+        self.scope = None  # name of the scene that is loading, set by SceneManager
+        self.load_times = {}  # key -> seconds its load took
+        self.loads = 0  # assets loaded so far, counting ones loaded again after a release
+        self.load_time = 0.0  # seconds spent loading them
+
+    def get(self, key, load):
+        """The asset stored under key, made with load() the first time."""
+        if key not in self.entries:
+            t0 = time.perf_counter()
+            self.entries[key] = load()
+            elapsed = time.perf_counter() - t0
+            self.load_times[key] = elapsed
+            self.loads += 1
+            self.load_time += elapsed
+        self.users.setdefault(key, set()).add(self.scope)
+        return self.entries[key]
+
+    def font(self, name, size, bold=False):
+        """A system font by name, like pygame.font.SysFont, or the default font for None."""
+        def load():
+            path, fake_bold = font_path(name, bold) if name else (None, bold)
+            font = pygame.font.Font(path, size)
+            font.set_bold(fake_bold)
+            return font
+        return self.get(("font", name, size, bold), load)
+
+    def image(self, name, size=None):
+        """An image file from IMAGE_DIR, scaled to size if given; see load_image."""
+        return self.get(("image", name, size), lambda: load_image(name, size))
+
+    def release(self, scope):
+        """Forget scope's claim on its assets and drop the ones nobody else uses."""
+        for key in [key for key, users in self.users.items() if scope in users]:
+            users = self.users[key]
+            users.discard(scope)
+            if not users:
+                del self.users[key]
+                del self.entries[key]
+                self.load_times.pop(key, None)
+
+    def clear(self):
+        self.entries.clear()
+        self.users.clear()
+        self.load_times.clear()
+
+    def __len__(self):
+        return len(self.entries)
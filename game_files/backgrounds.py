@@ -0,0 +1,44 @@
+import numpy as np
+import pygame
+
+# Static gradient backgrounds shared by the games. Each one is built once as
+# a surface from a NumPy gradient and then drawn with a single blit, instead
+# of one pygame.draw.line per pixel row every frame.
+
+_gradients = {}  # (size, top_color, bottom_color) -> surface, all for one size
+
+
+def gradient_surface(size, top_color, bottom_color):
+    """Surface of the given size with a vertical gradient from top_color to bottom_color.
+
+    Built on the first call for this size and these colours and reused after
+    that. There is one window, so building one for a new size drops the ones
+    cached for the old size.
+    """
+    key = (tuple(size), tuple(top_color), tuple(bottom_color))
+    cached = _gradients.get(key)
+    if cached is not None:
+        return cached
+
+    width, height = size
+    top = np.array(top_color, dtype=float)
+    bottom = np.array(bottom_color, dtype=float)
+    rows = (top + (bottom - top) * (np.arange(height) / height)[:, None]).astype(np.uint8)
+    # surfarray is indexed [x, y], so every column is the same run of rows
+    surface = pygame.surfarray.make_surface(np.ascontiguousarray(np.broadcast_to(rows, (width, height, 3))))
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    for old in [old for old in _gradients if old[0] != key[0]]:
+        del _gradients[old]
+    _gradients[key] = surface
+    return surface
+
+
+def draw_gradient(surface, top_color, bottom_color):
+    """Fill the surface with a vertical gradient from top_color to bottom_color."""
+    surface.blit(gradient_surface(surface.get_size(), top_color, bottom_color), (0, 0))
+
+
+def clear():
+    """Forget every cached background; SceneManager calls this when the window is resized or set_mode runs."""
+    _gradients.clear()
@@ -0,0 +1,81 @@
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+from pathfinding import Grid, a_star
+
+# Many start/goal queries against one map, spread over a process pool.
+# The barrier bitmap is copied into shared memory once; workers attach to it
+# when they start, so tasks only carry the (start, goal) pairs.
+
+_worker_grid = None
+_worker_memory = None
+
+
+def _attach_grid(name, rows, cols):
+    global _worker_grid, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_grid = Grid(rows, cols)
+    _worker_grid.barrier = _worker_memory.buf[:rows * cols]
+
+
+def _solve_pairs(pairs):
+    return [a_star(_worker_grid, start, goal) for start, goal in pairs]
+
+
+class PathQueryPool:
+    """Process pool that answers path queries on a grid held in shared memory.
+
+    Use it as a context manager and call find_paths() as often as needed.
+    If the grid's barriers change, call refresh() to copy them over again.
+    """
+
+    def __init__(self, grid, processes=None):
+        self.grid = grid
+        self.processes = processes or os.cpu_count() or 1
+        size = grid.rows * grid.cols
+        self.memory = shared_memory.SharedMemory(create=True, size=size)
+        self.refresh()
+        self.pool = multiprocessing.Pool(
+            self.processes,
+            initializer=_attach_grid,
+            initargs=(self.memory.name, grid.rows, grid.cols),
+        )
+
+    def refresh(self):
+        size = self.grid.rows * self.grid.cols
+        self.memory.buf[:size] = self.grid.barrier
+
+    def find_paths(self, pairs, chunks_per_process=4):
+        """Return one path (or None) per (start, goal) pair, in order."""
+        pairs = list(pairs)
+        if not pairs:
+            return []
+        chunk_count = max(1, min(len(pairs), self.processes * chunks_per_process))
+        step = -(-len(pairs) // chunk_count)
+        chunks = [pairs[i:i + step] for i in range(0, len(pairs), step)]
+        paths = []
+        for chunk_paths in self.pool.map(_solve_pairs, chunks):
+            paths.extend(chunk_paths)
+        return paths
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def find_paths(grid, pairs, processes=None):
+    """Solve every (start, goal) pair on grid, in parallel when it helps."""
+    pairs = list(pairs)
+    if processes == 1 or len(pairs) < 2:
+        return [a_star(grid, start, goal) for start, goal in pairs]
+    with PathQueryPool(grid, processes) as pool:
+        return pool.find_paths(pairs)
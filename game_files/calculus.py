@@ -1,18 +1,18 @@
 import pygame
 import math
 import random
+import time
+import numpy as np
+from trajectory import solve_launch, sweep_launches
+from backgrounds import draw_gradient
+from particles import ParticleSystem
+from profiler import scope
+from scenes import Scene, run_scene
 
-# ---------------------
-# Initialization
-# ---------------------
-pygame.init()
 WIDTH, HEIGHT = 900, 650
-win = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Enhanced Projectile Motion Demo")
-clock = pygame.time.Clock()
 
 # ---------------------
-# Colors and Fonts
+# Colors
 # ---------------------
 # Define colors
 WHITE     = (255, 255, 255)
@@ -25,23 +25,6 @@ BLUE      = (50, 150, 255)
 ORANGE    = (255, 165, 0)
 YELLOW    = (255, 255, 0)
 
-# Fonts
-font = pygame.font.SysFont("Arial", 22)
-info_font = pygame.font.SysFont("Verdana", 20, bold=True)
-
-# ---------------------
-# Utility: Draw Vertical Gradient
-# ---------------------
-def draw_gradient(surface, top_color, bottom_color):
-    """Fill the surface with a vertical gradient from top_color to bottom_color."""
-    height = surface.get_height()
-    for y in range(height):
-        ratio = y / height
-        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (surface.get_width(), y))
-
 # ---------------------
 # Physics & Game Settings
 # ---------------------
@@ -53,38 +36,33 @@ start_pos = (80, HEIGHT - 80)  # Launch point at bottom left (with some margin)
 proj_radius = 10
 target_radius = 25
 
+# Trail (particle system) – 8x8 orange squares that fade out over 1 second
+TRAIL_CAPACITY = 1024
+
 # ---------------------
-# Game State Variables
+# Aim Heatmap settings
 # ---------------------
-game_state = "waiting"  # "waiting", "aiming", "launched", "finished"
-projectile_pos = list(start_pos)
-projectile_vel = (0, 0)
-time_elapsed = 0
-
-# Drag-and-shoot control
-dragging = False
-drag_start = None
-drag_end = None
-
-# Trail (particle system) – each particle is a dict with "pos" and "life"
-trail_particles = []
-
-# Score
-score = 0
+# While aiming, a panel shows which angle x power launches hit the target
+# (green) and how close the others get (brighter is closer). The whole grid
+# is swept at once by trajectory.sweep_launches when a target is placed, so
+# the sweep never lands in an aiming frame; 300k launches take well under a
+# 16 ms frame anyway (benchmarks/bench_trajectory.py). Misses past
+# HEATMAP_FAR all get the same colour, so the sweep may skip solving them.
+SWEEP_ANGLES = np.linspace(-90, 0, 600)    # degrees, straight up to flat right
+SWEEP_POWERS = np.linspace(10, 1500, 500)  # px/s, as from power = hypot * 2.5
+HEATMAP_RECT = pygame.Rect(10, 45, 240, 160)
+HEATMAP_FAR = 300  # misses by this many pixels or more get the darkest colour
+HEAT_FAR_COLOR = np.array([20, 30, 70])
+HEAT_NEAR_COLOR = np.array(ORANGE)
 
+# ---------------------
+# Helper Functions
+# ---------------------
 # Create a new target in a designated region
 def create_target():
     x = random.randint(WIDTH // 2, WIDTH - target_radius - 20)
     y = random.randint(target_radius + 20, HEIGHT - 200)
     return (x, y)
-target_pos = create_target()
-
-# ---------------------
-# Helper Functions
-# ---------------------
-def draw_text(text, pos, color=WHITE, font_obj=font):
-    label = font_obj.render(text, True, color)
-    win.blit(label, pos)
 
 def physics_position(t, angle_deg, speed):
     """Return position (x, y) at time t given initial angle and speed."""
@@ -100,169 +78,219 @@ def physics_velocity(t, angle_deg, speed):
     vy = -speed * math.sin(theta) + g * t
     return vx, vy
 
-def draw_trail():
-    """Draw all particles in the trail."""
-    for particle in trail_particles:
-        pos = particle["pos"]
-        life = particle["life"]
-        alpha = max(0, min(255, int(life * 255)))
-        s = pygame.Surface((8, 8), pygame.SRCALPHA)
-        s.fill((ORANGE[0], ORANGE[1], ORANGE[2], alpha))
-        win.blit(s, (int(pos[0] - 4), int(pos[1] - 4)))
-
-def update_trail(dt):
-    """Decrease life of particles and remove expired ones."""
-    for particle in trail_particles:
-        particle["life"] -= dt
-    while trail_particles and trail_particles[0]["life"] <= 0:
-        trail_particles.pop(0)
-
-def reset_game():
-    global game_state, projectile_pos, projectile_vel, time_elapsed, dragging, drag_start, drag_end, trail_particles, target_pos
-    game_state = "waiting"
-    projectile_pos = list(start_pos)
-    projectile_vel = (0, 0)
-    time_elapsed = 0
-    dragging = False
-    drag_start = None
-    drag_end = None
-    trail_particles = []
-    target_pos = create_target()
-
-def check_collision(p1, r1, p2, r2):
-    """Determine if two circles at p1 and p2 with radii r1 and r2 intersect."""
-    dist = math.hypot(p1[0]-p2[0], p1[1]-p2[1])
-    return dist <= (r1 + r2)
-
-def draw_target(pos, radius):
+def draw_target(win, pos, radius):
     """Draw a simple solid target with border."""
     pygame.draw.circle(win, GREEN, pos, radius)
     pygame.draw.circle(win, DARKGREY, pos, radius, 2)
 
-# ---------------------
-# Main Loop
-# ---------------------
-running = True
-while running:
-    clock.tick(60)
-    
-    # Event Processing
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        # Handle drag-and-shoot controls via mouse
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-            if game_state in ["waiting", "finished"]:
-                if game_state == "finished":
-                    reset_game()
-                if math.hypot(mouse_pos[0]-start_pos[0], mouse_pos[1]-start_pos[1]) <= 20:
-                    dragging = True
-                    drag_start = mouse_pos
-                    drag_end = mouse_pos
-                    game_state = "aiming"
-
-        if event.type == pygame.MOUSEMOTION:
-            if dragging:
-                drag_end = pygame.mouse.get_pos()
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            if dragging:
-                dragging = False
-                dx = start_pos[0] - drag_end[0]
-                dy = start_pos[1] - drag_end[1]
-                power = math.hypot(dx, dy) * 2.5
-                if power < 10:
-                    power = 10
-                angle = math.degrees(math.atan2(dy, dx))
-                projectile_vel = (power * math.cos(math.radians(angle)),
-                                  power * math.sin(math.radians(angle)))
-                game_state = "launched"
-                time_elapsed = 0
+class CalculusScene(Scene):
+    size = (WIDTH, HEIGHT)
+    caption = "Enhanced Projectile Motion Demo"
+    fps = 60
+
+    def enter(self, manager):
+        super().enter(manager)
+
+        # Fonts
+        self.font = manager.assets.font("Arial", 22)
+        self.info_font = manager.assets.font("Verdana", 20, bold=True)
+        self.small_font = manager.assets.font("Arial", 14)
+
+        # ---------------------
+        # Game State Variables
+        # ---------------------
+        self.game_state = "waiting"  # "waiting", "aiming", "launched", "finished"
+        self.projectile_pos = list(start_pos)
+        self.projectile_vel = (0, 0)
+        self.time_elapsed = 0
+        self.shot = None  # trajectory.Outcome of the current launch, solved when it is fired
+        self.flight_time = 0  # when the projectile stops: contact with the target, ground or screen edge
+
+        # Drag-and-shoot control
+        self.dragging = False
+        self.drag_start = None
+        self.drag_end = None
+
+        self.trail = ParticleSystem(TRAIL_CAPACITY, 8, ORANGE, max_life=1.0)
+
+        # Score
+        self.score = 0
+        self.target_pos = create_target()
+
+        self.heatmap_surface = None
+        self.heatmap_ms = 0
+        self.sweep_heatmap()
+
+    def draw_text(self, win, text, pos, color=WHITE, font_obj=None):
+        label = (font_obj or self.font).render(text, True, color)
+        win.blit(label, pos)
+
+    def reset_game(self):
+        self.game_state = "waiting"
+        self.projectile_pos = list(start_pos)
+        self.projectile_vel = (0, 0)
+        self.time_elapsed = 0
+        self.dragging = False
+        self.drag_start = None
+        self.drag_end = None
+        self.trail.clear()
+        self.target_pos = create_target()
+        self.sweep_heatmap()
 
     # ---------------------
-    # Update Simulation
+    # Aim Heatmap
     # ---------------------
-    if game_state == "launched":
-        time_elapsed += dt
-        projectile_pos[0] = start_pos[0] + projectile_vel[0] * time_elapsed
-        projectile_pos[1] = start_pos[1] + projectile_vel[1] * time_elapsed + 0.5 * g * time_elapsed**2
-
-        trail_particles.append({"pos": tuple(projectile_pos), "life": 1.0})
-        update_trail(dt)
-
-        if projectile_pos[1] >= start_pos[1] or projectile_pos[0] > WIDTH or projectile_pos[0] < 0:
-            game_state = "finished"
-
-        if check_collision(projectile_pos, proj_radius, target_pos, target_radius):
-            game_state = "finished"
-            score += 1
+    def sweep_heatmap(self):
+        """Build the heatmap surface for the current target."""
+        t0 = time.perf_counter()
+        gaps = sweep_launches(SWEEP_ANGLES, SWEEP_POWERS, start_pos, self.target_pos,
+                              proj_radius + target_radius, g, WIDTH, max_gap=HEATMAP_FAR)
+        self.heatmap_ms = (time.perf_counter() - t0) * 1000
+        closeness = 1 - np.minimum(gaps / HEATMAP_FAR, 1)
+        rgb = HEAT_FAR_COLOR + (HEAT_NEAR_COLOR - HEAT_FAR_COLOR) * closeness[..., None]
+        rgb[gaps == 0] = GREEN
+        # Angle along x, power along y with the strongest at the top
+        surface = pygame.surfarray.make_surface(rgb[:, ::-1].astype(np.uint8))
+        self.heatmap_surface = pygame.transform.smoothscale(surface, HEATMAP_RECT.size)
+        self.heatmap_surface.set_alpha(210)
+
+    def draw_heatmap(self, win, angle, power):
+        """Draw the heatmap panel with the current aim marked on it."""
+        win.blit(self.heatmap_surface, HEATMAP_RECT)
+        pygame.draw.rect(win, BLACK, HEATMAP_RECT, 1)
+        if SWEEP_ANGLES[0] <= angle <= SWEEP_ANGLES[-1] and SWEEP_POWERS[0] <= power <= SWEEP_POWERS[-1]:
+            x = HEATMAP_RECT.left + (angle - SWEEP_ANGLES[0]) / (SWEEP_ANGLES[-1] - SWEEP_ANGLES[0]) * (HEATMAP_RECT.width - 1)
+            y = HEATMAP_RECT.bottom - 1 - (power - SWEEP_POWERS[0]) / (SWEEP_POWERS[-1] - SWEEP_POWERS[0]) * (HEATMAP_RECT.height - 1)
+            pygame.draw.circle(win, WHITE, (x, y), 4, 2)
+        self.draw_text(win, f"{SWEEP_ANGLES.size * SWEEP_POWERS.size} launches swept in {self.heatmap_ms:.1f} ms",
+                       (HEATMAP_RECT.left, HEATMAP_RECT.bottom + 4), BLACK, self.small_font)
+
+    def update(self, frame_dt, events):
+        if self.game_state == "finished" and pygame.mouse.get_pressed()[0] and not self.dragging:
+            self.reset_game()
+
+        # Event Processing
+        for event in events:
+            # Handle drag-and-shoot controls via mouse
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_pos = pygame.mouse.get_pos()
+                if self.game_state in ["waiting", "finished"]:
+                    if self.game_state == "finished":
+                        self.reset_game()
+                    if math.hypot(mouse_pos[0]-start_pos[0], mouse_pos[1]-start_pos[1]) <= 20:
+                        self.dragging = True
+                        self.drag_start = mouse_pos
+                        self.drag_end = mouse_pos
+                        self.game_state = "aiming"
+
+            if event.type == pygame.MOUSEMOTION:
+                if self.dragging:
+                    self.drag_end = pygame.mouse.get_pos()
+
+            if event.type == pygame.MOUSEBUTTONUP:
+                if self.dragging:
+                    self.dragging = False
+                    dx = start_pos[0] - self.drag_end[0]
+                    dy = start_pos[1] - self.drag_end[1]
+                    power = math.hypot(dx, dy) * 2.5
+                    if power < 10:
+                        power = 10
+                    angle = math.degrees(math.atan2(dy, dx))
+                    self.projectile_vel = (power * math.cos(math.radians(angle)),
+                                           power * math.sin(math.radians(angle)))
+                    self.game_state = "launched"
+                    self.time_elapsed = 0
+                    # The whole flight is known at launch, so the outcome doesn't depend on dt
+                    self.shot = solve_launch(self.projectile_vel[0], self.projectile_vel[1], start_pos,
+                                             self.target_pos, proj_radius + target_radius, g, WIDTH)
+                    self.flight_time = self.shot.hit_time if self.shot.hit else self.shot.end_time
+
+        # ---------------------
+        # Update Simulation
+        # ---------------------
+        # Steps are a fixed dt per frame, as the game has always done
+        if self.game_state == "launched":
+            self.time_elapsed = min(self.time_elapsed + dt, self.flight_time)
+            self.projectile_pos[0] = start_pos[0] + self.projectile_vel[0] * self.time_elapsed
+            self.projectile_pos[1] = start_pos[1] + self.projectile_vel[1] * self.time_elapsed + 0.5 * g * self.time_elapsed**2
+
+            self.trail.emit(self.projectile_pos)
+            self.trail.update(dt)
+
+            if self.time_elapsed >= self.flight_time:
+                self.game_state = "finished"
+                if self.shot.hit:
+                    self.score += 1
 
     # ---------------------
     # Drawing
     # ---------------------
-    draw_gradient(win, (135, 206, 235), WHITE)
-    pygame.draw.rect(win, LIGHTGREY, (0, start_pos[1], WIDTH, HEIGHT-start_pos[1]))
-    draw_target(target_pos, target_radius)
-    draw_trail()
-    
-    shadow_offset = 4
-    pygame.draw.circle(win, DARKGREY, (int(projectile_pos[0]+shadow_offset), int(projectile_pos[1]+shadow_offset)), proj_radius)
-    pygame.draw.circle(win, RED, (int(projectile_pos[0]), int(projectile_pos[1])), proj_radius)
-
-    if dragging and drag_start and drag_end:
-        pygame.draw.aaline(win, BLUE, start_pos, drag_end, 4)
-        s = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.circle(s, (BLUE[0], BLUE[1], BLUE[2], 120), (20, 20), 20)
-        win.blit(s, (drag_end[0]-20, drag_end[1]-20))
-    
-    pygame.draw.circle(win, BLACK, start_pos, 12)
-    pygame.draw.circle(win, LIGHTGREY, start_pos, 10)
-    
-    # ---------------------
-    # Real-Time Physics Info
-    # ---------------------
-    info_lines = []
-    if game_state in ["aiming", "waiting"]:
-        if dragging and drag_start and drag_end:
-            dx = start_pos[0] - drag_end[0]
-            dy = start_pos[1] - drag_end[1]
-            power = math.hypot(dx, dy) * 2.5
-            aim_angle = math.degrees(math.atan2(dy, dx))
-            info_lines.append(f"Aim Angle: {aim_angle:.1f}°")
-            info_lines.append(f"Power: {power:.1f} px/s")
-        else:
-            info_lines.append("Drag from the launch point")
-            info_lines.append("to set direction and power.")
-    elif game_state in ["launched", "finished"]:
-        speed = math.hypot(projectile_vel[0], projectile_vel[1])
-        launch_angle = math.degrees(math.atan2(projectile_vel[1], projectile_vel[0]))
-        vx, vy = physics_velocity(time_elapsed, launch_angle, speed)
-        info_lines.append(f"Angle: {launch_angle:.1f}°")
-        info_lines.append(f"Speed: {speed:.1f} px/s")
-        info_lines.append(f"Time: {time_elapsed:.2f} s")
-        info_lines.append(f"vx: {vx:.1f}  vy: {vy:.1f}")
-        if game_state == "finished":
-            if check_collision(projectile_pos, proj_radius, target_pos, target_radius):
-                info_lines.append("Target Hit!")
+    def draw(self, win):
+        draw_gradient(win, (135, 206, 235), WHITE)
+        pygame.draw.rect(win, LIGHTGREY, (0, start_pos[1], WIDTH, HEIGHT-start_pos[1]))
+        draw_target(win, self.target_pos, target_radius)
+        with scope("trail"):
+            self.trail.draw(win)
+
+        projectile_pos = self.projectile_pos
+        shadow_offset = 4
+        pygame.draw.circle(win, DARKGREY, (int(projectile_pos[0]+shadow_offset), int(projectile_pos[1]+shadow_offset)), proj_radius)
+        pygame.draw.circle(win, RED, (int(projectile_pos[0]), int(projectile_pos[1])), proj_radius)
+
+        drag_end = self.drag_end
+        if self.dragging and self.drag_start and drag_end:
+            pygame.draw.aaline(win, BLUE, start_pos, drag_end, 4)
+            s = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.circle(s, (BLUE[0], BLUE[1], BLUE[2], 120), (20, 20), 20)
+            win.blit(s, (drag_end[0]-20, drag_end[1]-20))
+            aim_dx = start_pos[0] - drag_end[0]
+            aim_dy = start_pos[1] - drag_end[1]
+            self.draw_heatmap(win, math.degrees(math.atan2(aim_dy, aim_dx)), math.hypot(aim_dx, aim_dy) * 2.5)
+
+        pygame.draw.circle(win, BLACK, start_pos, 12)
+        pygame.draw.circle(win, LIGHTGREY, start_pos, 10)
+
+        # ---------------------
+        # Real-Time Physics Info
+        # ---------------------
+        info_lines = []
+        if self.game_state in ["aiming", "waiting"]:
+            if self.dragging and self.drag_start and drag_end:
+                dx = start_pos[0] - drag_end[0]
+                dy = start_pos[1] - drag_end[1]
+                power = math.hypot(dx, dy) * 2.5
+                aim_angle = math.degrees(math.atan2(dy, dx))
+                info_lines.append(f"Aim Angle: {aim_angle:.1f}°")
+                info_lines.append(f"Power: {power:.1f} px/s")
             else:
-                info_lines.append("Missed!")
-            info_lines.append("Click to reset.")
-
-    info_box = pygame.Surface((240, len(info_lines)*30 + 10), pygame.SRCALPHA)
-    info_box.fill((255, 255, 255, 200))
-    win.blit(info_box, (WIDTH - 250, 10))
-    for i, line in enumerate(info_lines):
-        text_surface = info_font.render(line, True, BLACK)
-        win.blit(text_surface, (WIDTH - 240, 15 + i * 30))
-    
-    draw_text(f"Score: {score}", (10, 10), BLACK, font)
-
-    pygame.display.update()
+                info_lines.append("Drag from the launch point")
+                info_lines.append("to set direction and power.")
+        elif self.game_state in ["launched", "finished"]:
+            speed = math.hypot(self.projectile_vel[0], self.projectile_vel[1])
+            launch_angle = math.degrees(math.atan2(self.projectile_vel[1], self.projectile_vel[0]))
+            vx, vy = physics_velocity(self.time_elapsed, launch_angle, speed)
+            info_lines.append(f"Angle: {launch_angle:.1f}°")
+            info_lines.append(f"Speed: {speed:.1f} px/s")
+            info_lines.append(f"Time: {self.time_elapsed:.2f} s")
+            info_lines.append(f"vx: {vx:.1f}  vy: {vy:.1f}")
+            if self.game_state == "finished":
+                if self.shot.hit:
+                    info_lines.append("Target Hit!")
+                else:
+                    info_lines.append("Missed!")
+                info_lines.append("Click to reset.")
+
+        info_box = pygame.Surface((240, len(info_lines)*30 + 10), pygame.SRCALPHA)
+        info_box.fill((255, 255, 255, 200))
+        win.blit(info_box, (WIDTH - 250, 10))
+        for i, line in enumerate(info_lines):
+            text_surface = self.info_font.render(line, True, BLACK)
+            win.blit(text_surface, (WIDTH - 240, 15 + i * 30))
+
+        self.draw_text(win, f"Score: {self.score}", (10, 10), BLACK, self.font)
 
-    if game_state == "finished" and pygame.mouse.get_pressed()[0] and not dragging:
-        reset_game()
-
-pygame.quit()
-sys.exit()
+# ---------------------
+# Main Loop
+# ---------------------
+if __name__ == "__main__":
+    run_scene(CalculusScene)
@@ -0,0 +1,139 @@
+import math
+import multiprocessing
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+# The odds of prob.py's 7 Up 7 Down without pygame: the win rules, the
+# exact distribution of the two-dice total and a Monte Carlo estimate of
+# both. Rolls are drawn in fixed-size NumPy batches, so memory stays flat
+# however many are asked for. Big runs are split into chunks that each get
+# their own seed and are spread over a process pool.
+
+SIDES = 6
+BATCH_ROLLS = 1 << 20  # rolls drawn per NumPy call
+CHUNK_ROLLS = 1 << 24  # rolls per pool task
+Z_95 = 1.959963984540054  # two-sided 95% normal quantile
+
+# Guess -> whether a total wins. The rules work on a plain int or on a NumPy
+# array of totals alike.
+RULES = {
+    "7 Down": lambda total: total < 7,
+    "7": lambda total: total == 7,
+    "7 Up": lambda total: total > 7,
+}
+TOTALS = np.arange(2, 2 * SIDES + 1)
+
+
+def is_win(guess, total):
+    return RULES[guess](total)
+
+
+def exact_distribution():
+    """{total: Fraction} for the sum of two fair dice."""
+    counts = {}
+    for die1 in range(1, SIDES + 1):
+        for die2 in range(1, SIDES + 1):
+            counts[die1 + die2] = counts.get(die1 + die2, 0) + 1
+    return {total: Fraction(count, SIDES * SIDES) for total, count in sorted(counts.items())}
+
+
+def exact_win_rates():
+    """{guess: Fraction} chance of winning with each guess."""
+    distribution = exact_distribution()
+    return {guess: sum(p for total, p in distribution.items() if is_win(guess, total)) for guess in RULES}
+
+
+def roll_counts(rolls, rng):
+    """How often each total in TOTALS came up in rolls throws of two dice."""
+    counts = np.zeros(SIDES * SIDES, dtype=np.int64)
+    for first in range(0, rolls, BATCH_ROLLS):
+        # One draw out of 36 picks both dice: die1 = k // 6 + 1, die2 = k % 6 + 1
+        pairs = rng.integers(0, SIDES * SIDES, min(BATCH_ROLLS, rolls - first), dtype=np.uint8)
+        counts += np.bincount(pairs, minlength=SIDES * SIDES)
+    die1, die2 = np.divmod(np.arange(SIDES * SIDES), SIDES)
+    totals = np.zeros(len(TOTALS), dtype=np.int64)
+    np.add.at(totals, die1 + die2, counts)
+    return totals
+
+
+def _run_chunk(args):
+    rolls, seed = args
+    return roll_counts(rolls, np.random.default_rng(seed))
+
+
+def simulate(rolls, seed=None, processes=None):
+    """Counts per total (aligned with TOTALS) for rolls throws of two dice.
+
+    The rolls are split into CHUNK_ROLLS-sized chunks, each with a seed
+    spawned from seed, so a given seed gives the same counts however many
+    processes share the work.
+    """
+    sizes = [min(CHUNK_ROLLS, rolls - first) for first in range(0, rolls, CHUNK_ROLLS)]
+    tasks = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+    processes = processes or os.cpu_count() or 1
+    counts = np.zeros(len(TOTALS), dtype=np.int64)
+    if processes == 1 or len(tasks) < 2:
+        for task in tasks:
+            counts += _run_chunk(task)
+    else:
+        with multiprocessing.Pool(min(processes, len(tasks))) as pool:
+            for chunk_counts in pool.imap_unordered(_run_chunk, tasks):
+                counts += chunk_counts
+    return counts
+
+
+def win_counts(counts):
+    """{guess: wins} from the per-total counts, using the same rules as the game."""
+    return {guess: int(counts[is_win(guess, TOTALS)].sum()) for guess in RULES}
+
+
+def wilson_interval(successes, trials, z=Z_95):
+    """Wilson score interval for a success rate."""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return centre - spread, centre + spread
+
+
+def report(counts):
+    """Table of simulated against exact odds."""
+    rolls = int(counts.sum())
+    distribution = exact_distribution()
+    lines = [f"{'total':>5} {'exact':>9} {'simulated':>10} {'95% interval':>21}"]
+    for total, count in zip(TOTALS.tolist(), counts.tolist()):
+        low, high = wilson_interval(count, rolls)
+        lines.append(f"{total:5d} {float(distribution[total]):9.6f} {count / rolls:10.6f}   [{low:.6f}, {high:.6f}]")
+    lines.append("")
+    lines.append(f"{'guess':>6} {'exact':>9} {'win rate':>10} {'95% interval':>21}")
+    exact_rates = exact_win_rates()
+    for guess, wins in win_counts(counts).items():
+        exact = exact_rates[guess]
+        low, high = wilson_interval(wins, rolls)
+        lines.append(f"{guess:>6} {float(exact):9.6f} {wins / rolls:10.6f}   [{low:.6f}, {high:.6f}]  ({exact})")
+    return "\n".join(lines)
+
+
+def main(rolls, seed=None, processes=None):
+    t0 = time.perf_counter()
+    counts = simulate(rolls, seed, processes)
+    elapsed = time.perf_counter() - t0
+    print(f"{rolls} rolls in {elapsed:.2f} s ({rolls / elapsed / 1e6:.0f} M rolls/s)")
+    print(report(counts))
+
+
+if __name__ == "__main__":
+    # python dice.py [rolls] [--seed N] [--processes N]
+    def arg_value(name):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else None
+
+    seed = arg_value("--seed")
+    processes = arg_value("--processes")
+    rolls = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("--") else "100000000"
+    main(int(float(rolls)), int(seed) if seed else None, int(processes) if processes else None)
@@ -0,0 +1,138 @@
+import heapq
+from array import array
+
+from pathfinding import INF, heuristic
+
+# D* Lite (Koenig & Likhachev) on the same flat Grid as pathfinding.a_star.
+# The search runs backwards from the goal and keeps its g/rhs values between
+# calls, so after a barrier edit only the cells whose distance actually
+# changed are expanded again instead of re-running A* from scratch.
+
+
+class DStarLite:
+    def __init__(self, grid, start, goal):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.expanded = 0  # total expansions over the planner's lifetime
+
+        size = grid.rows * grid.cols
+        self.g = array("d", [INF]) * size
+        self.rhs = array("d", [INF]) * size
+        self.km = 0  # key modifier, grows when the start moves
+        self.open_set = []
+        self.open_keys = {}  # index -> current key; heap entries not matching are stale
+        self.count = 0
+
+        goal_index = grid.index(*goal)
+        self.rhs[goal_index] = 0
+        self._push(goal_index)
+
+    def _key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        row, col = divmod(index, self.grid.cols)
+        return (best + heuristic((row, col), self.start) + self.km, best)
+
+    def _push(self, index):
+        key = self._key(index)
+        self.open_keys[index] = key
+        self.count += 1
+        heapq.heappush(self.open_set, (key, self.count, index))
+
+    def _neighbors(self, index):
+        cols = self.grid.cols
+        row, col = divmod(index, cols)
+        # DOWN, UP, RIGHT, LEFT - same order as Grid.neighbors
+        if row < self.grid.rows - 1:
+            yield index + cols
+        if row > 0:
+            yield index - cols
+        if col < cols - 1:
+            yield index + 1
+        if col > 0:
+            yield index - 1
+
+    def _update_vertex(self, index):
+        barrier = self.grid.barrier
+        if index != self.grid.index(*self.goal):
+            best = INF
+            if not barrier[index]:
+                g = self.g
+                for neighbor in self._neighbors(index):
+                    if not barrier[neighbor] and g[neighbor] + 1 < best:
+                        best = g[neighbor] + 1
+            self.rhs[index] = best
+        self.open_keys.pop(index, None)
+        if self.g[index] != self.rhs[index]:
+            self._push(index)
+
+    def _compute_shortest_path(self):
+        start_index = self.grid.index(*self.start)
+        g, rhs = self.g, self.rhs
+        open_set, open_keys = self.open_set, self.open_keys
+        while open_set:
+            key, _, index = open_set[0]
+            if open_keys.get(index) != key:
+                heapq.heappop(open_set)  # stale entry
+                continue
+            if key >= self._key(start_index) and rhs[start_index] == g[start_index]:
+                break
+            heapq.heappop(open_set)
+            del open_keys[index]
+            self.expanded += 1
+
+            new_key = self._key(index)
+            if key < new_key:
+                self._push(index)
+            elif g[index] > rhs[index]:
+                g[index] = rhs[index]
+                for neighbor in self._neighbors(index):
+                    self._update_vertex(neighbor)
+            else:
+                g[index] = INF
+                self._update_vertex(index)
+                for neighbor in self._neighbors(index):
+                    self._update_vertex(neighbor)
+
+    def compute_path(self):
+        """Repair the search tree and return the path from start to goal.
+
+        The path is a list of (row, col) like pathfinding.a_star returns,
+        or None if the goal is unreachable.
+        """
+        self._compute_shortest_path()
+        grid = self.grid
+        index = grid.index(*self.start)
+        goal_index = grid.index(*self.goal)
+        if self.g[index] == INF:
+            return None
+
+        barrier = grid.barrier
+        path = [index]
+        while index != goal_index:
+            # Step to the neighbour with the smallest remaining distance
+            best, best_g = None, INF
+            for neighbor in self._neighbors(index):
+                if not barrier[neighbor] and self.g[neighbor] < best_g:
+                    best, best_g = neighbor, self.g[neighbor]
+            if best is None:
+                return None
+            index = best
+            path.append(index)
+        return [grid.get_pos(index) for index in path]
+
+    def update_cell(self, row, col):
+        """Tell the planner that the barrier state of a cell has changed.
+
+        Only the cell and its four neighbours are touched here; the repair
+        itself happens on the next compute_path().
+        """
+        index = self.grid.index(row, col)
+        self._update_vertex(index)
+        for neighbor in self._neighbors(index):
+            self._update_vertex(neighbor)
+
+    def move_start(self, start):
+        """Move the start (e.g. an agent walking the path) without replanning from scratch."""
+        self.km += heuristic(self.start, start)
+        self.start = start
@@ -0,0 +1,125 @@
+import numpy as np
+
+# Structure-of-arrays storage for vector.py's bullets and targets.
+# Positions and velocities are preallocated (capacity, 2) arrays; dead slots
+# go on a free-list and are handed out again by the next spawn, so nothing is
+# allocated per entity and each frame's update is a handful of NumPy passes.
+
+PAIR_CHUNK = 256  # rows per block in closest(), bounds the temporary arrays
+
+
+class EntityPool:
+    def __init__(self, capacity=256):
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))  # stack of free slots, popped from the end
+        self.count = 0
+
+    def _grow(self):
+        old = len(self.alive)
+        self.pos = np.concatenate([self.pos, np.zeros((old, 2))])
+        self.vel = np.concatenate([self.vel, np.zeros((old, 2))])
+        self.alive = np.concatenate([self.alive, np.zeros(old, dtype=bool)])
+        self.free = list(range(2 * old - 1, old - 1, -1)) + self.free
+
+    def spawn(self, pos, vel=(0, 0)):
+        """Take a free slot (doubling the arrays if there is none) and return its index."""
+        if not self.free:
+            self._grow()
+        index = self.free.pop()
+        self.pos[index] = pos
+        self.vel[index] = vel
+        self.alive[index] = True
+        self.count += 1
+        return index
+
+    def kill(self, indices):
+        """Free the given slots; indices that are already dead are ignored."""
+        indices = np.unique(np.asarray(indices, dtype=int))
+        indices = indices[self.alive[indices]]
+        self.alive[indices] = False
+        self.vel[indices] = 0  # so integrate() can run over every slot
+        self.free.extend(indices.tolist())
+        self.count -= len(indices)
+
+    def active(self):
+        """Indices of the live slots, in slot order."""
+        return np.flatnonzero(self.alive)
+
+    def integrate(self, scale=1.0):
+        self.pos += self.vel * scale
+
+    def cull(self, left, top, right, bottom):
+        """Kill everything outside the rectangle and return how many went."""
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        outside = self.alive & ((x < left) | (x > right) | (y < top) | (y > bottom))
+        gone = np.flatnonzero(outside)
+        self.kill(gone)
+        return len(gone)
+
+    def __len__(self):
+        return self.count
+
+
+def _cell_keys(cx, cy):
+    return cx * 2**32 + cy
+
+
+def closest(points, others, cell_size=None):
+    """For each row of points, the index into others of its nearest point and the distance.
+
+    Returns two arrays of len(points); points with nothing found get index
+    -1 and distance inf. Without cell_size every pair is compared. With it,
+    others are sorted by grid cell and each point only looks at its own and
+    the eight surrounding cells, so the answer is exact whenever the nearest
+    point is within cell_size and may be missing otherwise.
+    """
+    count = len(points)
+    nearest = np.full(count, -1)
+    distances = np.full(count, np.inf)
+    if count == 0 or len(others) == 0:
+        return nearest, distances
+
+    if cell_size is None:
+        ox, oy = others[:, 0], others[:, 1]
+        for start in range(0, count, PAIR_CHUNK):
+            block = points[start:start + PAIR_CHUNK]
+            dx = block[:, 0, None] - ox
+            dy = block[:, 1, None] - oy
+            squared = dx * dx + dy * dy
+            best = squared.argmin(axis=1)
+            nearest[start:start + len(block)] = best
+            distances[start:start + len(block)] = squared[np.arange(len(block)), best]
+        np.sqrt(distances, out=distances)
+        return nearest, distances
+
+    other_cells = np.floor_divide(others, cell_size).astype(np.int64)
+    order = np.argsort(_cell_keys(other_cells[:, 0], other_cells[:, 1]), kind="stable")
+    sorted_keys = _cell_keys(other_cells[order, 0], other_cells[order, 1])
+    cells = np.floor_divide(points, cell_size).astype(np.int64)
+
+    # Every (point, candidate) pair from the 3x3 block of cells around each point
+    point_ids, candidate_ids = [], []
+    for step_x in (-1, 0, 1):
+        for step_y in (-1, 0, 1):
+            keys = _cell_keys(cells[:, 0] + step_x, cells[:, 1] + step_y)
+            starts = np.searchsorted(sorted_keys, keys, "left")
+            lengths = np.searchsorted(sorted_keys, keys, "right") - starts
+            ids = np.repeat(np.arange(count), lengths)
+            offsets = np.arange(len(ids)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            point_ids.append(ids)
+            candidate_ids.append(order[np.repeat(starts, lengths) + offsets])
+    point_ids = np.concatenate(point_ids)
+    candidate_ids = np.concatenate(candidate_ids)
+    if len(point_ids) == 0:
+        return nearest, distances
+
+    dx = points[:, 0].take(point_ids) - others[:, 0].take(candidate_ids)
+    dy = points[:, 1].take(point_ids) - others[:, 1].take(candidate_ids)
+    squared = dx * dx + dy * dy
+    np.minimum.at(distances, point_ids, squared)
+    best = squared == distances[point_ids]
+    nearest[point_ids[best]] = candidate_ids[best]
+    np.sqrt(distances, out=distances)
+    return nearest, distances
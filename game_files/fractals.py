@@ -1,9 +1,9 @@
 import pygame
-import random
-import sys
-
-# Initialize pygame
-pygame.init()
+import numpy as np
+import time
+from collections import deque
+from terrain import ChunkStreamer, TerrainWorld
+from scenes import Scene, run_scene
 
 # Constants
 WIDTH, HEIGHT = 800, 600
@@ -11,147 +11,141 @@ GROUND_HEIGHT = HEIGHT // 2
 PLAYER_SIZE = 20
 FPS = 60
 CHUNK_WIDTH = WIDTH  # Width of each terrain chunk
+TERRAIN_SEED = None  # set to an int to get the same terrain every run
+LOOK_AHEAD = 2  # chunks loaded ahead of the player
+RETAIN_BEHIND = 1  # chunks kept loaded behind the player
+CHUNK_CACHE_SIZE = 64  # chunks kept in memory for revisits
+TERRAIN_STORE_DIR = None  # directory for the on-disk chunk store, or None
 
 # Colors
 SKY_BLUE = (135, 206, 235)
 GROUND_COLOR = (34, 139, 34)
+GROUND_EDGE = (20, 90, 20)
 PLAYER_COLOR = (255, 0, 0)
-
-# Set up the display
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Endless Fractal Terrain")
-clock = pygame.time.Clock()
-
-
-def generate_terrain_segment(start_x, end_x, start_y=None, end_y=None, roughness=0.5, max_displacement=200):
-    """Generate a fractal terrain segment between start_x and end_x"""
-    if start_y is None:
-        start_y = GROUND_HEIGHT + random.randint(-50, 50)
-    if end_y is None:
-        end_y = GROUND_HEIGHT + random.randint(-50, 50)
-
-    terrain = [(start_x, start_y), (end_x, end_y)]
-
-    def midpoint_displacement(left, right, displacement):
-        # Get midpoint
-        mid_x = (left[0] + right[0]) / 2
-        mid_y = (left[1] + right[1]) / 2
-
-        # Displace midpoint vertically
-        mid_y += random.uniform(-displacement, displacement)
-
-        # Clamp the displacement
-        mid_y = max(GROUND_HEIGHT - max_displacement,
-                    min(GROUND_HEIGHT + max_displacement, mid_y))
-
-        # Add the new point
-        terrain.append((mid_x, mid_y))
-        terrain.sort(key=lambda p: p[0])  # Keep points ordered by x-coordinate
-
-        # Recursively apply to left and right segments
-        new_displacement = displacement * roughness
-        if new_displacement > 1:
-            midpoint_displacement(left, (mid_x, mid_y), new_displacement)
-            midpoint_displacement((mid_x, mid_y), right, new_displacement)
-
-    # Start the recursion
-    midpoint_displacement(terrain[0], terrain[-1], max_displacement)
-
-    return terrain
-
-
-# Initialize terrain
-terrain_segments = []
-
-# Generate initial terrain segments
-for i in range(3):  # Generate 3 chunks to start
-    start_x = i * CHUNK_WIDTH
-    end_x = (i + 1) * CHUNK_WIDTH
-    segment = generate_terrain_segment(start_x, end_x)
-    terrain_segments.append(segment)
-
-# Player position
-player_x = 100
-player_y = min([p[1] for segment in terrain_segments for p in segment
-                if p[0] >= 95 and p[0] <= 105]) - PLAYER_SIZE
-
-# Camera offset
-camera_x = 0
-
-# Game loop
-running = True
-while running:
-    # Handle events
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    # Handle player movement
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_LEFT] and player_x > 20:
-        player_x -= 5
-    if keys[pygame.K_RIGHT]:
-        player_x += 5
-
-    # Update camera to follow player
-    camera_x = player_x - WIDTH // 3
-
-    # Generate new terrain segments as needed
-    last_segment_end = terrain_segments[-1][-1][0]
-    if player_x > last_segment_end - WIDTH:
-        new_segment = generate_terrain_segment(
-            last_segment_end,
-            last_segment_end + CHUNK_WIDTH,
-            terrain_segments[-1][-1][1],  # Continue from last segment's end height
-            None
-        )
-        terrain_segments.append(new_segment)
-
-        # Remove old segments that are far behind (memory management)
-        if len(terrain_segments) > 3:
-            terrain_segments.pop(0)
-
-    # Find ground level below player
-    player_ground_y = HEIGHT
-    for segment in terrain_segments:
-        for i in range(len(segment) - 1):
-            x1, y1 = segment[i]
-            x2, y2 = segment[i + 1]
-            if x1 <= player_x <= x2:
-                # Linear interpolation
-                t = (player_x - x1) / (x2 - x1)
-                player_ground_y = y1 + t * (y2 - y1)
-                break
-
-    # Keep player on ground
-    player_y = player_ground_y - PLAYER_SIZE
-
-    # Draw everything
-    screen.fill(SKY_BLUE)
-
-    # Draw terrain (only visible portions)
-    for segment in terrain_segments:
-        visible_points = [p for p in segment if -100 <= p[0] - camera_x <= WIDTH + 100]
-        if len(visible_points) >= 2:
-            pygame.draw.lines(screen, GROUND_COLOR, False,
-                              [(p[0] - camera_x, p[1]) for p in visible_points], 3)
-
-    # Draw player
-    pygame.draw.rect(screen, PLAYER_COLOR,
-                     (player_x - camera_x, player_y, PLAYER_SIZE, PLAYER_SIZE))
-
-    # Draw explanation text
-    font = pygame.font.SysFont('Arial', 16)
-    text1 = font.render("Endless Fractal Terrain Generation", True, (0, 0, 0))
-    text2 = font.render("Uses midpoint displacement algorithm", True, (0, 0, 0))
-    text3 = font.render("Arrow keys to move", True, (0, 0, 0))
-
-    screen.blit(text1, (10, 10))
-    screen.blit(text2, (10, 30))
-    screen.blit(text3, (10, 50))
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+TEXT_COLOR = (0, 0, 0)
+
+
+def bake_chunk(heights):
+    """Rasterize a chunk once: filled ground on sky, cropped to the ground's top.
+
+    Returns (surface, top); the frame only has to blit it at (chunk x - camera_x, top).
+    """
+    top = max(0, int(heights.min()) - 2)
+    xs = np.linspace(0, CHUNK_WIDTH, len(heights))
+    ridge = np.column_stack((xs, heights - top)).tolist()
+    surface = pygame.Surface((CHUNK_WIDTH + 1, HEIGHT - top)).convert()
+    surface.fill(SKY_BLUE)
+    pygame.draw.polygon(surface, GROUND_COLOR, ridge + [(CHUNK_WIDTH, HEIGHT - top), (0, HEIGHT - top)])
+    pygame.draw.lines(surface, GROUND_EDGE, False, ridge, 3)
+    return surface, top
+
+
+class FractalsScene(Scene):
+    size = (WIDTH, HEIGHT)
+    caption = "Endless Fractal Terrain"
+    fps = FPS
+
+    def enter(self, manager):
+        super().enter(manager)
+
+        # The world is a pure function of (seed, chunk index); chunks around the
+        # player are loaded on a worker thread
+        self.world = TerrainWorld(GROUND_HEIGHT, TERRAIN_SEED, cache_size=CHUNK_CACHE_SIZE,
+                                  store_dir=TERRAIN_STORE_DIR)
+        self.streamer = ChunkStreamer(self.world, CHUNK_WIDTH, LOOK_AHEAD, RETAIN_BEHIND)
+        self.chunk_surfaces = {}  # chunk index -> (surface, top), baked once per chunk
+
+        # Player position
+        self.player_x = 100
+        self.streamer.update(self.player_x)
+        self.streamer.require(0)
+        self.player_y = self.streamer.height_at(self.player_x) - PLAYER_SIZE
+
+        # Frame work time (without the wait in clock.tick), for the HUD
+        self.frame_times = deque(maxlen=FPS * 2)
+        self.frame_start = None
+
+        # HUD text never changes, so it is rendered once; the stats line is
+        # re-rendered twice a second rather than every frame
+        self.font = manager.assets.font('Arial', 16)
+        self.hud_lines = [self.font.render(line, True, TEXT_COLOR) for line in (
+            "Endless Fractal Terrain Generation",
+            "Uses midpoint displacement algorithm",
+            "Arrow keys to move",
+        )]
+        self.stats_text = None
+        self.frame_count = 0
+
+        # Camera offset
+        self.camera_x = 0
+
+    def update(self, dt, events):
+        self.frame_start = time.perf_counter()
+        streamer = self.streamer
+
+        # Handle player movement
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT] and self.player_x > 20:
+            self.player_x -= 5
+        if keys[pygame.K_RIGHT]:
+            self.player_x += 5
+
+        # Update camera to follow player
+        self.camera_x = self.player_x - WIDTH // 3
+
+        # Stream terrain: queue chunks ahead, collect finished ones, drop old ones.
+        # require() only waits if the worker has fallen behind the player.
+        streamer.update(self.player_x)
+        streamer.require(streamer.chunk_index(self.player_x))
+        for index, heights in streamer.chunks.items():
+            if index not in self.chunk_surfaces:
+                self.chunk_surfaces[index] = bake_chunk(heights)
+        for index in [i for i in self.chunk_surfaces if i not in streamer.chunks]:
+            del self.chunk_surfaces[index]
+
+        # Find ground level below player (direct lookup into the evenly spaced samples)
+        player_ground_y = streamer.height_at(self.player_x, HEIGHT)
+
+        # Keep player on ground
+        self.player_y = player_ground_y - PLAYER_SIZE
+
+    def draw(self, screen):
+        camera_x = self.camera_x
+        streamer = self.streamer
+
+        # Draw everything
+        screen.fill(SKY_BLUE)
+
+        # Draw terrain: one blit per chunk on screen
+        for index in range(streamer.chunk_index(camera_x), streamer.chunk_index(camera_x + WIDTH) + 1):
+            if index in self.chunk_surfaces:
+                surface, top = self.chunk_surfaces[index]
+                screen.blit(surface, (index * CHUNK_WIDTH - camera_x, top))
+
+        # Draw player
+        pygame.draw.rect(screen, PLAYER_COLOR,
+                         (self.player_x - camera_x, self.player_y, PLAYER_SIZE, PLAYER_SIZE))
+
+        # Draw explanation text
+        for i, text in enumerate(self.hud_lines):
+            screen.blit(text, (10, 10 + i * 20))
+
+        frame_times = self.frame_times
+        if frame_times and self.frame_count % (FPS // 2) == 0:
+            self.stats_text = self.font.render(f"Frame: {sum(frame_times) / len(frame_times):.1f} ms avg, "
+                                               f"{max(frame_times):.1f} ms worst, {streamer.stalls} chunk stalls, "
+                                               f"seed {self.world.seed}",
+                                               True, TEXT_COLOR)
+        if self.stats_text:
+            screen.blit(self.stats_text, (10, 70))
+
+        frame_times.append((time.perf_counter() - self.frame_start) * 1000)
+        self.frame_count += 1
+
+    def exit(self):
+        self.streamer.close()
+        self.chunk_surfaces.clear()
+
+
+if __name__ == "__main__":
+    run_scene(FractalsScene)
@@ -0,0 +1,153 @@
+import hashlib
+import os
+from array import array
+from collections import OrderedDict, deque
+
+from pathfinding import INF
+
+# Preprocessed heuristics for maps that stay the same across many queries.
+# Both kinds of table are BFS distances on the 4-connected grid, so they are
+# only admissible for 4-connected searches (not AStarSearch's diagonal=True).
+# They are cached by a hash of the barrier layout, so editing the map
+# invalidates them; only the most recently used layouts are kept.
+#
+#   landmark_heuristic  ALT: h(n) = max over landmarks L of |d(L, goal) - d(L, n)|
+#   distance_field_heuristic  exact distances from a BFS rooted at the goal
+
+UNREACHABLE = -1
+LANDMARK_COUNT = 8
+MAX_LANDMARK_SETS = 4
+MAX_DISTANCE_FIELDS = 32
+
+_landmark_cache = OrderedDict()  # (layout hash, count) -> (landmark indices, tables), least recent first
+_field_cache = OrderedDict()  # (layout hash, goal index) -> table, least recent first
+
+
+def layout_hash(grid):
+    digest = hashlib.sha1(f"{grid.rows}x{grid.cols}".encode())
+    digest.update(grid.barrier)
+    return digest.hexdigest()
+
+
+def bfs_distances(grid, source):
+    """Step counts from source to every cell (UNREACHABLE for walls and cut-off cells)."""
+    rows, cols = grid.rows, grid.cols
+    barrier = grid.barrier
+    distances = array("i", [UNREACHABLE]) * (rows * cols)
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        step = distances[current] + 1
+        row, col = divmod(current, cols)
+        for neighbor, valid in (
+            (current + cols, row < rows - 1),
+            (current - cols, row > 0),
+            (current + 1, col < cols - 1),
+            (current - 1, col > 0),
+        ):
+            if valid and not barrier[neighbor] and distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = step
+                queue.append(neighbor)
+    return distances
+
+
+def _pick_landmarks(grid, count):
+    # Farthest-point selection: each new landmark is the cell farthest from
+    # all landmarks so far, which spreads them towards the edges of the map.
+    free = next((i for i, blocked in enumerate(grid.barrier) if not blocked), None)
+    if free is None:
+        return [], []
+    nearest = bfs_distances(grid, free)
+    landmarks, tables = [], []
+    for _ in range(count):
+        candidate = max(range(len(nearest)), key=nearest.__getitem__)
+        if nearest[candidate] <= 0 and landmarks:
+            break
+        table = bfs_distances(grid, candidate)
+        if not landmarks:
+            nearest = array("i", table)
+        else:
+            for i, distance in enumerate(table):
+                if distance != UNREACHABLE and distance < nearest[i]:
+                    nearest[i] = distance
+        landmarks.append(candidate)
+        tables.append(table)
+    return landmarks, tables
+
+
+def _cache_path(cache_dir, key, count):
+    return os.path.join(cache_dir, f"landmarks-{key}-{count}.bin")
+
+
+def load_landmarks(grid, count=LANDMARK_COUNT, cache_dir=None):
+    """Return (landmark indices, distance tables), computing them only once per layout."""
+    key = layout_hash(grid)
+    cached = _landmark_cache.get((key, count))
+    if cached is not None:
+        _landmark_cache.move_to_end((key, count))
+        return cached
+
+    size = grid.rows * grid.cols
+    path = cache_dir and _cache_path(cache_dir, key, count)
+    if path and os.path.exists(path):
+        data = array("i")
+        with open(path, "rb") as f:
+            data.frombytes(f.read())
+        found = data[0]
+        landmarks = list(data[1:1 + found])
+        tables = [data[1 + found + i * size:1 + found + (i + 1) * size] for i in range(found)]
+    else:
+        landmarks, tables = _pick_landmarks(grid, count)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            data = array("i", [len(landmarks)] + landmarks)
+            for table in tables:
+                data.extend(table)
+            with open(path, "wb") as f:
+                f.write(data.tobytes())
+
+    _landmark_cache[(key, count)] = (landmarks, tables)
+    if len(_landmark_cache) > MAX_LANDMARK_SETS:
+        _landmark_cache.popitem(last=False)
+    return landmarks, tables
+
+
+def landmark_heuristic(grid, goal, count=LANDMARK_COUNT, cache_dir=None):
+    """ALT heuristic towards goal, combined with Manhattan distance."""
+    _, tables = load_landmarks(grid, count, cache_dir)
+    cols = grid.cols
+    goal_row, goal_col = goal
+    goal_index = goal_row * cols + goal_col
+    usable = [(table, table[goal_index]) for table in tables if table[goal_index] != UNREACHABLE]
+
+    def estimate(index):
+        row, col = divmod(index, cols)
+        best = abs(row - goal_row) + abs(col - goal_col)
+        for table, to_goal in usable:
+            distance = table[index]
+            if distance != UNREACHABLE and abs(to_goal - distance) > best:
+                best = abs(to_goal - distance)
+        return best
+
+    return estimate
+
+
+def distance_field_heuristic(grid, goal):
+    """Exact heuristic from a BFS rooted at goal; keeps the last few fields cached."""
+    goal_index = grid.index(*goal)
+    key = (layout_hash(grid), goal_index)
+    table = _field_cache.get(key)
+    if table is None:
+        table = bfs_distances(grid, goal_index)
+        _field_cache[key] = table
+        if len(_field_cache) > MAX_DISTANCE_FIELDS:
+            _field_cache.popitem(last=False)
+    else:
+        _field_cache.move_to_end(key)
+
+    def estimate(index):
+        distance = table[index]
+        return INF if distance == UNREACHABLE else distance
+
+    return estimate
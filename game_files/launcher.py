@@ -0,0 +1,305 @@
+import importlib
+import multiprocessing
+import os
+import runpy
+import signal
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import wait
+
+# Starts the games for main.py. Starting a game cold means a new interpreter
+# has to import pygame, NumPy and the game's helper modules before the first
+# frame. Instead, a template process does
+# all of that once and then forks a copy of itself for every launch. Where
+# os.fork doesn't exist (Windows) games are started cold.
+#
+# The template doesn't call pygame.init(): an SDL video connection can't be
+# shared between forked processes, so every game still opens its own.
+#
+# Every game reports the time of its first display flip through a pipe, and
+# the template reaps the games when they exit, so the launcher can report
+# launch latency, time to first frame and lifetime for each one.
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+GAMES = ["calculus.py", "fractals.py", "optimization.py", "prob.py", "vector.py"]
+WARM_MODULES = ["numpy", "assets", "backgrounds", "dice", "dstar_lite", "entities", "particles",
+                "pathfinding", "profiler", "scenes", "terrain", "trajectory", "vector_sim"]
+REAP_INTERVAL = 0.5  # seconds between checks for exited games when idle
+CAN_FORK = hasattr(os, "fork")
+
+_compiled = {}  # script path -> (mtime, code object), filled by the template
+
+
+class GameInstance:
+    """One launched game. Times are time.monotonic() values."""
+
+    def __init__(self, script, pid, requested_at, started_at):
+        self.script = script
+        self.pid = pid
+        self.requested_at = requested_at
+        self.started_at = started_at  # when the launcher got the pid back
+        self.first_frame_at = None
+        self.exited_at = None
+        self.returncode = None
+
+    @property
+    def running(self):
+        return self.exited_at is None
+
+    @property
+    def launch_latency(self):
+        return self.started_at - self.requested_at
+
+    @property
+    def time_to_first_frame(self):
+        if self.first_frame_at is None:
+            return None
+        return self.first_frame_at - self.requested_at
+
+    @property
+    def lifetime(self):
+        end = time.monotonic() if self.exited_at is None else self.exited_at
+        return end - self.started_at
+
+
+def _report_first_frame(frame_fd):
+    # Wrap display.flip/update so the first call writes a timestamp to frame_fd
+    import pygame
+
+    originals = {"flip": pygame.display.flip, "update": pygame.display.update}
+
+    def first(name):
+        def call(*args, **kwargs):
+            result = originals[name](*args, **kwargs)
+            pygame.display.flip, pygame.display.update = originals["flip"], originals["update"]
+            os.write(frame_fd, repr(time.monotonic()).encode())
+            os.close(frame_fd)
+            return result
+        return call
+
+    pygame.display.flip, pygame.display.update = first("flip"), first("update")
+
+
+def _run_game(script, args, cwd, frame_fd=None):
+    """Run script as __main__ in this process and return its exit code."""
+    sys.argv = [script] + list(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    if cwd:
+        os.chdir(cwd)
+    if frame_fd is not None:
+        _report_first_frame(frame_fd)
+    mtime, code = _compiled.get(script, (None, None))
+    try:
+        if code is not None and mtime == os.path.getmtime(script):
+            exec(code, {"__name__": "__main__", "__file__": script, "__builtins__": __builtins__})
+        else:
+            runpy.run_path(script, run_name="__main__")
+    except SystemExit as exit:
+        if exit.code is None or isinstance(exit.code, int):
+            return exit.code or 0
+        print(exit.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _warm_up():
+    import pygame
+
+    pygame.font.init()
+    # Fonts come from assets.FONT_INDEX; scanning the system fonts here as
+    # well means a font that isn't in there yet is quick to find in a game
+    pygame.font.SysFont("arial", 12)
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    for name in GAMES:
+        path = os.path.join(GAME_DIR, name)
+        with open(path, "rb") as f:
+            _compiled[path] = (os.path.getmtime(path), compile(f.read(), path, "exec"))
+
+
+def _serve(conn):
+    # The template process: warm up, then fork a game for every request
+    sys.path.insert(0, GAME_DIR)
+    _warm_up()
+    conn.send("ready")
+    events = []
+    frames = {}  # read end of a game's frame pipe -> its pid
+    while True:
+        for ready in wait([conn] + list(frames), REAP_INTERVAL):
+            if ready is conn:
+                try:
+                    message = conn.recv()
+                except EOFError:  # the launcher is gone
+                    return
+                if message[0] == "launch":
+                    _, script, args, cwd = message
+                    read_fd, write_fd = os.pipe()
+                    pid = os.fork()
+                    if pid == 0:
+                        conn.close()
+                        os.close(read_fd)
+                        for fd in frames:
+                            os.close(fd)
+                        code = _run_game(script, args, cwd, write_fd)
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        os._exit(code)
+                    os.close(write_fd)
+                    frames[read_fd] = pid
+                    conn.send(pid)
+                elif message[0] == "poll":
+                    conn.send(events)
+                    events = []
+                elif message[0] == "stop":
+                    return
+            else:
+                data = os.read(ready, 64)
+                if data:
+                    events.append(("first_frame", frames[ready], float(data)))
+                os.close(ready)
+                del frames[ready]
+        # Reap every game that has exited
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            events.append(("exit", pid, os.waitstatus_to_exitcode(status), time.monotonic()))
+
+
+class GameLauncher:
+    """Launches games from a pre-warmed template process and tracks them.
+
+    The template starts in the background when the launcher is made; a
+    launch before it's ready waits for it. With prewarm=False, or without
+    os.fork, every game starts cold in a new interpreter instead.
+    """
+
+    def __init__(self, prewarm=True):
+        self.prewarm = prewarm and CAN_FORK
+        self.games = []
+        self.lock = threading.Lock()
+        self.cold = {}  # pid -> (Popen, frame pipe read end) for cold games
+        if self.prewarm:
+            self.conn, child_conn = multiprocessing.Pipe()
+            # spawn, not fork: the template must not inherit the caller's threads
+            self.template = multiprocessing.get_context("spawn").Process(
+                target=_serve, args=(child_conn,), daemon=True)
+            self.template.start()
+            child_conn.close()
+            self.ready = False
+
+    def _wait_ready(self):
+        if not self.ready:
+            self.conn.recv()
+            self.ready = True
+
+    def launch(self, script, args=(), cwd=None):
+        """Start script (a path) with args and return its GameInstance."""
+        script = os.path.abspath(script)
+        with self.lock:
+            if self.prewarm:
+                self._wait_ready()
+                requested_at = time.monotonic()
+                self.conn.send(("launch", script, tuple(args), cwd))
+                pid = self.conn.recv()
+            else:
+                requested_at = time.monotonic()
+                pid = self._launch_cold(script, args, cwd)
+            game = GameInstance(script, pid, requested_at, time.monotonic())
+            self.games.append(game)
+            return game
+
+    def _launch_cold(self, script, args, cwd):
+        command = [sys.executable, os.path.abspath(__file__), "--run", script] + list(args)
+        if not CAN_FORK:
+            process = subprocess.Popen(command, cwd=cwd)
+            self.cold[process.pid] = (process, None)
+            return process.pid
+        read_fd, write_fd = os.pipe()
+        process = subprocess.Popen(command + ["--frame-fd", str(write_fd)], cwd=cwd, pass_fds=(write_fd,))
+        os.close(write_fd)
+        self.cold[process.pid] = (process, read_fd)
+        return process.pid
+
+    def poll(self):
+        """Pick up first frames and exits since the last call; return the running games."""
+        with self.lock:
+            if self.prewarm:
+                if self.ready or self.conn.poll():
+                    self._wait_ready()
+                    self.conn.send(("poll",))
+                    events = self.conn.recv()
+                else:
+                    events = []
+            else:
+                events = self._poll_cold()
+            by_pid = {game.pid: game for game in self.games if game.running}
+            for event in events:
+                game = by_pid.get(event[1])
+                if game is None:
+                    continue
+                if event[0] == "first_frame":
+                    game.first_frame_at = event[2]
+                else:
+                    game.returncode, game.exited_at = event[2], event[3]
+            return [game for game in self.games if game.running]
+
+    def _poll_cold(self):
+        events = []
+        readers = {fd: pid for pid, (_, fd) in self.cold.items() if fd is not None}
+        for fd in wait(list(readers), 0) if readers else []:
+            data = os.read(fd, 64)
+            if data:
+                events.append(("first_frame", readers[fd], float(data)))
+            os.close(fd)
+            self.cold[readers[fd]] = (self.cold[readers[fd]][0], None)
+        for pid, (process, fd) in list(self.cold.items()):
+            if process.poll() is not None:
+                events.append(("exit", pid, process.returncode, time.monotonic()))
+                if fd is not None:
+                    os.close(fd)
+                del self.cold[pid]
+        return events
+
+    def stop(self, game):
+        """Ask a running game to quit."""
+        with self.lock:
+            if not game.running:
+                return
+            if game.pid in self.cold:
+                self.cold[game.pid][0].terminate()
+            else:
+                os.kill(game.pid, signal.SIGTERM)
+
+    def wait_for_first_frame(self, game, timeout=10.0):
+        """Poll until game has drawn its first frame (or exited); return the time to it."""
+        deadline = time.monotonic() + timeout
+        while game.first_frame_at is None and game.running and time.monotonic() < deadline:
+            self.poll()
+            time.sleep(0.001)
+        return game.time_to_first_frame
+
+    def close(self):
+        """Stop the template. Games that are still running keep running."""
+        with self.lock:
+            if self.prewarm:
+                self.conn.send(("stop",))
+                self.template.join()
+
+
+if __name__ == "__main__":
+    # python launcher.py --run script.py [args...] [--frame-fd N]: how cold launches start
+    if len(sys.argv) < 3 or sys.argv[1] != "--run":
+        sys.exit("usage: python launcher.py --run script.py [args...]")
+    game_args = sys.argv[3:]
+    frame_fd = None
+    if "--frame-fd" in game_args:
+        index = game_args.index("--frame-fd")
+        frame_fd = int(game_args[index + 1])
+        del game_args[index:index + 2]
+    sys.exit(_run_game(sys.argv[2], game_args, None, frame_fd))
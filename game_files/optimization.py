@@ -1,12 +1,11 @@
 import pygame
 import math
-from queue import PriorityQueue
+from dstar_lite import DStarLite
+from pathfinding import AStarSearch, Grid, JumpPointSearch
+from profiler import scope
+from scenes import Scene, run_scene
 
-# Initialize Pygame and set up the window
-pygame.init()
 WIDTH = 600
-WIN = pygame.display.set_mode((WIDTH, WIDTH))
-pygame.display.set_caption("Pathfinding Visualization (A*)")
 
 # Define colors
 RED = (255, 0, 0)         # Start
@@ -23,14 +22,22 @@ ORANGE = (255, 165, 0)    # For start/goal border
 ROWS = 15
 GAP = WIDTH // ROWS  # size of each cube
 
+# Search pacing: the search advances at most this much per frame
+FPS = 60
+EXPANSIONS_PER_FRAME = 3
+SEARCH_BUDGET = 0.008  # seconds
+
+# Search modes cycled with 'm' (D* Lite replanning is always 4-connected)
+SEARCH_MODES = ["A*", "A* 8-connected", "Jump Point Search"]
+
 class Node:
-    def __init__(self, row, col):
+    def __init__(self, row, col, search_grid):
         self.row = row
         self.col = col
         self.x = row * GAP
         self.y = col * GAP
         self.color = WHITE
-        self.neighbors = []
+        self.search_grid = search_grid  # shared barrier bitmap used by the search
         self.prev = None
 
     def get_pos(self):
@@ -48,20 +55,28 @@ class Node:
     def is_goal(self):
         return self.color == GREEN
 
+    def is_path(self):
+        return self.color == BLUE
+
+    # Only these can turn a barrier on or off, so they keep the bitmap in sync
     def reset(self):
         self.color = WHITE
+        self.search_grid.set_barrier(self.row, self.col, False)
 
     def make_start(self):
         self.color = RED
+        self.search_grid.set_barrier(self.row, self.col, False)
 
     def make_closed(self):
         self.color = PURPLE
 
     def make_barrier(self):
         self.color = BLACK
+        self.search_grid.set_barrier(self.row, self.col)
 
     def make_goal(self):
         self.color = GREEN
+        self.search_grid.set_barrier(self.row, self.col, False)
 
     def make_path(self):
         self.color = BLUE
@@ -69,44 +84,25 @@ class Node:
     def draw(self, win):
         pygame.draw.rect(win, self.color, (self.x, self.y, GAP, GAP))
 
-    def update_neighbors(self, grid):
-        self.neighbors = []
-        # DOWN
-        if self.row < ROWS - 1 and not grid[self.row + 1][self.col].is_barrier():
-            self.neighbors.append(grid[self.row + 1][self.col])
-        # UP
-        if self.row > 0 and not grid[self.row - 1][self.col].is_barrier():
-            self.neighbors.append(grid[self.row - 1][self.col])
-        # RIGHT
-        if self.col < ROWS - 1 and not grid[self.row][self.col + 1].is_barrier():
-            self.neighbors.append(grid[self.row][self.col + 1])
-        # LEFT
-        if self.col > 0 and not grid[self.row][self.col - 1].is_barrier():
-            self.neighbors.append(grid[self.row][self.col - 1])
-
     def __lt__(self, other):
         return False
 
-def heuristic(a, b):
-    # Using Manhattan distance as the heuristic
-    x1, y1 = a
-    x2, y2 = b
-    return abs(x1 - x2) + abs(y1 - y2)
-
-def reconstruct_path(came_from, current, draw):
-    while current in came_from:
-        current = came_from[current]
-        current.make_path()
-        draw()
+def reconstruct_path(grid, path):
+    # Colour the cells between start and goal and return them for redrawing
+    nodes = [grid[row][col] for row, col in path[1:-1]]
+    for node in nodes:
+        node.make_path()
+    return nodes
 
 def make_grid():
+    search_grid = Grid(ROWS)
     grid = []
     for i in range(ROWS):
         grid.append([])
         for j in range(ROWS):
-            node = Node(i, j)
+            node = Node(i, j, search_grid)
             grid[i].append(node)
-    return grid
+    return grid, search_grid
 
 def draw_grid(win):
     for i in range(ROWS):
@@ -120,7 +116,41 @@ def draw(win, grid):
             node.draw(win)
 
     draw_grid(win)
-    pygame.display.update()
+
+def draw_nodes(win, nodes):
+    # Repaint only the given nodes (with their grid lines) and return their rects
+    rects = []
+    for node in nodes:
+        node.draw(win)
+        pygame.draw.line(win, GREY, (node.x, node.y), (node.x + GAP, node.y))
+        pygame.draw.line(win, GREY, (node.x, node.y), (node.x, node.y + GAP))
+        rects.append(pygame.Rect(node.x, node.y, GAP, GAP))
+    return rects
+
+def clear_marks(grid):
+    # Drop closed/path colours from an earlier search, keeping start, goal and barriers
+    for row in grid:
+        for node in row:
+            if node.is_closed() or node.is_path():
+                node.reset()
+
+def replan(grid, planner, node):
+    # Repair the D* Lite tree after one cell changed and redraw the new path
+    planner.update_cell(node.row, node.col)
+    clear_marks(grid)
+    path = planner.compute_path()
+    if path:
+        reconstruct_path(grid, path)
+
+def make_search(search_grid, start, goal, mode):
+    if mode == "Jump Point Search":
+        return JumpPointSearch(search_grid, start.get_pos(), goal.get_pos())
+    return AStarSearch(search_grid, start.get_pos(), goal.get_pos(), diagonal=mode == "A* 8-connected")
+
+def update_caption(mode, replanning):
+    if replanning:
+        mode = "D* Lite replanning"
+    pygame.display.set_caption(f"Pathfinding Visualization ({mode})")
 
 def get_clicked_pos(pos):
     x, y = pos
@@ -128,108 +158,123 @@ def get_clicked_pos(pos):
     col = y // GAP
     return row, col
 
-def a_star(draw, grid, start, goal):
-    count = 0
-    open_set = PriorityQueue()
-    open_set.put((0, count, start))
-    came_from = {}
-
-    g_score = {node: float("inf") for row in grid for node in row}
-    g_score[start] = 0
+class OptimizationScene(Scene):
+    size = (WIDTH, WIDTH)
+    caption = "Pathfinding Visualization (A*)"
+    fps = FPS
 
-    f_score = {node: float("inf") for row in grid for node in row}
-    f_score[start] = heuristic(start.get_pos(), goal.get_pos())
+    def enter(self, manager):
+        super().enter(manager)
+        self.grid, self.search_grid = make_grid()
 
-    open_set_hash = {start}
+        self.start = None
+        self.goal = None
+        self.search = None  # running AStarSearch, advanced a slice per frame
+        self.mode = SEARCH_MODES[0]
+        self.replanning = False  # 'd' toggles D* Lite mode: edits repair the path live
+        self.planner = None
 
-    while not open_set.empty():
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
+        self.redraw = True
+        self.dirty = []  # nodes the search changed this frame
 
-        current = open_set.get()[2]
-        open_set_hash.remove(current)
-
-        if current == goal:
-            reconstruct_path(came_from, goal, draw)
-            goal.make_goal()
-            start.make_start()
-            return True
-
-        for neighbor in current.neighbors:
-            temp_g_score = g_score[current] + 1  # assume each step has cost 1
-
-            if temp_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = temp_g_score
-                f_score[neighbor] = temp_g_score + heuristic(neighbor.get_pos(), goal.get_pos())
-                if neighbor not in open_set_hash:
-                    count += 1
-                    open_set.put((f_score[neighbor], count, neighbor))
-                    open_set_hash.add(neighbor)
-                    # Removed neighbor.make_open() so it doesn't turn yellow
-
-        draw()
-
-        if current != start:
-            current.make_closed()
-    return False
-
-def main(win):
-    grid = make_grid()
-
-    start = None
-    goal = None
-
-    run = True
-
-    while run:
-        draw(win, grid)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                run = False
+    def update(self, dt, events):
+        grid = self.grid
+        for event in events:
+            # The window needs drawing again, e.g. after the profiler HUD goes away
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                self.redraw = True
 
             # Left mouse button to set start, goal, or barriers
-            if pygame.mouse.get_pressed()[0]:
+            if self.search is None and pygame.mouse.get_pressed()[0]:
                 pos = pygame.mouse.get_pos()
                 row, col = get_clicked_pos(pos)
                 node = grid[row][col]
-                if not start and node != goal:
-                    start = node
-                    start.make_start()
-                elif not goal and node != start:
-                    goal = node
-                    goal.make_goal()
-                elif node != start and node != goal:
+                if not self.start and node != self.goal:
+                    self.start = node
+                    self.start.make_start()
+                elif not self.goal and node != self.start:
+                    self.goal = node
+                    self.goal.make_goal()
+                elif node != self.start and node != self.goal and not node.is_barrier():
                     node.make_barrier()
+                    if self.planner:
+                        replan(grid, self.planner, node)
+                self.redraw = True
 
             # Right mouse button resets a node
-            elif pygame.mouse.get_pressed()[2]:
+            elif self.search is None and pygame.mouse.get_pressed()[2]:
                 pos = pygame.mouse.get_pos()
                 row, col = get_clicked_pos(pos)
                 node = grid[row][col]
+                was_barrier = node.is_barrier()
                 node.reset()
-                if node == start:
-                    start = None
-                elif node == goal:
-                    goal = None
+                if node == self.start:
+                    self.start = None
+                    self.planner = None
+                elif node == self.goal:
+                    self.goal = None
+                    self.planner = None
+                elif was_barrier and self.planner:
+                    replan(grid, self.planner, node)
+                self.redraw = True
 
             if event.type == pygame.KEYDOWN:
                 # Press SPACE to run the A* algorithm
-                if event.key == pygame.K_SPACE and start and goal:
-                    for row in grid:
-                        for node in row:
-                            node.update_neighbors(grid)
-                    a_star(lambda: draw(win, grid), grid, start, goal)
+                if event.key == pygame.K_SPACE and self.start and self.goal and self.search is None:
+                    if self.replanning:
+                        clear_marks(grid)
+                        self.planner = DStarLite(self.search_grid, self.start.get_pos(), self.goal.get_pos())
+                        path = self.planner.compute_path()
+                        if path:
+                            reconstruct_path(grid, path)
+                        self.redraw = True
+                    else:
+                        clear_marks(grid)
+                        self.redraw = True
+                        self.search = make_search(self.search_grid, self.start, self.goal, self.mode)
+
+                # Press 'd' to switch between A* and D* Lite replanning
+                if event.key == pygame.K_d:
+                    self.replanning = not self.replanning
+                    self.planner = None
+                    update_caption(self.mode, self.replanning)
+
+                # Press 'm' to cycle between 4-connected A*, 8-connected A* and JPS
+                if event.key == pygame.K_m:
+                    self.mode = SEARCH_MODES[(SEARCH_MODES.index(self.mode) + 1) % len(SEARCH_MODES)]
+                    update_caption(self.mode, self.replanning)
 
                 # Press 'c' to clear the grid
                 if event.key == pygame.K_c:
-                    start = None
-                    goal = None
-                    grid = make_grid()
+                    self.start = None
+                    self.goal = None
+                    self.search = None
+                    self.planner = None
+                    self.grid, self.search_grid = make_grid()
+                    grid = self.grid
+                    self.redraw = True
+
+        # Advance the search within this frame's budget
+        self.dirty = []
+        if self.search is not None:
+            with scope("search"):
+                expanded = self.search.step(EXPANSIONS_PER_FRAME, SEARCH_BUDGET)
+            for row, col in expanded:
+                node = grid[row][col]
+                node.make_closed()
+                self.dirty.append(node)
+            if self.search.done:
+                if self.search.path:
+                    self.dirty.extend(reconstruct_path(grid, self.search.path))
+                self.search = None
 
-    pygame.quit()
+    def draw(self, win):
+        # Only repaint what changed unless the whole grid needs it
+        if self.redraw:
+            draw(win, self.grid)
+            self.redraw = False
+            return None
+        return draw_nodes(win, self.dirty)
 
 if __name__ == "__main__":
-    main(WIN)
+    run_scene(OptimizationScene)
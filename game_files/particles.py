@@ -0,0 +1,94 @@
+import numpy as np
+import pygame
+
+# Array-backed particles drawn with one Surface.blits call per frame.
+# Used for calculus.py's trail; blit_sprites() and circle_sprite() also
+# draw vector.py's bullets and targets.
+
+ALPHA_LEVELS = 32  # pre-rendered sprites per particle system, one per alpha step
+
+
+def circle_sprite(radius, color):
+    """A filled circle on a colour-keyed surface, for blit_sprites().
+
+    Colour keys with RLE blit much faster than per-pixel alpha for solid shapes.
+    """
+    key = (255, 0, 255) if tuple(color[:3]) != (255, 0, 255) else (0, 255, 0)
+    sprite = pygame.Surface((2 * radius, 2 * radius))
+    sprite.fill(key)
+    pygame.draw.circle(sprite, color, (radius, radius), radius)
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert()
+    return sprite
+
+
+def blit_sprites(surface, sprites, positions, levels=None):
+    """Draw sprites centred on an (n, 2) array of positions with a single blits call.
+
+    sprites is one surface, or a list of same-sized surfaces picked per
+    position by the matching entry of levels.
+    """
+    if len(positions) == 0:
+        return
+    if levels is None:
+        sprites, levels = [sprites], np.zeros(len(positions), dtype=int)
+    width, height = sprites[0].get_size()
+    corners = (np.asarray(positions) - (width / 2, height / 2)).astype(int)
+    surface.blits(zip(map(sprites.__getitem__, levels.tolist()), corners.tolist()), doreturn=False)
+
+
+class ParticleSystem:
+    """Fixed-capacity ring buffer of fading particles.
+
+    Each particle has a position and a remaining life in seconds; its alpha
+    is life / max_life. Emitting into a full buffer overwrites the oldest
+    particle.
+    """
+
+    def __init__(self, capacity, size, color, max_life=1.0, levels=ALPHA_LEVELS):
+        self.capacity = capacity
+        self.max_life = max_life
+        self.pos = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)
+        self.head = 0  # next slot to write
+
+        self.sprites = []
+        for level in range(levels):
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            sprite.fill((color[0], color[1], color[2], round(255 * (level + 1) / levels)))
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self.sprites.append(sprite)
+
+    def emit(self, pos, life=None):
+        self.pos[self.head] = pos
+        self.life[self.head] = self.max_life if life is None else life
+        self.head = (self.head + 1) % self.capacity
+
+    def emit_many(self, positions, life=None):
+        positions = np.asarray(positions, dtype=float)[-self.capacity:]
+        slots = (self.head + np.arange(len(positions))) % self.capacity
+        self.pos[slots] = positions
+        self.life[slots] = self.max_life if life is None else life
+        self.head = (self.head + len(positions)) % self.capacity
+
+    def update(self, dt):
+        self.life -= dt
+
+    def alive(self):
+        """Indices of the live particles, oldest first."""
+        order = (self.head + np.arange(self.capacity)) % self.capacity
+        return order[self.life[order] > 0]
+
+    def __len__(self):
+        return int(np.count_nonzero(self.life > 0))
+
+    def clear(self):
+        self.life[:] = 0
+
+    def draw(self, surface):
+        live = self.alive()
+        levels = np.minimum(self.life[live] / self.max_life, 1) * len(self.sprites)
+        levels = np.maximum(np.ceil(levels).astype(int) - 1, 0)
+        blit_sprites(surface, self.sprites, self.pos[live], levels)
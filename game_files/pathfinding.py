@@ -0,0 +1,451 @@
+import heapq
+import math
+import time
+from array import array
+
+# Headless pathfinding engine used by optimization.py.
+# The grid is stored as flat arrays indexed by row * cols + col, so nothing
+# here needs pygame and large maps (thousands of cells per side) stay cheap.
+
+INF = float("inf")
+SQRT2 = math.sqrt(2)
+
+
+class Grid:
+    def __init__(self, rows, cols=None):
+        self.rows = rows
+        self.cols = rows if cols is None else cols
+        self.barrier = bytearray(self.rows * self.cols)  # 1 = blocked
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def get_pos(self, index):
+        return divmod(index, self.cols)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def is_barrier(self, row, col):
+        return self.barrier[row * self.cols + col] == 1
+
+    def set_barrier(self, row, col, blocked=True):
+        self.barrier[row * self.cols + col] = 1 if blocked else 0
+
+    def is_open(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and not self.barrier[row * self.cols + col]
+
+    def neighbors(self, row, col, diagonal=False):
+        """Open neighbours of a cell, read from the barrier bitmap.
+
+        With diagonal=True the four diagonal moves are added, but only where
+        both cells beside the diagonal are open (no cutting corners).
+        """
+        is_open = self.is_open
+        # DOWN, UP, RIGHT, LEFT
+        result = [(n_row, n_col) for n_row, n_col in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1))
+                  if is_open(n_row, n_col)]
+        if diagonal:
+            for d_row, d_col in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                if is_open(row + d_row, col + d_col) and is_open(row + d_row, col) and is_open(row, col + d_col):
+                    result.append((row + d_row, col + d_col))
+        return result
+
+    def clear(self):
+        self.barrier = bytearray(self.rows * self.cols)
+
+
+def heuristic(a, b):
+    # Using Manhattan distance as the heuristic
+    x1, y1 = a
+    x2, y2 = b
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+def octile(a, b):
+    # Exact distance on an open 8-connected grid where diagonals cost sqrt(2)
+    dx = abs(a[0] - b[0])
+    dy = abs(a[1] - b[1])
+    return dx + dy + (SQRT2 - 2) * min(dx, dy)
+
+
+def _octile_entry(g, h, count, index):
+    # Sums of sqrt(2) drift in the last bits, so round f and h before they are
+    # compared; otherwise equal-cost cells stop tying and open maps flood-fill.
+    return (round(g + h, 6), round(h, 6), count, index)
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+class AStarSearch:
+    """Resumable A* search over a Grid.
+
+    The search advances in slices through step(), so a renderer can spend a
+    fixed budget per frame and repaint only the cells that changed.
+    heuristic, if given, maps a cell index to an admissible estimate of its
+    distance to the goal (see landmarks.py); the default is Manhattan, or
+    octile distance when diagonal=True allows 8-connected moves. With
+    diagonal=True a custom heuristic must not overestimate the octile cost
+    of a path, or the path found is no longer the shortest. The heuristics
+    in landmarks.py are 4-connected step counts, which do overestimate, so
+    they only suit the default 4-connected search.
+    """
+
+    def __init__(self, grid, start, goal, heuristic=None, diagonal=False):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.diagonal = diagonal
+        self.path = None
+        self.done = False
+        self.expanded = 0
+        self._steps = self._make_steps()
+
+    def step(self, max_expansions=None, max_time=None):
+        """Expand up to max_expansions cells or for max_time seconds.
+
+        Returns the (row, col) cells closed during this slice. Once the search
+        is finished, done is True and path holds the result (None if the goal
+        is unreachable).
+        """
+        closed = []
+        if self.done:
+            return closed
+        deadline = None if max_time is None else time.perf_counter() + max_time
+        cols = self.grid.cols
+        for index in self._steps:
+            closed.append(divmod(index, cols))
+            if max_expansions is not None and len(closed) >= max_expansions:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return closed
+
+    def run(self):
+        """Finish the search without a budget and return the path."""
+        for _ in self._steps:
+            pass
+        return self.path
+
+    def _make_steps(self):
+        return self._search_octile() if self.diagonal else self._search()
+
+    def _trace(self, came_from, start_index, current):
+        path = [current]
+        while current != start_index:
+            current = came_from[current]
+            path.append(current)
+        path.reverse()
+        return [divmod(index, self.grid.cols) for index in path]
+
+    def _search(self):
+        # Generator that yields the index of every expanded cell except the
+        # start, and stores the path on self when it returns.
+        grid = self.grid
+        rows, cols = grid.rows, grid.cols
+        barrier = grid.barrier
+        size = rows * cols
+        goal_row, goal_col = self.goal
+        start_index = self.start[0] * cols + self.start[1]
+        goal_index = goal_row * cols + goal_col
+
+        g_score = array("d", [INF]) * size
+        came_from = array("i", [-1]) * size
+        closed = bytearray(size)
+
+        estimate = self.heuristic
+        g_score[start_index] = 0
+        h = heuristic(self.start, self.goal) if estimate is None else estimate(start_index)
+        # Entries are (f, h, count, index): ties on f go to the cell nearest the
+        # goal, then to the oldest entry. Stale entries are skipped when popped.
+        count = 0
+        open_set = [(h, h, count, start_index)]
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        try:
+            while open_set:
+                current = pop(open_set)[3]
+                if closed[current]:
+                    continue
+                closed[current] = 1
+                self.expanded += 1
+
+                if current == goal_index:
+                    self.path = self._trace(came_from, start_index, current)
+                    return
+
+                if current != start_index:
+                    yield current
+
+                row, col = divmod(current, cols)
+                temp_g_score = g_score[current] + 1  # assume each step has cost 1
+                # DOWN, UP, RIGHT, LEFT - same order as Grid.neighbors
+                for neighbor, n_row, n_col, valid in (
+                    (current + cols, row + 1, col, row < rows - 1),
+                    (current - cols, row - 1, col, row > 0),
+                    (current + 1, row, col + 1, col < cols - 1),
+                    (current - 1, row, col - 1, col > 0),
+                ):
+                    if not valid or barrier[neighbor] or temp_g_score >= g_score[neighbor]:
+                        continue
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    if estimate is None:
+                        h = abs(n_row - goal_row) + abs(n_col - goal_col)
+                    else:
+                        h = estimate(neighbor)
+                    count += 1
+                    push(open_set, (temp_g_score + h, h, count, neighbor))
+        finally:
+            self.done = True
+
+    def _search_octile(self):
+        # Same as _search, but over 8-connected moves where diagonals cost sqrt(2)
+        grid = self.grid
+        cols = grid.cols
+        size = grid.rows * cols
+        start_index = grid.index(*self.start)
+        goal_index = grid.index(*self.goal)
+
+        g_score = array("d", [INF]) * size
+        came_from = array("i", [-1]) * size
+        closed = bytearray(size)
+
+        estimate = self.heuristic
+        g_score[start_index] = 0
+        h = octile(self.start, self.goal) if estimate is None else estimate(start_index)
+        count = 0
+        open_set = [(h, h, count, start_index)]
+
+        try:
+            while open_set:
+                current = heapq.heappop(open_set)[3]
+                if closed[current]:
+                    continue
+                closed[current] = 1
+                self.expanded += 1
+
+                if current == goal_index:
+                    self.path = self._trace(came_from, start_index, current)
+                    return
+
+                if current != start_index:
+                    yield current
+
+                row, col = divmod(current, cols)
+                for n_row, n_col in grid.neighbors(row, col, diagonal=True):
+                    neighbor = n_row * cols + n_col
+                    step = SQRT2 if n_row != row and n_col != col else 1
+                    temp_g_score = g_score[current] + step
+                    if temp_g_score >= g_score[neighbor]:
+                        continue
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    h = octile((n_row, n_col), self.goal) if estimate is None else estimate(neighbor)
+                    count += 1
+                    heapq.heappush(open_set, _octile_entry(temp_g_score, h, count, neighbor))
+        finally:
+            self.done = True
+
+
+class JumpPointSearch(AStarSearch):
+    """Jump Point Search (Harabor & Grastien) on an 8-connected grid.
+
+    Straight and diagonal runs through open areas are skipped in one jump, so
+    only jump points are expanded (and reported by step()). The final path is
+    filled back in cell by cell and is as short as octile A* finds.
+    """
+
+    def __init__(self, grid, start, goal):
+        super().__init__(grid, start, goal, diagonal=True)
+
+    def _make_steps(self):
+        return self._search_jump_points()
+
+    def _jump(self, row, col, d_row, d_col):
+        # Walk from (row, col) in direction (d_row, d_col) until a jump point
+        # (goal or a cell with a forced neighbour) is found, or return None.
+        if not (d_row and d_col):
+            return self._jump_straight(row, col, d_row, d_col)
+        is_open = self.grid.is_open
+        goal = self.goal
+        while True:
+            row += d_row
+            col += d_col
+            if not is_open(row, col):
+                return None
+            if (row, col) == goal:
+                return row, col
+            if self._jump_straight(row, col, d_row, 0) or self._jump_straight(row, col, 0, d_col):
+                return row, col
+            if not (is_open(row + d_row, col) and is_open(row, col + d_col)):
+                return None
+
+    def _jump_straight(self, row, col, d_row, d_col):
+        # Straight runs are scanned with bytearray.find instead of cell by cell.
+        # Rows are contiguous in grid.barrier and columns in self._columns, so
+        # both directions become a scan along one line of `length` cells.
+        if d_row:
+            data, length, lines = self._columns, self.grid.rows, self.grid.cols
+            line, pos, step = col, row, d_row
+            goal_line, goal_pos = self.goal[1], self.goal[0]
+        else:
+            data, length, lines = self.grid.barrier, self.grid.cols, self.grid.rows
+            line, pos, step = row, col, d_col
+            goal_line, goal_pos = self.goal
+        base = line * length
+        side_lines = [side * length for side in (line - 1, line + 1) if 0 <= side < lines]
+
+        if step > 0:
+            blocked = data.find(1, base + pos + 1, base + length)
+            last = (length if blocked == -1 else blocked - base) - 1
+            if last <= pos:
+                return None
+            stop = goal_pos if goal_line == line and pos < goal_pos <= last else None
+            # Forced neighbour: beside the run, a blocked cell followed by an open one
+            for side in side_lines:
+                found = data.find(b"\x01\x00", side + pos, side + last + 1)
+                if found != -1 and (stop is None or found - side + 1 < stop):
+                    stop = found - side + 1
+        else:
+            blocked = data.rfind(1, base, base + pos)
+            first = 0 if blocked == -1 else blocked - base + 1
+            if first >= pos:
+                return None
+            stop = goal_pos if goal_line == line and first <= goal_pos < pos else None
+            for side in side_lines:
+                found = data.rfind(b"\x00\x01", side + first, side + pos + 1)
+                if found != -1 and (stop is None or found - side > stop):
+                    stop = found - side
+
+        if stop is None:
+            return None
+        return (stop, col) if d_row else (row, stop)
+
+    def _directions(self, row, col, parent):
+        # Pruned set of directions to jump in, given where we came from
+        is_open = self.grid.is_open
+        if parent is None:
+            return [(n_row - row, n_col - col) for n_row, n_col in self.grid.neighbors(row, col, diagonal=True)]
+        d_row = _sign(row - parent[0])
+        d_col = _sign(col - parent[1])
+        directions = []
+        if d_row and d_col:
+            ahead_row = is_open(row + d_row, col)
+            ahead_col = is_open(row, col + d_col)
+            if ahead_row:
+                directions.append((d_row, 0))
+            if ahead_col:
+                directions.append((0, d_col))
+            if ahead_row and ahead_col:
+                directions.append((d_row, d_col))
+        elif d_row:
+            ahead = is_open(row + d_row, col)
+            for side in (1, -1):
+                if is_open(row, col + side):
+                    if ahead:
+                        directions.append((d_row, side))
+                    directions.append((0, side))
+            if ahead:
+                directions.append((d_row, 0))
+        else:
+            ahead = is_open(row, col + d_col)
+            for side in (1, -1):
+                if is_open(row + side, col):
+                    if ahead:
+                        directions.append((side, d_col))
+                    directions.append((side, 0))
+            if ahead:
+                directions.append((0, d_col))
+        return directions
+
+    def _search_jump_points(self):
+        grid = self.grid
+        size = grid.rows * grid.cols
+        # Column-major copy of the bitmap so vertical runs can be scanned too
+        self._columns = bytearray(size)
+        for col in range(grid.cols):
+            self._columns[col * grid.rows:(col + 1) * grid.rows] = grid.barrier[col::grid.cols]
+        start_index = grid.index(*self.start)
+        goal_index = grid.index(*self.goal)
+
+        g_score = array("d", [INF]) * size
+        came_from = array("i", [-1]) * size
+        closed = bytearray(size)
+
+        g_score[start_index] = 0
+        h = octile(self.start, self.goal)
+        count = 0
+        open_set = [(h, h, count, start_index)]
+
+        try:
+            while open_set:
+                current = heapq.heappop(open_set)[3]
+                if closed[current]:
+                    continue
+                closed[current] = 1
+                self.expanded += 1
+
+                if current == goal_index:
+                    self.path = self._fill(self._trace(came_from, start_index, current))
+                    return
+
+                if current != start_index:
+                    yield current
+
+                pos = grid.get_pos(current)
+                parent = None if current == start_index else grid.get_pos(came_from[current])
+                for d_row, d_col in self._directions(pos[0], pos[1], parent):
+                    jump_point = self._jump(pos[0], pos[1], d_row, d_col)
+                    if jump_point is None:
+                        continue
+                    neighbor = grid.index(*jump_point)
+                    if closed[neighbor]:
+                        continue
+                    temp_g_score = g_score[current] + octile(pos, jump_point)
+                    if temp_g_score >= g_score[neighbor]:
+                        continue
+                    came_from[neighbor] = current
+                    g_score[neighbor] = temp_g_score
+                    h = octile(jump_point, self.goal)
+                    count += 1
+                    heapq.heappush(open_set, _octile_entry(temp_g_score, h, count, neighbor))
+        finally:
+            self.done = True
+
+    def _fill(self, jump_points):
+        # Expand the straight/diagonal runs between jump points into single steps
+        path = [jump_points[0]]
+        for row, col in jump_points[1:]:
+            last_row, last_col = path[-1]
+            d_row = _sign(row - last_row)
+            d_col = _sign(col - last_col)
+            while path[-1] != (row, col):
+                last_row += d_row
+                last_col += d_col
+                path.append((last_row, last_col))
+        return path
+
+
+def a_star(grid, start, goal, heuristic=None, diagonal=False):
+    """Find a shortest path from start to goal on a Grid.
+
+    start and goal are (row, col) tuples. Returns the path as a list of
+    (row, col) from start to goal, or None if the goal is unreachable.
+    Moves are 4-connected unless diagonal=True.
+    """
+    return AStarSearch(grid, start, goal, heuristic, diagonal).run()
+
+
+def jump_point_search(grid, start, goal):
+    """Like a_star(..., diagonal=True) but with Jump Point Search."""
+    return JumpPointSearch(grid, start, goal).run()
+
+
+def path_cost(path):
+    """Length of a path, counting diagonal steps as sqrt(2)."""
+    return sum(SQRT2 if a[0] != b[0] and a[1] != b[1] else 1 for a, b in zip(path, path[1:]))
@@ -1,14 +1,12 @@
 import pygame
 import random
 import sys
+import time
+from backgrounds import draw_gradient
+from dice import is_win
+from scenes import Scene, run_scene
 
-# Initialize Pygame
-pygame.init()
 WIDTH, HEIGHT = 600, 400
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("7 Up 7 Down")
-font = pygame.font.SysFont("arial", 36)
-big_font = pygame.font.SysFont("arial", 48, bold=True)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,110 +19,189 @@ BUTTON_HIGHLIGHT = (255, 255, 160)
 RESULT_GREEN = (34, 177, 76)
 RESULT_RED = (200, 0, 0)
 
-# Load dice images
-dice_images = [pygame.image.load(f"dice{i}.png") for i in range(1, 7)]
-dice_images = [pygame.transform.scale(img, (64, 64)) for img in dice_images]
+RESULT_Y = 260
+DICE_AREA = pygame.Rect(WIDTH // 2 - 100, 100, 194, 64)
 
-# Button class
+# By default the game sleeps in pygame.event.wait and only redraws the parts
+# of the window an input changed. python prob.py --continuous redraws the
+# whole window every pass instead, like the game used to; --latency prints
+# how long each input took to reach the display.
+CONTINUOUS = "--continuous" in sys.argv
+REPORT_LATENCY = "--latency" in sys.argv
+
+# Button class. Both looks (plain and selected) are rendered once and blitted.
 class Button:
-    def __init__(self, x, y, w, h, text):
+    def __init__(self, x, y, w, h, text, font):
         self.rect = pygame.Rect(x, y, w, h)
         self.text = text
         self.selected = False
+        self.images = {selected: self.render(selected, font) for selected in (False, True)}
+
+    def render(self, selected, font):
+        image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local = image.get_rect()
+        color = BUTTON_HIGHLIGHT if selected else BUTTON_COLOR
+        pygame.draw.rect(image, color, local, border_radius=12)
+        pygame.draw.rect(image, BUTTON_BORDER, local, 2, border_radius=12)
+        txt = font.render(self.text, True, BLACK)
+        image.blit(txt, txt.get_rect(center=local.center))
+        return image.convert_alpha()
 
     def draw(self, surface):
-        color = BUTTON_HIGHLIGHT if self.selected else BUTTON_COLOR
-        pygame.draw.rect(surface, color, self.rect, border_radius=12)
-        pygame.draw.rect(surface, BUTTON_BORDER, self.rect, 2, border_radius=12)
-        txt = font.render(self.text, True, BLACK)
-        text_rect = txt.get_rect(center=self.rect.center)
-        surface.blit(txt, text_rect)
+        surface.blit(self.images[self.selected], self.rect)
 
     def is_clicked(self, pos):
         return self.rect.collidepoint(pos)
 
-# Create buttons
-buttons = {
-    "7 Down": Button(50, 300, 120, 50, "7 Down"),
-    "7": Button(240, 300, 120, 50, "7"),
-    "7 Up": Button(430, 300, 120, 50, "7 Up"),
-}
-roll_button = Button(240, 200, 120, 50, "Roll")
-
-result = ""
-player_guess = ""
-dice = (0, 0)
-
-# Function to draw gradient background
+# Function to draw gradient background (built once, see backgrounds.py)
 def draw_background(surface):
-    for y in range(HEIGHT):
-        r = int(SOFT_BLUE[0] + (SOFT_PINK[0] - SOFT_BLUE[0]) * y / HEIGHT)
-        g = int(SOFT_BLUE[1] + (SOFT_PINK[1] - SOFT_BLUE[1]) * y / HEIGHT)
-        b = int(SOFT_BLUE[2] + (SOFT_PINK[2] - SOFT_BLUE[2]) * y / HEIGHT)
-        pygame.draw.line(surface, (r, g, b), (0, y), (WIDTH, y))
-
-# Game loop
-running = True
-while running:
-    draw_background(screen)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            pos = event.pos
-            for key, btn in buttons.items():
-                if btn.is_clicked(pos):
-                    player_guess = key
-                    result = ""
-                    dice = (0, 0)
-                    for b in buttons.values():
-                        b.selected = False
-                    btn.selected = True
-
-            if roll_button.is_clicked(pos) and player_guess:
-                die1 = random.randint(1, 6)
-                die2 = random.randint(1, 6)
-                total = die1 + die2
-                dice = (die1, die2)
-
-                if total == 7 and player_guess == "7":
-                    result = "You Win!"
-                elif total < 7 and player_guess == "7 Down":
-                    result = "You Win!"
-                elif total > 7 and player_guess == "7 Up":
-                    result = "You Win!"
-                else:
-                    result = "You Lose!"
-
-    # Draw buttons
-    for btn in buttons.values():
-        btn.draw(screen)
-    roll_button.draw(screen)
-
-    # Show title
-    title = big_font.render("🎲 7 Up 7 Down 🎲", True, BLACK)
-    screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
-
-    # Show dice images
-    if dice != (0, 0):
-        img1 = dice_images[dice[0] - 1]
-        img2 = dice_images[dice[1] - 1]
-        screen.blit(img1, (WIDTH // 2 - 100, 100))
-        screen.blit(img2, (WIDTH // 2 + 30, 100))
-
-    # Show result with drop shadow
-    if result:
-        color = RESULT_GREEN if "Win" in result else RESULT_RED
-        shadow = font.render(result, True, BLACK)
-        res_txt = font.render(result, True, color)
-        x = WIDTH // 2 - res_txt.get_width() // 2
-        y = 260
-        screen.blit(shadow, (x + 2, y + 2))
-        screen.blit(res_txt, (x, y))
-
-    pygame.display.flip()
-
-pygame.quit()
-sys.exit()
+    draw_gradient(surface, SOFT_BLUE, SOFT_PINK)
+
+def result_pos(res_txt):
+    return WIDTH // 2 - res_txt.get_width() // 2, RESULT_Y
+
+def report_latency(latencies):
+    if not latencies:
+        print("no input handled")
+        return
+    ordered = sorted(latencies)
+    print(f"input to display over {len(ordered)} inputs: "
+          f"mean {sum(ordered) / len(ordered) * 1000:.3f} ms  "
+          f"p50 {ordered[len(ordered) // 2] * 1000:.3f} ms  "
+          f"p95 {ordered[int(len(ordered) * 0.95)] * 1000:.3f} ms  "
+          f"max {ordered[-1] * 1000:.3f} ms")
+
+class ProbScene(Scene):
+    size = (WIDTH, HEIGHT)
+    caption = "7 Up 7 Down"
+    wait_for_events = not CONTINUOUS
+    fps = 0  # --continuous redraws as fast as it can, as the game used to
+
+    def enter(self, manager):
+        super().enter(manager)
+        assets = manager.assets
+        font = assets.font("arial", 36)
+        big_font = assets.font("arial", 48, bold=True)
+
+        # Load dice images (from images/, whatever the working directory)
+        self.dice_images = [assets.image(f"dice{i}.png", (64, 64)) for i in range(1, 7)]
+
+        # Create buttons
+        self.buttons = {
+            "7 Down": Button(50, 300, 120, 50, "7 Down", font),
+            "7": Button(240, 300, 120, 50, "7", font),
+            "7 Up": Button(430, 300, 120, 50, "7 Up", font),
+        }
+        self.roll_button = Button(240, 200, 120, 50, "Roll", font)
+
+        self.result = ""
+        self.player_guess = ""
+        self.dice = (0, 0)
+
+        # Text that never changes is rendered once
+        self.title = big_font.render("🎲 7 Up 7 Down 🎲", True, BLACK)
+        self.title_pos = (WIDTH // 2 - self.title.get_width() // 2, 20)
+
+        # Result text and its drop shadow, rendered once per result
+        self.result_images = {}
+        for text in ("You Win!", "You Lose!"):
+            color = RESULT_GREEN if "Win" in text else RESULT_RED
+            self.result_images[text] = font.render(text, True, BLACK), font.render(text, True, color)
+        result_rects = [res_txt.get_rect(topleft=result_pos(res_txt)) for _, res_txt in self.result_images.values()]
+        self.result_area = result_rects[0].unionall(result_rects[1:]).inflate(4, 4)  # room for the shadow
+
+        # Regions to redraw on the next draw(); None means the whole window
+        self.dirty = None
+        self.received = None  # when the input behind the last redraw was read
+        self.latencies = []
+        if self.wait_for_events:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def record_latency(self):
+        # The redraw for the input read at self.received has reached the display by now
+        shown = self.manager.displayed_at
+        if self.received is not None and shown is not None and shown >= self.received:
+            self.latencies.append(shown - self.received)
+            self.received = None
+
+    def update(self, dt, events):
+        self.record_latency()
+        dirty = []
+
+        for event in events:
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                dirty.append(pygame.Rect(0, 0, WIDTH, HEIGHT))
+
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                pos = event.pos
+                for key, btn in self.buttons.items():
+                    if btn.is_clicked(pos):
+                        self.player_guess = key
+                        self.result = ""
+                        self.dice = (0, 0)
+                        for b in self.buttons.values():
+                            if b.selected:
+                                dirty.append(b.rect)
+                            b.selected = False
+                        btn.selected = True
+                        dirty += [btn.rect, DICE_AREA, self.result_area]
+
+                if self.roll_button.is_clicked(pos) and self.player_guess:
+                    die1 = random.randint(1, 6)
+                    die2 = random.randint(1, 6)
+                    total = die1 + die2
+                    self.dice = (die1, die2)
+
+                    # Same rules as the odds in dice.py
+                    self.result = "You Win!" if is_win(self.player_guess, total) else "You Lose!"
+                    dirty += [DICE_AREA, self.result_area]
+
+        if dirty:
+            self.received = time.perf_counter()
+        if self.wait_for_events:
+            self.dirty = dirty
+
+    def draw_scene(self, surface):
+        draw_background(surface)
+
+        # Draw buttons
+        for btn in self.buttons.values():
+            btn.draw(surface)
+        self.roll_button.draw(surface)
+
+        # Show title
+        surface.blit(self.title, self.title_pos)
+
+        # Show dice images
+        if self.dice != (0, 0):
+            img1 = self.dice_images[self.dice[0] - 1]
+            img2 = self.dice_images[self.dice[1] - 1]
+            surface.blit(img1, (WIDTH // 2 - 100, 100))
+            surface.blit(img2, (WIDTH // 2 + 30, 100))
+
+        # Show result with drop shadow
+        if self.result:
+            shadow, res_txt = self.result_images[self.result]
+            x, y = result_pos(res_txt)
+            surface.blit(shadow, (x + 2, y + 2))
+            surface.blit(res_txt, (x, y))
+
+    def draw(self, surface):
+        if self.dirty is None:
+            self.draw_scene(surface)
+            return None
+        # Draw the scene again inside the dirty rects only; just those are pushed to the display
+        for rect in self.dirty:
+            surface.set_clip(rect)
+            self.draw_scene(surface)
+        surface.set_clip(None)
+        return self.dirty
+
+    def exit(self):
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
+        self.record_latency()
+        if REPORT_LATENCY:
+            report_latency(self.latencies)
+
+if __name__ == "__main__":
+    run_scene(ProbScene)
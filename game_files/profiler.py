@@ -0,0 +1,154 @@
+import json
+import os
+import time
+from collections import deque
+
+# Where the frame time goes. Code wraps its work in named scopes:
+#
+#     with profiler.scope("collision"):
+#         ...
+#
+# SceneManager times events, update, render and flip around every scene and
+# draws table() on top of the game, and the games add their own scopes
+# inside those (collision in vector_sim.py, search in optimization.py, trail
+# in calculus.py). Each scope keeps its time per frame over the last WINDOW
+# frames for the percentiles, and every scope call can be kept as a Chrome
+# trace event (chrome://tracing or https://ui.perfetto.dev) to look at
+# afterwards. Nothing here needs pygame, so headless code can be timed too.
+#
+# Switched off, scope() hands back one shared object that does nothing, so
+# instrumented code costs a method call and an empty with block.
+
+WINDOW = 300  # frames kept per scope for the percentiles
+MAX_TRACE_EVENTS = 1_000_000  # past this the trace stops growing
+PERCENTILES = (0.50, 0.95, 0.99)
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter())
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameProfiler:
+    def __init__(self, window=WINDOW):
+        self.enabled = False
+        self.tracing = False
+        self.history = {}  # scope name -> deque of seconds per frame it ran in
+        self.window = window
+        self.frame = {}  # scope name -> seconds so far this frame
+        self.frame_started = None
+        self.trace = []  # (name, start, end) with perf_counter() times
+        self.origin = time.perf_counter()
+
+    def start(self, trace=False):
+        self.enabled = True
+        self.tracing = self.tracing or trace
+
+    def stop(self):
+        """Stop timing; the trace collected so far is kept for save_trace."""
+        self.enabled = False
+        self.frame_started = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name, start, end):
+        self.frame[name] = self.frame.get(name, 0.0) + end - start
+        if self.tracing and len(self.trace) < MAX_TRACE_EVENTS:
+            self.trace.append((name, start, end))
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_started = time.perf_counter()
+            self.frame = {}
+
+    def end_frame(self):
+        if self.frame_started is None:
+            return
+        self.add("frame", self.frame_started, time.perf_counter())
+        for name, seconds in self.frame.items():
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+            self.history[name].append(seconds)
+        self.frame_started = None
+
+    def mark(self, name):
+        """An instant event in the trace, e.g. a scene switch."""
+        if self.tracing and len(self.trace) < MAX_TRACE_EVENTS:
+            now = time.perf_counter()
+            self.trace.append((name, now, None))
+
+    def stats(self):
+        """{scope: (p50, p95, p99)} in seconds over the last window frames, frame first."""
+        names = sorted(self.history, key=lambda name: name != "frame")
+        stats = {}
+        for name in names:
+            ordered = sorted(self.history[name])
+            stats[name] = tuple(percentile(ordered, fraction) for fraction in PERCENTILES)
+        return stats
+
+    def reset(self):
+        """Start the percentiles over, e.g. for a new scene. The trace is kept."""
+        self.history.clear()
+
+    def table(self):
+        """stats() as rows of text cells in milliseconds, under a header row."""
+        rows = [["ms"] + [f"p{round(fraction * 100)}" for fraction in PERCENTILES]]
+        for name, values in self.stats().items():
+            rows.append([name] + [f"{value * 1000:.2f}" for value in values])
+        return rows
+
+    def trace_events(self):
+        """The trace in Chrome's trace event format, times in microseconds."""
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "game"}}]
+        for name, start, end in self.trace:
+            event = {"name": name, "ph": "X", "ts": (start - self.origin) * 1e6, "pid": pid, "tid": 0}
+            if end is None:
+                event.update(ph="i", s="p")
+            else:
+                event["dur"] = (end - start) * 1e6
+            events.append(event)
+        return events
+
+    def save_trace(self, path):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+
+PROFILER = FrameProfiler()
+
+
+def scope(name):
+    """A timing scope on the shared profiler; does nothing while it's off."""
+    return PROFILER.scope(name)
@@ -0,0 +1,259 @@
+import sys
+import time
+
+import pygame
+
+import backgrounds
+from assets import AssetCache
+from profiler import PROFILER
+
+# Runs the games as scenes in one process: one window, one clock and one
+# asset cache shared by all of them. Switching scenes exits the current one,
+# drops the assets only it used and enters the next, without a new process
+# or window.
+#
+# The manager times how long every scene takes to start: from the switch (or
+# from the manager's creation, for the first scene) to its first frame on
+# the display, with how much of that went into enter() and into loading
+# assets. Any game run with --startup prints it.
+#
+# Every frame is timed in scopes (events, update, render, flip; see
+# profiler.py). F12 shows their percentiles on top of the game, and so does
+# --profile from the start. --trace out.json keeps every scope as a trace
+# event and writes them to out.json when the game quits.
+#
+# All three flags are read when the SceneManager is made, not on import:
+# launcher.py imports this module once in its template and sets sys.argv for
+# each game it forks.
+
+PROFILE_KEY = pygame.K_F12
+HUD_INTERVAL = 0.5  # seconds between refreshes of the profiler HUD
+HUD_COLOR = (20, 20, 20)
+HUD_TEXT = (230, 230, 230)
+
+
+class Scene:
+    """One game hosted by SceneManager.
+
+    size, caption and fps are read when the scene is entered. enter() is
+    where a scene loads its assets (through manager.assets) and sets up its
+    state, and exit() is where it lets go of anything else it holds.
+    update() gets the seconds since the last frame and the frame's events.
+    draw() returns None after drawing the whole frame, or a list of the
+    rects it changed. A scene with wait_for_events set is only updated and
+    drawn when an event arrives.
+    """
+
+    size = (800, 600)
+    caption = ""
+    fps = 60
+    wait_for_events = False
+
+    def enter(self, manager):
+        self.manager = manager
+
+    def update(self, dt, events):
+        pass
+
+    def draw(self, surface):
+        return None
+
+    def exit(self):
+        pass
+
+
+class ProfileHud:
+    """The profiler's percentile table, drawn in the top right corner of the window."""
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.font = pygame.font.Font(None, 20)
+        self.image = None
+        self.rendered_at = 0.0
+
+    def draw(self, surface):
+        now = time.perf_counter()
+        if self.image is None or now - self.rendered_at >= HUD_INTERVAL:
+            self.image = self.render()
+            self.rendered_at = now
+        return surface.blit(self.image, self.image.get_rect(topright=(surface.get_width() - 5, 5)))
+
+    def render(self):
+        rows = [[self.font.render(cell, True, HUD_TEXT) for cell in row] for row in self.profiler.table()]
+        widths = [max(row[i].get_width() for row in rows) + 10 for i in range(len(rows[0]))]
+        line_height = self.font.get_linesize()
+        # Opaque, so scenes that only redraw what changed can draw it again over itself
+        image = pygame.Surface((sum(widths) + 2, len(rows) * line_height + 8))
+        image.fill(HUD_COLOR)
+        for y, row in enumerate(rows):
+            x = 6
+            for text, width in zip(row, widths):
+                image.blit(text, (x, 4 + y * line_height))
+                x += width
+        return image
+
+
+class SceneManager:
+    """Runs one scene at a time out of scenes, a dict of name -> Scene factory.
+
+    switch_keys maps keys to scene names; pressing one in any scene switches
+    to that scene. A new scene object is made on every switch, so nothing
+    from an earlier visit is kept except shared assets.
+    """
+
+    def __init__(self, scenes, switch_keys=None):
+        self.created_at = time.perf_counter()
+        pygame.init()
+        self.scenes = scenes
+        self.switch_keys = switch_keys or {}
+        self.screen = None
+        self.clock = pygame.time.Clock()
+        self.assets = AssetCache()
+        self.scene = None
+        self.scene_name = None
+        self.next_scene = None
+        self.running = False
+        self.displayed_at = None  # time.perf_counter() when the last frame was pushed to the display
+        self.startup = {}  # scene name -> timings of its latest start, see _enter
+        self.starting = None  # the startup entry still waiting for its first frame
+        self.report_startup = "--startup" in sys.argv
+        self.profiler = PROFILER
+        self.hud = ProfileHud(self.profiler)
+        self.show_profile = "--profile" in sys.argv
+        self.trace_path = sys.argv[sys.argv.index("--trace") + 1] if "--trace" in sys.argv[:-1] else None
+        if self.show_profile or self.trace_path:
+            self.profiler.start(trace=self.trace_path is not None)
+
+    def switch(self, name):
+        """Switch to the named scene before the next frame."""
+        self.next_scene = name
+
+    def quit(self):
+        self.running = False
+
+    def toggle_profile(self):
+        """Show or hide the profiler HUD, timing frames only while it's shown (or tracing)."""
+        self.show_profile = not self.show_profile
+        if self.show_profile:
+            self.profiler.reset()
+            self.profiler.start()
+        else:
+            if not self.profiler.tracing:
+                self.profiler.stop()
+            # Scenes that only redraw what changed need to paint over the HUD
+            pygame.event.post(pygame.event.Event(pygame.WINDOWEXPOSED))
+
+    def _enter(self, name):
+        started_at = time.perf_counter() if self.startup else self.created_at
+        self._exit()
+        scene = self.scenes[name]()
+        if self.screen is None or self.screen.get_size() != tuple(scene.size):
+            self.screen = pygame.display.set_mode(scene.size)
+            backgrounds.clear()
+        pygame.display.set_caption(scene.caption)
+        self.assets.scope = name
+        self.profiler.reset()
+        self.profiler.mark(f"enter {name}")
+        loads, load_time = self.assets.loads, self.assets.load_time
+        entered_at = time.perf_counter()
+        scene.enter(self)
+        self.scene, self.scene_name = scene, name
+        # Seconds from started_at; first_frame is filled in by _show
+        self.starting = self.startup[name] = {
+            "scene": scene.caption or name,
+            "enter": time.perf_counter() - entered_at,
+            "assets": self.assets.load_time - load_time,
+            "loads": self.assets.loads - loads,
+            "first_frame": None,
+            "started_at": started_at,
+        }
+        if scene.wait_for_events:
+            # Otherwise nothing would be drawn until the first event
+            scene.draw(self.screen)
+            self._show(None)
+        self.clock.tick()  # the switch itself doesn't count as frame time
+
+    def _show(self, rects):
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+        else:
+            return
+        self.displayed_at = time.perf_counter()
+        if self.starting is not None:
+            self.starting["first_frame"] = self.displayed_at - self.starting["started_at"]
+            if self.report_startup:
+                print(startup_report(self.starting))
+            self.starting = None
+
+    def _exit(self):
+        if self.scene is not None:
+            self.scene.exit()
+            self.assets.release(self.scene_name)
+            self.scene = self.scene_name = None
+
+    def run(self, name):
+        self.next_scene = name
+        self.running = True
+        try:
+            while self.running:
+                if self.next_scene is not None:
+                    self._enter(self.next_scene)
+                    self.next_scene = None
+                scene = self.scene
+
+                if scene.wait_for_events:
+                    events = [pygame.event.wait()]
+                    dt = self.clock.tick() / 1000
+                else:
+                    dt = self.clock.tick(scene.fps) / 1000
+                    events = []
+
+                profiler = self.profiler
+                profiler.begin_frame()  # the wait for the frame or event doesn't count
+                with profiler.scope("events"):
+                    events += pygame.event.get()
+                    for event in events:
+                        if event.type == pygame.QUIT:
+                            self.running = False
+                        elif event.type == pygame.KEYDOWN and event.key in self.switch_keys:
+                            self.switch(self.switch_keys[event.key])
+                        elif event.type == pygame.KEYDOWN and event.key == PROFILE_KEY:
+                            self.toggle_profile()
+                        elif event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                            backgrounds.clear()
+                if not self.running or self.next_scene is not None:
+                    continue
+
+                with profiler.scope("update"):
+                    scene.update(dt, events)
+                if not self.running:
+                    break
+                with profiler.scope("render"):
+                    rects = scene.draw(self.screen)
+                if self.show_profile:
+                    hud_rect = self.hud.draw(self.screen)
+                    if rects is not None:
+                        rects = rects + [hud_rect]
+                with profiler.scope("flip"):
+                    self._show(rects)
+                profiler.end_frame()
+        finally:
+            self._exit()
+            pygame.quit()
+            if self.trace_path:
+                self.profiler.save_trace(self.trace_path)
+                print(f"trace written to {self.trace_path}")
+
+
+def startup_report(startup):
+    return (f"{startup['scene']}: first frame after {startup['first_frame'] * 1000:.1f} ms "
+            f"(enter {startup['enter'] * 1000:.1f} ms, "
+            f"{startup['loads']} assets loaded in {startup['assets'] * 1000:.1f} ms)")
+
+
+def run_scene(factory):
+    """Run a single scene in its own window until it quits, then exit."""
+    SceneManager({"main": factory}).run("main")
+    sys.exit()
@@ -0,0 +1,240 @@
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+
+# Headless terrain generation used by fractals.py.
+
+MAX_LEVELS = 16  # 2**16 + 1 samples per chunk at most, even for roughness >= 1
+EDGE_JITTER = 50  # chunk edges land within ground +/- this many pixels
+
+
+def displacement_levels(max_displacement, roughness):
+    """Number of midpoint passes the recursive version makes.
+
+    It keeps subdividing while the next displacement is still above 1 pixel.
+    """
+    levels = 1
+    displacement = max_displacement
+    while displacement * roughness > 1 and levels < MAX_LEVELS:
+        displacement *= roughness
+        levels += 1
+    return levels
+
+
+def midpoint_displacement(start_y, end_y, ground, roughness=0.5, max_displacement=200, rng=None):
+    """Return 2**levels + 1 evenly spaced heights from start_y to end_y.
+
+    Each pass fills every midpoint of the current level at once: the average
+    of its two neighbours plus a uniform offset in [-displacement,
+    displacement], clamped to ground +/- max_displacement. The displacement
+    shrinks by roughness per pass. Pass a numpy Generator as rng to make the
+    result reproducible.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    levels = displacement_levels(max_displacement, roughness)
+    size = 2 ** levels + 1
+    heights = np.empty(size)
+    heights[0] = start_y
+    heights[-1] = end_y
+
+    low = ground - max_displacement
+    high = ground + max_displacement
+    step = size - 1
+    displacement = max_displacement
+    for _ in range(levels):
+        half = step // 2
+        left = heights[0:size - 1:step]
+        right = heights[step::step]
+        mids = (left + right) / 2 + rng.uniform(-displacement, displacement, len(left))
+        heights[half::step] = np.clip(mids, low, high)
+        step = half
+        displacement *= roughness
+    return heights
+
+
+class TerrainWorld:
+    """Terrain as a pure function of (world seed, chunk index).
+
+    Chunk edges get their own seeded height, and chunk i runs from edge i to
+    edge i + 1, so neighbouring chunks always meet no matter which of them
+    is generated first. Chunks are kept in an LRU cache of cache_size
+    entries and, if store_dir is given, saved as .npy files that are loaded
+    back memory-mapped, so revisited regions are never regenerated.
+    """
+
+    def __init__(self, ground, seed=None, roughness=0.5, max_displacement=200,
+                 cache_size=64, store_dir=None):
+        if seed is None:
+            seed = int(np.random.SeedSequence().entropy % 2**32)
+        self.seed = seed
+        self.ground = ground
+        self.roughness = roughness
+        self.max_displacement = max_displacement
+        self.cache_size = cache_size
+        self.store_dir = store_dir
+        if store_dir:
+            os.makedirs(store_dir, exist_ok=True)
+
+        self.cache = OrderedDict()  # chunk index -> heights, least recent first
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _rng(self, index, stream):
+        # SeedSequence needs non-negative entropy, so the sign goes in separately
+        return np.random.default_rng([self.seed, stream, abs(index), index < 0])
+
+    def edge_height(self, index):
+        return self.ground + self._rng(index, 0).integers(-EDGE_JITTER, EDGE_JITTER + 1)
+
+    def generate(self, index):
+        """Heights of chunk index, computed from scratch."""
+        return midpoint_displacement(self.edge_height(index), self.edge_height(index + 1), self.ground,
+                                     self.roughness, self.max_displacement, self._rng(index, 1))
+
+    def _store_path(self, index):
+        name = f"{self.seed}-{self.ground}-{self.roughness}-{self.max_displacement}-{index}.npy"
+        return os.path.join(self.store_dir, name)
+
+    def chunk(self, index):
+        """Heights of chunk index from memory, disk or the generator, in that order."""
+        with self._lock:
+            heights = self.cache.get(index)
+            if heights is not None:
+                self.cache.move_to_end(index)
+                self.hits += 1
+                return heights
+
+            path = self.store_dir and self._store_path(index)
+            if path and os.path.exists(path):
+                heights = np.load(path, mmap_mode="r")
+                self.disk_hits += 1
+            else:
+                heights = self.generate(index)
+                self.misses += 1
+                if path:
+                    # Write then rename so a crash never leaves a half-written chunk
+                    with open(path + ".tmp", "wb") as f:
+                        np.save(f, heights)
+                    os.replace(path + ".tmp", path)
+
+            self.cache[index] = heights
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            return heights
+
+
+class ChunkStreamer:
+    """Loads terrain chunks around the player on a worker thread.
+
+    Chunk i covers x in [i * chunk_width, (i + 1) * chunk_width]. update()
+    never blocks: it queues the chunks from retain_behind behind the player
+    to look_ahead ahead of it, picks up whatever the worker has finished and
+    forgets chunks outside that window (the world's cache still has them).
+    Loaded chunks are height arrays in self.chunks, keyed by chunk index.
+    """
+
+    def __init__(self, world, chunk_width, look_ahead=2, retain_behind=1):
+        self.world = world
+        self.chunk_width = chunk_width
+        self.look_ahead = look_ahead
+        self.retain_behind = retain_behind
+
+        self.chunks = {}
+        self.pending = set()  # queued for the worker but not collected yet
+        self.window = range(0)
+        self.stalls = 0  # times the game had to wait for the worker
+        self.load_times = deque(maxlen=100)  # seconds per chunk, last 100
+
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def _run(self):
+        while True:
+            index = self._requests.get()
+            if index is None:
+                return
+            t0 = time.perf_counter()
+            heights = self.world.chunk(index)
+            self._results.put((index, heights, time.perf_counter() - t0))
+
+    def chunk_index(self, x):
+        return int(x // self.chunk_width)
+
+    def _collect(self, block):
+        try:
+            while True:
+                index, heights, elapsed = self._results.get(block)
+                block = False
+                self.pending.discard(index)
+                self.load_times.append(elapsed)
+                if index in self.window:
+                    self.chunks[index] = heights
+        except queue.Empty:
+            pass
+
+    def update(self, x):
+        """Stream around x without waiting for the worker."""
+        current = self.chunk_index(x)
+        self.window = range(current - self.retain_behind, current + self.look_ahead + 1)
+        # The chunk under the player first, then ahead, then behind
+        wanted = [current] + list(range(current + 1, self.window.stop)) + list(range(self.window.start, current))
+        for index in wanted:
+            if index not in self.chunks and index not in self.pending:
+                self.pending.add(index)
+                self._requests.put(index)
+        self._collect(block=False)
+        for index in [i for i in self.chunks if i not in self.window]:
+            del self.chunks[index]
+
+    def require(self, index):
+        """Return chunk index, waiting for the worker only if it is still pending.
+
+        Returns None for chunks outside the current window.
+        """
+        if index in self.chunks or index not in self.pending:
+            return self.chunks.get(index)
+        self.stalls += 1
+        while index in self.pending:
+            self._collect(block=True)
+        return self.chunks.get(index)
+
+    def height_at(self, x, default=None):
+        """Ground height at x, or default if that chunk isn't loaded.
+
+        Samples are evenly spaced, so this is a direct index plus a linear
+        interpolation between the two samples around x.
+        """
+        index = self.chunk_index(x)
+        heights = self.chunks.get(index)
+        if heights is None:
+            return default
+        pos = (x - index * self.chunk_width) / self.chunk_width * (len(heights) - 1)
+        i = min(int(pos), len(heights) - 2)
+        return float(heights[i] + (pos - i) * (heights[i + 1] - heights[i]))
+
+    def heights_at(self, xs, default=np.nan):
+        """Vectorized height_at for an array of x positions (one pass per chunk touched)."""
+        xs = np.asarray(xs, dtype=float)
+        result = np.full(xs.shape, default, dtype=float)
+        indices = np.floor_divide(xs, self.chunk_width).astype(int)
+        for index in np.unique(indices):
+            heights = self.chunks.get(int(index))
+            if heights is None:
+                continue
+            mask = indices == index
+            pos = (xs[mask] - index * self.chunk_width) / self.chunk_width * (len(heights) - 1)
+            result[mask] = np.interp(pos, np.arange(len(heights)), heights)
+        return result
+
+    def close(self):
+        self._requests.put(None)
+        self._worker.join()
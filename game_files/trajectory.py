@@ -0,0 +1,256 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# Closed-form outcomes for calculus.py's projectile, which follows
+#   x(t) = x0 + vx * t
+#   y(t) = y0 + vy * t + g * t**2 / 2        (screen y grows downwards)
+# and flies until it comes back down to y0 or leaves the screen sideways.
+# Every function takes scalars or NumPy arrays of launch velocities, so a
+# batch of thousands of candidate launches costs about the same as one.
+
+BISECTIONS = 50  # halvings used to pin down the contact time
+SWEEP_BLOCK = 32768  # launches per block in sweep_launches()
+
+# closest_time/closest_distance: closest approach of the centres during the flight
+# ground_time: when y is back at y0 (0 if the shot starts downwards)
+# exit_time: when x leaves [0, width] (inf if vx == 0)
+# end_time: when the flight stops, min(ground_time, exit_time)
+# hit: whether the circles touch before end_time
+# hit_time: first time they touch (nan for misses)
+Outcome = namedtuple("Outcome", ["closest_time", "closest_distance", "ground_time", "exit_time",
+                                 "end_time", "hit", "hit_time"])
+
+
+def ground_time(vy, g):
+    return np.maximum(-2 * vy / g, 0)
+
+
+def exit_time(vx, x0, width):
+    # The crossing of the edge the shot is heading for is the positive one
+    vx = np.asarray(vx)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.maximum((width - x0) / vx, -x0 / vx)
+
+
+def _squared_distance(t, vx, vy, dx, dy, g):
+    # dx, dy: start minus target
+    ex = dx + vx * t
+    ey = dy + vy * t + 0.5 * g * t * t
+    return ex * ex + ey * ey
+
+
+def _critical_times(vx, vy, dx, dy, g, end):
+    # The critical points of D(t) = |p(t) - target|^2 are the real roots of
+    #   (1/2) D'(t) = (g^2/2) t^3 + (3/2) g vy t^2 + (vx^2 + vy^2 + g dy) t + (vx dx + vy dy)
+    # Both closed forms are evaluated for every launch: Cardano's for one
+    # real root and the trigonometric one for three. That avoids masking
+    # each launch into one case. The values that aren't roots are still
+    # times, and once clipped into [0, end] they neither change the minimum of
+    # D nor break the monotonic stretches between breakpoints, so all four are
+    # returned.
+    b = 3 * vy / g
+    c = (vx * vx + vy * vy + g * dy) * (2 / (g * g))
+    d = (vx * dx + vy * dy) * (2 / (g * g))
+    shift = b / 3
+    p = c - b * shift
+    q = (2 * shift * shift - c) * shift + d
+    third = p / 3
+    disc = q * q / 4 + third * third * third  # x**3 goes through the slow pow()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(np.maximum(disc, 0))
+        times = [np.cbrt(-q / 2 + root) + np.cbrt(-q / 2 - root)]
+        radius = np.sqrt(np.maximum(-third, 0))
+        phi = np.arccos(np.clip(-q / (2 * radius * radius * radius), -1, 1)) / 3
+        for k in range(3):
+            times.append(2 * radius * np.cos(phi - 2 * math.pi * k / 3))
+    # fmax/fmin also turn the nan from a degenerate case into 0
+    return [np.fmin(np.fmax(t - shift, 0), end) for t in times]
+
+
+def solve_launches(vx, vy, start, target, radius, g, width):
+    """Outcome of launching from start with velocity (vx, vy), for scalars or arrays.
+
+    radius is the sum of the projectile and target radii. The closest
+    approach comes from the roots of the cubic d/dt |p(t) - target|^2 = 0,
+    and the contact time from bisecting the quartic |p(t) - target|^2 =
+    radius^2 on the one monotonic stretch where it crosses.
+    """
+    vx, vy = np.broadcast_arrays(np.asarray(vx, dtype=float), np.asarray(vy, dtype=float))
+    dx = start[0] - target[0]
+    dy = start[1] - target[1]
+    ground = ground_time(vy, g)
+    leave = exit_time(vx, start[0], width)
+    end = np.minimum(ground, leave)
+
+    critical = _critical_times(vx, vy, dx, dy, g, end)
+    # D is monotonic between critical points, so its minimum over the flight
+    # is at the start, the end or one of them
+    closest_time = np.zeros(end.shape)
+    closest = np.full(end.shape, float(dx * dx + dy * dy))
+    for t in [end] + critical:
+        squared = _squared_distance(t, vx, vy, dx, dy, g)
+        closer = squared < closest
+        closest = np.where(closer, squared, closest)
+        closest_time = np.where(closer, t, closest_time)
+    closest_distance = np.sqrt(closest)
+
+    limit = radius * radius
+    hit = closest_distance <= radius
+    hit_time = np.full(end.shape, np.nan)
+    if hit.any():
+        # D is monotonic between sorted breakpoints, so the crossing lies just
+        # before the first breakpoint inside the target
+        hit_breaks = np.stack([np.zeros(end.shape)] + critical + [end], axis=-1)[hit]
+        hit_breaks.sort(axis=-1)
+        hvx, hvy = vx[hit], vy[hit]
+        squared = _squared_distance(hit_breaks, hvx[:, None], hvy[:, None], dx, dy, g)
+        inside = np.argmax(squared <= limit, axis=-1)
+        rows = np.arange(len(inside))
+        high = hit_breaks[rows, inside]
+        low = hit_breaks[rows, np.maximum(inside - 1, 0)]
+        for _ in range(BISECTIONS):
+            mid = (low + high) / 2
+            outside = _squared_distance(mid, hvx, hvy, dx, dy, g) > limit
+            low = np.where(outside, mid, low)
+            high = np.where(outside, high, mid)
+        hit_time[hit] = np.where(inside == 0, hit_breaks[rows, 0], high)
+
+    return Outcome(closest_time, closest_distance, ground, leave, end, hit, hit_time)
+
+
+def solve_launch(vx, vy, start, target, radius, g, width):
+    """solve_launches() for one launch, with plain Python numbers in the Outcome."""
+    outcome = solve_launches(vx, vy, start, target, radius, g, width)
+    return Outcome(*(value.item() for value in outcome))
+
+
+def _closest_squared(vx, vy, shift, d, c, end, dx, dy, g):
+    # min over [0, end] of D(t) for a block of launches, with the cubic's
+    # coefficients already built from per-angle and per-power factors (see
+    # _critical_times for the closed forms). Most launches have one real
+    # critical point, from Cardano's formula. Only the few with three (about
+    # one in seven in the heatmap) also get the trigonometric roots, and of
+    # those just the largest and smallest: the middle one is a maximum.
+    shift_squared = shift * shift
+    p = c - 3 * shift_squared
+    q = (2 * shift_squared - c) * shift + d
+    third = p / 3
+    half_q = -0.5 * q
+    disc = half_q * half_q + third * third * third
+    closest = _squared_distance_fast(end, vx, vy, dx, dy, g)
+    np.minimum(closest, dx * dx + dy * dy, out=closest)  # t = 0
+    with np.errstate(invalid="ignore"):
+        root = np.sqrt(disc)  # nan where there are three roots; those are redone below
+    t = np.cbrt(half_q + root)
+    t += np.cbrt(half_q - root)
+    np.fmin(closest, _squared_distance_fast(_clip_time(t, shift, end), vx, vy, dx, dy, g), out=closest)
+
+    three = np.flatnonzero(disc < 0)
+    if len(three):
+        vx, vy, shift, end = vx.ravel()[three], vy.ravel()[three], shift.ravel()[three], end.ravel()[three]
+        radius = np.sqrt(-third.ravel()[three])
+        phi = np.arccos(np.clip(half_q.ravel()[three] / (radius * radius * radius), -1, 1)) / 3
+        radius *= 2
+        nearest = closest.ravel()[three]
+        for t in (radius * np.cos(phi), radius * np.cos(phi - 4 * math.pi / 3)):
+            np.minimum(nearest, _squared_distance_fast(_clip_time(t, shift, end), vx, vy, dx, dy, g), out=nearest)
+        closest.ravel()[three] = nearest
+    return closest
+
+
+def _clip_time(t, shift, end):
+    t -= shift
+    np.maximum(t, 0, out=t)
+    return np.minimum(t, end, out=t)
+
+
+def _squared_distance_fast(t, vx, vy, dx, dy, g):
+    # _squared_distance(), with fewer temporaries
+    ex = vx * t
+    ex += dx
+    ey = t * (0.5 * g)
+    ey += vy
+    ey *= t
+    ey += dy
+    ex *= ex
+    ey *= ey
+    ex += ey
+    return ex
+
+
+def _weak_prefix(cos, sin, powers, start, target, reach, g, width):
+    # For every angle, how many of the (ascending) powers can't get within
+    # reach of the target: those whose flight stays left of target x - reach
+    # or whose apex stays below target y + reach. Both only get harder to
+    # meet as the power grows, so they cut off a prefix of each row.
+    x_room = target[0] - start[0] - reach  # furthest the shot may get to the right
+    y_room = start[1] - target[1] - reach  # highest its apex may get
+    rise = np.maximum(-2 * sin / g, 0)  # ground_time() / power
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # x reach is min(cos * rise * power**2, width - x0) for cos > 0
+        x_limit = np.where(cos * rise > 0, x_room / (cos * rise), np.inf)
+        x_limit = np.where((cos <= 0) | (width - start[0] <= x_room), np.inf, x_limit)
+        x_limit = np.where(x_room < 0, -1, x_limit)
+        # the apex is (sin * power)**2 / 2g above the start for sin < 0
+        y_limit = np.where(sin < 0, 2 * g * y_room / (sin * sin), np.inf)
+        y_limit = np.where(y_room < 0, -1, y_limit)
+    limit = np.maximum(x_limit, y_limit)  # on power squared
+    return np.searchsorted(powers * powers, limit, side="right")
+
+
+def sweep_launches(angles, powers, start, target, radius, g, width, dtype=np.float32, max_gap=None):
+    """Gap left between projectile and target for every angle x power launch.
+
+    angles are in degrees and become velocities the way calculus.py turns a
+    drag into one, (power * cos(angle), power * sin(angle)). Returns a
+    (len(angles), len(powers)) array of closest-approach distance minus
+    radius, 0 where the shot hits. Only the minimum of D is needed here,
+    so this skips the times and contact and runs in float32 by default.
+
+    With max_gap, gaps of max_gap or more may come back as max_gap: when
+    the powers are ascending, the weak launches that provably end up that
+    far away are skipped instead of solved.
+    """
+    theta = np.radians(np.asarray(angles, dtype=float))
+    cos, sin = np.cos(theta), np.sin(theta)
+    powers = np.asarray(powers, dtype=float)
+    dx = start[0] - target[0]
+    dy = start[1] - target[1]
+    if max_gap is not None and np.all(np.diff(powers) >= 0):
+        skip = _weak_prefix(cos, sin, powers, start, target, max_gap + radius, g, width)
+    else:
+        skip = np.zeros(len(theta), dtype=int)
+    # Everything that depends on the angle or the power alone is worked out
+    # once here; a block then only needs one product per factor
+    with np.errstate(divide="ignore"):
+        exit_factor = np.where(cos > 0, width - start[0], start[0]) / np.abs(cos)  # exit_time() * power
+        inverse_powers = 1 / powers
+    ground_factor = np.maximum(-2 * sin / g, 0)  # ground_time() / power
+    shift_factor = sin / g  # the cubic's b / 3, over power
+    d_factor = (cos * dx + sin * dy) * (2 / (g * g))  # its d, over power
+    c = (powers * powers + g * dy) * (2 / (g * g))  # its c, the same for every angle
+    cos, sin, exit_factor, ground_factor, shift_factor, d_factor = (
+        value.astype(dtype) for value in (cos, sin, exit_factor, ground_factor, shift_factor, d_factor))
+    powers, inverse_powers, c = powers.astype(dtype), inverse_powers.astype(dtype), c.astype(dtype)
+    dx, dy = dtype(dx), dtype(dy)
+
+    gaps = np.full((len(theta), len(powers)), np.inf if max_gap is None else max_gap, dtype=dtype)
+    # A few rows at a time, so the temporaries stay in the CPU cache
+    rows = max(1, SWEEP_BLOCK // max(len(powers), 1))
+    for first in range(0, len(theta), rows):
+        block = slice(first, first + rows)
+        k = int(skip[block].min())  # the rows in a block are neighbours, so their prefixes are close
+        if k == len(powers):
+            continue
+        p = powers[k:]
+        vx = cos[block, None] * p
+        vy = sin[block, None] * p
+        end = np.minimum(ground_factor[block, None] * p, exit_factor[block, None] * inverse_powers[k:])
+        closest = _closest_squared(vx, vy, shift_factor[block, None] * p, d_factor[block, None] * p, c[k:],
+                                   end, dx, dy, g)
+        np.sqrt(closest, out=closest)
+        closest -= radius
+        gaps[block, k:] = np.maximum(closest, 0)
+    return gaps
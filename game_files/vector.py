@@ -1,15 +1,13 @@
 import pygame
 import sys
-import math
 import random
+from vector_sim import (VectorSim, Inputs, STEP, WIDTH, HEIGHT, PLAYER_RADIUS, BULLET_RADIUS,
+                        TARGET_RADIUS, save_recording)
+from particles import blit_sprites, circle_sprite
+from scenes import Scene, run_scene
 
-# Initialize Pygame
-pygame.init()
-
-# Screen setup
-WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Vector Shooting Game with Targets")
+# The game itself lives in vector_sim.py; this file reads input, steps the
+# simulation at a fixed rate and draws it.
 
 # Colors
 WHITE = (255, 255, 255)
@@ -19,126 +17,116 @@ GREEN = (0, 255, 0)
 GRAY = (100, 100, 100)
 BLUE = (0, 0, 255)
 
-# Clock
-clock = pygame.time.Clock()
 FPS = 60
+MAX_FRAME_TIME = 0.25  # after a stall, don't try to catch up more than this
+
+# Stress mode (python vector.py --stress): thousands of targets and auto-fire
+STRESS_TARGETS = 2000
+STRESS_BULLETS_PER_FRAME = 20
+
+
+class VectorScene(Scene):
+    size = (WIDTH, HEIGHT)
+    caption = "Vector Shooting Game with Targets"
+    fps = FPS
+
+    def __init__(self, stress=False, seed=None, record_path=None):
+        self.stress = stress
+        self.seed = random.randrange(2**32) if seed is None else seed
+        self.record_path = record_path  # save every step's input here so vector_sim.py can replay the run
+
+    def enter(self, manager):
+        super().enter(manager)
+        if self.stress:
+            self.sim = VectorSim(self.seed, max_targets=STRESS_TARGETS, fill_targets=True,
+                                 auto_fire=STRESS_BULLETS_PER_FRAME)
+        else:
+            self.sim = VectorSim(self.seed)
+        self.recorded = []
+
+        # Bullets and targets are drawn from pre-rendered sprites in one blits call each
+        self.bullet_sprite = circle_sprite(BULLET_RADIUS, RED)
+        self.target_sprite = circle_sprite(TARGET_RADIUS, GREEN)
+
+        # Score
+        self.font = manager.assets.font(None, 36)
+        self.small_font = manager.assets.font(None, 24)
+
+        self.accumulator = 0.0
+        self.pending_shots = []  # clicks wait here until the next simulation step
 
-# Player setup
-player_pos = pygame.Vector2(WIDTH // 2, HEIGHT // 2)
-player_speed = 5
-player_radius = 15
-
-# Bullets list
-bullets = []
-bullet_speed = 10
-bullet_radius = 5
-
-# Targets setup
-targets = []
-target_radius = 20
-target_spawn_time = 2000  # milliseconds
-last_spawn_time = pygame.time.get_ticks()
-
-# Score
-score = 0
-font = pygame.font.SysFont(None, 36)
-small_font = pygame.font.SysFont(None, 24)
-
-# Math data
-latest_direction = pygame.Vector2(0, 0)
-latest_distance = None
-
-# Game loop
-running = True
-while running:
-    clock.tick(FPS)
-    screen.fill(BLACK)
-
-    # Event handling
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    def update(self, dt, events):
+        self.accumulator += min(dt, MAX_FRAME_TIME)
 
         # Shoot bullet on mouse click
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
-            latest_direction = (mouse_pos - player_pos).normalize()
-            bullets.append([player_pos.copy(), latest_direction])
-
-    # Player movement
-    keys = pygame.key.get_pressed()
-    move = pygame.Vector2(0, 0)
-    if keys[pygame.K_w]:
-        move.y -= 1
-    if keys[pygame.K_s]:
-        move.y += 1
-    if keys[pygame.K_a]:
-        move.x -= 1
-    if keys[pygame.K_d]:
-        move.x += 1
-    if move.length_squared() > 0:
-        move = move.normalize() * player_speed
-    player_pos += move
-
-    # Spawn targets
-    current_time = pygame.time.get_ticks()
-    if current_time - last_spawn_time > target_spawn_time:
-        target_x = random.randint(target_radius, WIDTH - target_radius)
-        target_y = random.randint(target_radius, HEIGHT - target_radius)
-        targets.append(pygame.Vector2(target_x, target_y))
-        last_spawn_time = current_time
-
-    # Update and draw bullets
-    latest_distance = None
-    for bullet in bullets[:]:
-        bullet[0] += bullet[1] * bullet_speed
-
-        # Remove bullets out of screen
-        if bullet[0].x < 0 or bullet[0].x > WIDTH or bullet[0].y < 0 or bullet[0].y > HEIGHT:
-            bullets.remove(bullet)
-            continue
-
-        pygame.draw.circle(screen, RED, bullet[0], bullet_radius)
-
-        # Bullet-target collision
-        for target in targets[:]:
-            distance = bullet[0].distance_to(target)
-            if distance < bullet_radius + target_radius:
-                targets.remove(target)
-                bullets.remove(bullet)
-                score += 1
-                break
-            elif distance < 300:
-                if latest_distance is None or distance < latest_distance:
-                    latest_distance = distance
-
-    # Draw player
-    pygame.draw.circle(screen, WHITE, player_pos, player_radius)
-
-    # Draw shooting line to mouse position
-    mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
-    pygame.draw.line(screen, BLUE, player_pos, mouse_pos, 2)
-
-    # Draw targets
-    for target in targets:
-        pygame.draw.circle(screen, GREEN, target, target_radius)
-
-    # Draw score
-    score_text = font.render(f"Score: {score}", True, WHITE)
-    screen.blit(score_text, (10, 10))
-
-    # Display math values
-    pygame.draw.rect(screen, GRAY, (10, HEIGHT - 100, WIDTH - 20, 90))
-    math_texts = [
-        f"Movement Vector: ({move.x:.2f}, {move.y:.2f})",
-        f"Bullet Direction Vector: ({latest_direction.x:.2f}, {latest_direction.y:.2f})",
-        f"Last Bullet-Target Distance: {latest_distance:.2f}" if latest_distance is not None else "Last Bullet-Target Distance: N/A"
-    ]
-    for i, line in enumerate(math_texts):
-        text_surf = small_font.render(line, True, WHITE)
-        screen.blit(text_surf, (20, HEIGHT - 90 + i * 22))
-
-    pygame.display.flip()
-
-pygame.quit()
-sys.exit()
\ No newline at end of file
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.pending_shots.append(pygame.mouse.get_pos())
+
+        # Player movement
+        keys = pygame.key.get_pressed()
+        move = (keys[pygame.K_d] - keys[pygame.K_a], keys[pygame.K_s] - keys[pygame.K_w])
+
+        # Fixed-rate steps, however long the frame took
+        while self.accumulator >= STEP:
+            inputs = Inputs(move, tuple(self.pending_shots))
+            self.pending_shots = []
+            self.sim.step(inputs, STEP)
+            if self.record_path:
+                self.recorded.append(inputs)
+            self.accumulator -= STEP
+
+    def draw(self, screen):
+        sim = self.sim
+        screen.fill(BLACK)
+
+        # Draw bullets
+        blit_sprites(screen, self.bullet_sprite, sim.bullets.pos[sim.bullets.active()])
+
+        # Draw player
+        player_pos = sim.player_pos.tolist()
+        pygame.draw.circle(screen, WHITE, player_pos, PLAYER_RADIUS)
+
+        # Draw shooting line to mouse position
+        mouse_pos = pygame.Vector2(pygame.mouse.get_pos())
+        pygame.draw.line(screen, BLUE, player_pos, mouse_pos, 2)
+
+        # Draw targets
+        blit_sprites(screen, self.target_sprite, sim.targets.pos[sim.targets.active()])
+
+        # Draw score
+        score_text = self.font.render(f"Score: {sim.score}", True, WHITE)
+        screen.blit(score_text, (10, 10))
+
+        # Display math values
+        move_x, move_y = sim.move
+        direction_x, direction_y = sim.latest_direction
+        latest_distance = sim.latest_distance
+        pygame.draw.rect(screen, GRAY, (10, HEIGHT - 100, WIDTH - 20, 90))
+        math_texts = [
+            f"Movement Vector: ({move_x:.2f}, {move_y:.2f})",
+            f"Bullet Direction Vector: ({direction_x:.2f}, {direction_y:.2f})",
+            f"Last Bullet-Target Distance: {latest_distance:.2f}" if latest_distance is not None else "Last Bullet-Target Distance: N/A"
+        ]
+        for i, line in enumerate(math_texts):
+            text_surf = self.small_font.render(line, True, WHITE)
+            screen.blit(text_surf, (20, HEIGHT - 90 + i * 22))
+
+        if self.stress:
+            stress_text = self.small_font.render(
+                f"FPS: {self.manager.clock.get_fps():.0f}  Bullets: {len(sim.bullets)}  Targets: {len(sim.targets)}",
+                True, WHITE)
+            screen.blit(stress_text, (10, 45))
+
+    def exit(self):
+        if self.record_path:
+            save_recording(self.record_path, self.sim.settings(), self.recorded)
+
+
+if __name__ == "__main__":
+    # python vector.py --seed 5 --record run.jsonl
+    def arg_value(name):
+        return sys.argv[sys.argv.index(name) + 1] if name in sys.argv else None
+
+    seed = arg_value("--seed")
+    run_scene(lambda: VectorScene("--stress" in sys.argv, int(seed) if seed else None, arg_value("--record")))
\ No newline at end of file
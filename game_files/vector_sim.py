@@ -0,0 +1,183 @@
+import hashlib
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from entities import EntityPool, closest
+from profiler import scope
+
+# The game state of vector.py without pygame. It is advanced one fixed time
+# step at a time, so a recorded input stream can be replayed headless
+# and always ends in the same state.
+
+WIDTH, HEIGHT = 800, 600
+STEP = 1 / 60  # seconds per step, one frame of the original game
+PLAYER_SPEED = 300  # pixels per second (5 per frame)
+PLAYER_RADIUS = 15
+BULLET_SPEED = 600  # pixels per second (10 per frame)
+BULLET_RADIUS = 5
+TARGET_RADIUS = 20
+TARGET_SPAWN_TIME = 2.0  # seconds
+TARGET_CELL = 2 * TARGET_RADIUS  # see closest() in entities.py
+DISTANCE_RANGE = 300  # latest_distance only reports targets closer than this
+
+# One step of input: move is (x, y) with -1, 0 or 1 in each (from WASD) and
+# shots holds the mouse positions clicked since the previous step.
+Inputs = namedtuple("Inputs", ["move", "shots"], defaults=((0, 0), ()))
+
+
+class VectorSim:
+    def __init__(self, seed=None, max_targets=30, fill_targets=False, auto_fire=0):
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.max_targets = max_targets  # spawning pauses at this many
+        self.fill_targets = fill_targets  # top targets up to max_targets every step
+        self.auto_fire = auto_fire  # bullets fired in random directions every step
+
+        self.player_pos = np.array([WIDTH // 2, HEIGHT // 2], dtype=float)
+        self.bullets = EntityPool()
+        self.targets = EntityPool()
+        self.score = 0
+        self.time = 0.0
+        self.steps = 0
+        self.last_spawn_time = 0.0
+
+        # Values shown in the HUD
+        self.move = np.zeros(2)  # player displacement in the last step
+        self.latest_direction = np.zeros(2)
+        self.latest_distance = None
+
+    def settings(self):
+        """Keyword arguments that rebuild this simulation from the start."""
+        return {"seed": self.seed, "max_targets": self.max_targets,
+                "fill_targets": self.fill_targets, "auto_fire": self.auto_fire}
+
+    def spawn_target(self):
+        x = self.rng.randint(TARGET_RADIUS, WIDTH - TARGET_RADIUS)
+        y = self.rng.randint(TARGET_RADIUS, HEIGHT - TARGET_RADIUS)
+        self.targets.spawn((x, y))
+
+    def fire(self, direction):
+        self.bullets.spawn(self.player_pos, direction * BULLET_SPEED)
+
+    def step(self, inputs, dt=STEP):
+        for shot in inputs.shots:
+            aim = np.asarray(shot, dtype=float) - self.player_pos
+            length = math.hypot(aim[0], aim[1])
+            if length > 0:
+                self.latest_direction = aim / length
+                self.fire(self.latest_direction)
+
+        move = np.asarray(inputs.move, dtype=float)
+        length = math.hypot(move[0], move[1])
+        self.move = move / length * PLAYER_SPEED * dt if length > 0 else np.zeros(2)
+        self.player_pos += self.move
+
+        self.time += dt
+        if self.time - self.last_spawn_time > TARGET_SPAWN_TIME and len(self.targets) < self.max_targets:
+            self.spawn_target()
+            self.last_spawn_time = self.time
+        if self.fill_targets:
+            while len(self.targets) < self.max_targets:
+                self.spawn_target()
+        for _ in range(self.auto_fire):
+            angle = self.rng.uniform(0, 2 * math.pi)
+            self.fire(np.array([math.cos(angle), math.sin(angle)]))
+
+        # Move bullets and drop the ones that left the screen
+        bullets, targets = self.bullets, self.targets
+        bullets.integrate(dt)
+        bullets.cull(0, 0, WIDTH, HEIGHT)
+
+        # Nearest target of every bullet in one pass; closer than the two
+        # radii is a hit, and each target can only be hit once per step
+        with scope("collision"):
+            live_bullets = bullets.active()
+            live_targets = targets.active()
+            bullet_pos = bullets.pos[live_bullets]
+            target_pos = targets.pos[live_targets]
+            nearest, distances = closest(bullet_pos, target_pos, TARGET_CELL)
+            hits = distances < BULLET_RADIUS + TARGET_RADIUS
+            hit_targets, first_hits = np.unique(nearest[hits], return_index=True)
+            bullets.kill(live_bullets[hits][first_hits])
+            targets.kill(live_targets[hit_targets])
+            self.score += len(hit_targets)
+
+            # The cell search only sees targets within TARGET_CELL, so look at
+            # all of them if it found none
+            misses = distances[~hits]
+            if len(misses) and misses.min() > TARGET_CELL:
+                _, misses = closest(bullet_pos[~hits], target_pos)
+        if len(misses) and misses.min() < DISTANCE_RANGE:
+            self.latest_distance = float(misses.min())
+        else:
+            self.latest_distance = None
+        self.steps += 1
+
+    def digest(self):
+        """Short hash of the whole state, equal for equal runs."""
+        state = hashlib.sha1()
+        state.update(self.player_pos.tobytes())
+        state.update(self.bullets.pos[self.bullets.active()].tobytes())
+        state.update(self.targets.pos[self.targets.active()].tobytes())
+        state.update(f"{self.score} {self.steps}".encode())
+        return state.hexdigest()[:16]
+
+
+def save_recording(path, settings, inputs, dt=STEP):
+    """Write settings and one line per step of inputs as JSON lines."""
+    with open(path, "w") as f:
+        f.write(json.dumps(dict(settings, dt=dt)) + "\n")
+        for step in inputs:
+            f.write(json.dumps([list(step.move), [list(shot) for shot in step.shots]]) + "\n")
+
+
+def load_recording(path):
+    """Return (settings, dt, inputs) from a file written by save_recording()."""
+    with open(path) as f:
+        settings = json.loads(f.readline())
+        dt = settings.pop("dt")
+        inputs = [Inputs(tuple(move), tuple(tuple(shot) for shot in shots))
+                  for move, shots in map(json.loads, f)]
+    return settings, dt, inputs
+
+
+def replay(settings, inputs, dt=STEP):
+    """Run inputs through a fresh simulation; return it and the seconds each step took."""
+    sim = VectorSim(**settings)
+    step_times = []
+    for step in inputs:
+        t0 = time.perf_counter()
+        sim.step(step, dt)
+        step_times.append(time.perf_counter() - t0)
+    return sim, step_times
+
+
+def main(path):
+    settings, dt, inputs = load_recording(path)
+    t0 = time.perf_counter()
+    sim, step_times = replay(settings, inputs, dt)
+    elapsed = time.perf_counter() - t0
+    step_times.sort()
+    print(f"{len(inputs)} steps in {elapsed:.2f} s ({len(inputs) / elapsed:.0f} steps/s)")
+    if step_times:
+        print(f"step time: mean {statistics.mean(step_times) * 1000:.3f} ms  "
+              f"p50 {step_times[len(step_times) // 2] * 1000:.3f} ms  "
+              f"p99 {step_times[int(len(step_times) * 0.99)] * 1000:.3f} ms  "
+              f"max {step_times[-1] * 1000:.3f} ms")
+    print(f"score {sim.score}, state {sim.digest()}")
+
+
+if __name__ == "__main__":
+    # python vector_sim.py recording.jsonl (made with python vector.py --record recording.jsonl)
+    if len(sys.argv) != 2:
+        sys.exit("usage: python vector_sim.py recording.jsonl")
+    main(sys.argv[1])
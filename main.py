@@ -1,17 +1,53 @@
+import os
+import sys
+
 import streamlit as st
-import subprocess
+
+GAME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "game_files")
+sys.path.insert(0, GAME_DIR)
+
+from launcher import GameLauncher
 
 st.set_page_config(page_title="Pygame Games in Streamlit", layout="wide")
 
 st.title("🎮 Streamlit Game Hub")
 
-tabs = st.tabs(["Fractals", "Optimization and Pathfinding","Vectors",'Probability'])
+# One launcher for the whole server, so its pre-warmed template survives reruns
+@st.cache_resource
+def get_launcher():
+    return GameLauncher()
 
-game_files = ["fractals.py", "optimization.py","vector.py","crit_hit.py"]
+launcher = get_launcher()
+
+# (tab, script)
+games = [
+    ("Fractals", "fractals.py"),
+    ("Optimization and Pathfinding", "optimization.py"),
+    ("Vectors", "vector.py"),
+    ("Probability", "prob.py"),
+    ("Calculus", "calculus.py"),
+]
+
+tabs = st.tabs([name for name, _ in games])
 
 for i, tab in enumerate(tabs):
     with tab:
         st.subheader(f"Play Game {i+1}")
         if st.button(f"Launch Game {i+1}"):
-            subprocess.Popen(["python", game_files[i]])
-            st.info("Game is launching in a new window!")
+            _, script = games[i]
+            game = launcher.launch(os.path.join(GAME_DIR, script))
+            first_frame = launcher.wait_for_first_frame(game)
+            message = f"Game is launching in a new window! (pid {game.pid}, started in {game.launch_latency * 1000:.1f} ms"
+            if first_frame is not None:
+                message += f", first frame after {first_frame * 1000:.0f} ms"
+            st.info(message + ")")
+
+running = launcher.poll()
+if running:
+    st.subheader("Running games")
+    st.table([{
+        "game": os.path.basename(game.script),
+        "pid": game.pid,
+        "running for (s)": round(game.lifetime, 1),
+        "first frame (ms)": None if game.time_to_first_frame is None else round(game.time_to_first_frame * 1000),
+    } for game in running])